@@ -1,7 +1,12 @@
 #ifndef CANARY
 #define CANARY
 
+#include <fcntl.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/wait.h>
+#include <unistd.h>
 
 #define CANARY_STR_IMPL_(x) #x
 #define CANARY_STR(x) CANARY_STR_IMPL_(x)
@@ -147,13 +152,29 @@ char *PrimitivePlaceholder(int type) {
     return CANARY_PRIMITIVE_DEFAULT;
 }
 
+/* Whether a test is selected by CANARY_TEST_FILTER, a space separated list of
+   test names. Without the filter every test is selected. */
+static inline int CanaryTestSelected(const char *test) {
+    const char *filter = getenv("CANARY_TEST_FILTER");
+    if (filter == NULL) return 1;
+    size_t length = strlen(test);
+    while (*filter != '\0') {
+        const char *end = strchr(filter, ' ');
+        if (end == NULL) end = filter + strlen(filter);
+        if ((size_t) (end - filter) == length && strncmp(filter, test, length) == 0) return 1;
+        filter = *end == ' ' ? end + 1 : end;
+    }
+    return 0;
+}
+
+/* A test which is not selected returns before its act */
 #define CANARY_ACT(ACT) \
-    { printf("BeginTest=%s\n", __func__); } \
+    { if (!CanaryTestSelected(__func__)) return; printf("BeginTest=%s\n", __func__); } \
     ACT; \
     do { printf("EndTest=%s\n", __func__); } while(0)
 
 #define CANARY_TWEET_LOCATION(l)\
-do { printf("Location="CANARY_STR(l)"\n"); } while(0)
+do { CanarySplit(l); printf("Location="CANARY_STR(l)"\n"); } while(0)
 
 #define CANARY_TWEET_BEGIN_UNIT(UNIT)\
 do { printf("BeginUnit="CANARY_STR(UNIT)"\n"); } while(0)
@@ -170,6 +191,105 @@ do {                                                            \
     printf("\n");                                               \
 } while(0)
 
+/* The active mutant of a mutant schemata, read once from CANARY_MUTANT_ID where 0
+   selects the original program. Weak such that every translation unit shares it. */
+__attribute__((weak)) long canary_mutant_id__ = -1;
+
+static inline long CanaryMutantId(void) {
+    if (canary_mutant_id__ < 0) {
+        const char *id = getenv("CANARY_MUTANT_ID");
+        canary_mutant_id__ = id == NULL ? 0 : atol(id);
+    }
+    return canary_mutant_id__;
+}
+
+#define CANARY_MUTANT(ID) (CanaryMutantId() == (ID))
+
+/* Weak mutation: tweets the first time a mutant changes the value of the
+   expression it mutates, which is evaluated side by side with the original */
+#define CANARY_MAX_INFECTIONS 65536
+
+static inline int CanaryInfected(long mutant) {
+    static char infected[CANARY_MAX_INFECTIONS];
+    if (mutant >= 0 && mutant < CANARY_MAX_INFECTIONS) {
+        if (infected[mutant]) return 0;
+        infected[mutant] = 1;
+    }
+    printf("Infected=%ld\n", mutant);
+    return 0;
+}
+
+#define CANARY_INFECTION(ID, MUTANT, ORIGINAL) \
+    ((MUTANT) != (ORIGINAL) ? CanaryInfected(ID) : 0)
+
+/* Fork server: when CANARY_FORK_SERVER holds a control and a status descriptor the
+   binary stops before main. For every "<mutant> <output>" line read from the control
+   descriptor a child is forked, which returns into main with the mutant selected and
+   its output redirected. The server reports "<mutant> started <pid>" and
+   "<mutant> exited <status>" on the status descriptor. */
+static void CanaryServe(int control_fd, int status_fd) {
+    FILE *control = fdopen(control_fd, "r");
+    if (control == NULL) return;
+    /* Output buffered before serving would be written by every child */
+    fflush(stdout);
+    dprintf(status_fd, "ready\n");
+
+    long mutant;
+    char output[4096];
+    while (fscanf(control, "%ld %4095[^\n]", &mutant, output) == 2) {
+        pid_t child = fork();
+        if (child < 0) break;
+        if (child == 0) {
+            int out = open(output, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+            if (out >= 0) {
+                dup2(out, STDOUT_FILENO);
+                dup2(out, STDERR_FILENO);
+                close(out);
+            }
+            close(control_fd);
+            close(status_fd);
+            canary_mutant_id__ = mutant;
+            return;
+        }
+        dprintf(status_fd, "%ld started %d\n", mutant, (int) child);
+        int status = 0;
+        waitpid(child, &status, 0);
+        dprintf(status_fd, "%ld exited %d\n", mutant, status);
+    }
+    _exit(0);
+}
+
+/* Split-stream: when CANARY_SPLIT_LOCATION is set as well, the binary runs the
+   original program until the location is first reached, and serves from there.
+   Weak such that every translation unit shares them. */
+__attribute__((weak)) long canary_split_location__ = -1;
+__attribute__((weak)) int canary_split_control__ = -1;
+__attribute__((weak)) int canary_split_status__ = -1;
+
+static inline void CanarySplit(long location) {
+    if (location != canary_split_location__) return;
+    /* Only the first visit splits, the children continue unhindered */
+    canary_split_location__ = -1;
+    CanaryServe(canary_split_control__, canary_split_status__);
+}
+
+__attribute__((constructor)) static void CanaryForkServer(void) {
+    const char *fds = getenv("CANARY_FORK_SERVER");
+    int control_fd, status_fd;
+    if (fds == NULL || sscanf(fds, "%d %d", &control_fd, &status_fd) != 2) return;
+    /* Only the first translation unit including this header serves */
+    unsetenv("CANARY_FORK_SERVER");
+
+    const char *location = getenv("CANARY_SPLIT_LOCATION");
+    if (location != NULL) {
+        canary_split_location__ = atol(location);
+        canary_split_control__ = control_fd;
+        canary_split_status__ = status_fd;
+        return;
+    }
+    CanaryServe(control_fd, status_fd);
+}
+
 #define CANARY_TWEET_ERROR_STATE() \
 do { printf("ERROR STATE\n"); } while (0)
 #endif
\ No newline at end of file
@@ -79,7 +79,7 @@ void RunAllTests(void) {
 	// CuSuiteAddSuite(suite, CuTestSuite());
 	CuSuiteAddSuite(suite, CanarySuites());
 
-	CuSuiteRun(suite);
+	CanarySuiteRun(suite);
 	CuSuiteSummary(suite, output);
 	CuSuiteDetails(suite, output);
 	printf("%s\n", output->buffer);
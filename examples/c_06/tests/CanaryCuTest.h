@@ -1,10 +1,54 @@
 #ifndef CANARY_CUTEST
 #define CANARY_CUTEST
 
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
 #include "CuTest.h"
 
 CuSuite *CanarySuites() {
     CuSuite *suite = CuSuiteNew();
     return suite;
 }
+
+/* Ends the tests after the first failed test if CANARY_EARLY_ABORT is set,
+   the failed test is reported by a "Killed=<test>" line. */
+static void CanaryAbortOnFailure(CuTest *testCase) {
+    if (!testCase->failed || getenv("CANARY_EARLY_ABORT") == NULL) return;
+    printf("Killed=%s\n", testCase->name);
+    fflush(stdout);
+    exit(EXIT_FAILURE);
+}
+
+/* Runs the tests of a suite like CuSuiteRun, except that the tests named in
+   CANARY_TEST_ORDER, a space separated list of test names, run first and in
+   that order. The remaining tests run afterwards in the order of the suite. */
+void CanarySuiteRun(CuSuite *testSuite) {
+    int i;
+    int *ran = (int *) calloc(testSuite->count, sizeof(int));
+    const char *order = getenv("CANARY_TEST_ORDER");
+    while (order != NULL && *order != '\0') {
+        const char *end = strchr(order, ' ');
+        if (end == NULL) end = order + strlen(order);
+        for (i = 0 ; i < testSuite->count ; ++i) {
+            CuTest *testCase = testSuite->list[i];
+            if (ran[i] || strlen(testCase->name) != (size_t) (end - order) ||
+                strncmp(testCase->name, order, end - order) != 0) continue;
+            CuTestRun(testCase);
+            if (testCase->failed) { testSuite->failCount += 1; }
+            CanaryAbortOnFailure(testCase);
+            ran[i] = 1;
+        }
+        order = *end == ' ' ? end + 1 : end;
+    }
+    for (i = 0 ; i < testSuite->count ; ++i) {
+        CuTest *testCase = testSuite->list[i];
+        if (ran[i]) continue;
+        CuTestRun(testCase);
+        if (testCase->failed) { testSuite->failCount += 1; }
+        CanaryAbortOnFailure(testCase);
+    }
+    free(ran);
+}
 #endif
\ No newline at end of file
@@ -5,7 +5,8 @@ from utilities import (
 from commands import (
     generate_tests,
     create_cfg,
-    mutation_analysis
+    mutation_analysis,
+    worker,
 )
 
 def main():
@@ -31,6 +32,42 @@ def main():
             args.mutation_strategy,
             args.unit_whitelist,
             args.unit_blacklist,
+            args.jobs,
+            args.schemata,
+            args.fork_server,
+            args.object_cache,
+            args.object_cache_size,
+            args.early_abort,
+            args.timeout_multiplier,
+            args.timeout_floor,
+            args.baseline_timeout,
+            args.max_trace_length,
+            args.keep_test_output,
+            args.tce,
+            args.tce_flags,
+            args.result_cache,
+            args.resume,
+            args.test_selection,
+            args.prioritise,
+            args.workspace,
+            args.coordinator,
+            args.lease_timeout,
+            args.async_subprocesses,
+            args.weak_mutation,
+            args.sample_margin,
+            args.sample_confidence,
+            args.sample_budget,
+            args.sample_uniform,
+            args.sample_seed,
+            args.pipeline,
+        )
+    elif args.action == "worker":
+        worker(
+            args.coordinator,
+            args.base,
+            args.testing_backend,
+            args.jobs,
+            args.connect_timeout,
         )
 
 if __name__ == "__main__":
@@ -14,4 +14,7 @@ from .parse_file import *
 from .unit_analyse_tree import *
 from .mutate_along_all_traces import *
 from .mutate_randomly import *
-from .mutate_all_candidates import *
\ No newline at end of file
+from .mutate_all_candidates import *
+from .run_mutant_job import *
+from .check_infection import *
+from .mutate_sampled import *
\ No newline at end of file
@@ -0,0 +1,99 @@
+import subprocess
+from typing import Dict
+from execution import Sandbox
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+from .run_subprocess import RunSubsystemRequest, RunSubsystemUseCase
+
+class BuildMutantSchemataRequest(UseCaseRequest):
+    def __init__(
+        self,
+        source: str,
+        file_path: str,
+        build_command: str,
+        sandbox: Sandbox = None,
+        env: Dict[str, str] = None,
+        timeout: float = None,
+    ) -> None:
+        self._source = source
+        self._file_path = file_path
+        self._build_command = build_command
+        self._sandbox = sandbox
+        self._env = env
+        self._timeout = timeout
+        super().__init__()
+
+    @property
+    def source(self) -> str:
+        """The source of the meta-mutant containing every mutant"""
+        return self._source
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def build_command(self) -> str:
+        return self._build_command
+
+    @property
+    def sandbox(self) -> Sandbox:
+        return self._sandbox
+
+    @property
+    def env(self) -> Dict[str, str]:
+        return self._env
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+class BuildMutantSchemataResponse(UseCaseResponse):
+    def __init__(self, built: bool, timed_out: bool = False) -> None:
+        self._built = built
+        self._timed_out = timed_out
+        super().__init__()
+
+    @property
+    def built(self) -> bool:
+        """Whether the build succeeded, if not then the mutants must be built on their own"""
+        return self._built
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the build did not succeed as it exceeded its timeout"""
+        return self._timed_out
+
+class BuildMutantSchemataUseCase(
+    UseCase[BuildMutantSchemataRequest, BuildMutantSchemataResponse]
+):
+    def do(self, request: BuildMutantSchemataRequest) -> BuildMutantSchemataResponse:
+        # Step 1: Write the mutant schemata to file
+        build_command = request.build_command
+        cwd = None
+        if request.sandbox is None:
+            file = open(request.file_path, "w")
+            file.write(request.source)
+            file.close()
+        else:
+            request.sandbox.write(request.file_path, request.source)
+            build_command = request.sandbox.command(build_command)
+            cwd = request.sandbox.cwd
+
+        if build_command is None:
+            return BuildMutantSchemataResponse(True)
+
+        # Step 2: Build the project once for all of the mutants
+        try:
+            build_response = RunSubsystemUseCase().do(
+                RunSubsystemRequest(
+                    build_command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=cwd,
+                    env=request.env,
+                    timeout=request.timeout,
+                )
+            )
+        except subprocess.TimeoutExpired:
+            return BuildMutantSchemataResponse(False, timed_out=True)
+        return BuildMutantSchemataResponse(build_response.returncode == 0)
@@ -0,0 +1,114 @@
+from typing import Dict, List
+from execution import SandboxPool
+from mutator import MutantSchemata
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+from .build_mutant_schemata import BuildMutantSchemataRequest, BuildMutantSchemataUseCase
+from .run_test import RunTestRequest, RunTestUseCase
+from .run_mutation_test import RunMutationTestRequest
+
+class CheckInfectionRequest(UseCaseRequest):
+    def __init__(
+        self,
+        requests: List[RunMutationTestRequest],
+        sandbox_pool: SandboxPool = None,
+        env: Dict[str, str] = None,
+    ) -> None:
+        self._requests = requests
+        self._sandbox_pool = sandbox_pool
+        self._env = env
+        super().__init__()
+
+    @property
+    def requests(self) -> List[RunMutationTestRequest]:
+        """The mutants of a single file, of which the infection is checked"""
+        return self._requests
+
+    @property
+    def sandbox_pool(self) -> SandboxPool:
+        return self._sandbox_pool
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """The environment running every test, as the tests of the mutants may be filtered"""
+        return self._env
+
+class CheckInfectionResponse(UseCaseResponse):
+    def __init__(self, infected: List[bool]) -> None:
+        self._infected = infected
+        super().__init__()
+
+    @property
+    def infected(self) -> List[bool]:
+        """Whether each mutant changed the value of its expression on any test, in the
+            same order as the requests. None if the infection of the mutant is unknown."""
+        return self._infected
+
+class CheckInfectionUseCase(
+    UseCase[CheckInfectionRequest, CheckInfectionResponse]
+):
+    """Weak mutation: the mutants are evaluated next to the original program by a
+        single build and test run, a mutant which never changes the value of its
+        expression can not be killed and does not have to be built on its own.
+    """
+    def do(self, request: CheckInfectionRequest) -> CheckInfectionResponse:
+        unknown = CheckInfectionResponse([ None ] * len(request.requests))
+        if len(request.requests) == 0: return unknown
+
+        # Step 1: Combine the mutants without side effects into a weak mutant schemata
+        first = request.requests[0]
+        schemata = MutantSchemata(first.mutation.parser, first.mutation.tree, weak=True)
+        mutant_ids: Dict[int, int] = dict()
+        for r_idx, mutation_test_request in enumerate(request.requests):
+            if mutation_test_request.file_path != first.file_path: continue
+            mutant_id = schemata.add(mutation_test_request.mutation)
+            if mutant_id is not None: mutant_ids[r_idx] = mutant_id
+        if len(mutant_ids) == 0: return unknown
+
+        sandbox = request.sandbox_pool.acquire() if request.sandbox_pool is not None else None
+        try:
+            # Step 2: Build the weak mutant schemata
+            run_test_request = first.run_test_request
+            built = BuildMutantSchemataUseCase().do(
+                BuildMutantSchemataRequest(
+                    schemata.apply().text,
+                    first.file_path,
+                    run_test_request.build_command,
+                    sandbox,
+                    request.env,
+                    run_test_request.build_timeout,
+                )
+            ).built
+            if not built:
+                print(f"Weak mutation of {first.file_path} skipped, it does not build")
+                return unknown
+
+            # Step 3: Run every test, which tweet the mutants infecting the state
+            run_test_response = RunTestUseCase().do(
+                RunTestRequest(
+                    None,
+                    sandbox.command(run_test_request.test_command) if sandbox is not None \
+                        else run_test_request.test_command,
+                    cwd=sandbox.cwd if sandbox is not None else run_test_request.cwd,
+                    env=request.env,
+                    test_timeout=run_test_request.test_timeout,
+                    results_parser=run_test_request.results_parser,
+                    max_trace_length=run_test_request.max_trace_length,
+                )
+            )
+        finally:
+            if sandbox is not None: request.sandbox_pool.release(sandbox)
+
+        # Step 4: A test which did not finish may not have reached the
+        #   expressions of the mutants, such that nothing is known
+        test_results = run_test_response.test_results
+        if run_test_response.timed_out or run_test_response.returncode != 0 or \
+            test_results is None or test_results.trace is None or \
+            (test_results.summary.failure_count or 0) > 0 or \
+            len(test_results.failed_tests or list()) > 0:
+            print(f"Weak mutation of {first.file_path} skipped, its tests do not pass")
+            return unknown
+
+        infected: List[bool] = [ None ] * len(request.requests)
+        for r_idx, mutant_id in mutant_ids.items():
+            infected[r_idx] = str(mutant_id) in test_results.trace.infected
+        return CheckInfectionResponse(infected)
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from execution import TrivialCompilerEquivalence
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+from .run_mutation_test import RunMutationTestRequest
+
+class DetectEquivalentMutantsRequest(UseCaseRequest):
+    def __init__(
+        self,
+        requests: List[RunMutationTestRequest],
+        original_source: str,
+        file_path: str,
+        tce: TrivialCompilerEquivalence,
+        jobs: int = 1,
+    ) -> None:
+        self._requests = requests
+        self._original_source = original_source
+        self._file_path = file_path
+        self._tce = tce
+        self._jobs = jobs
+        super().__init__()
+
+    @property
+    def requests(self) -> List[RunMutationTestRequest]:
+        return self._requests
+
+    @property
+    def original_source(self) -> str:
+        """The source of the program the mutants are created from"""
+        return self._original_source
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def tce(self) -> TrivialCompilerEquivalence:
+        return self._tce
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs
+
+class DetectEquivalentMutantsResponse(UseCaseResponse):
+    def __init__(
+        self,
+        equivalent: List[bool],
+        duplicate_of: List[int],
+    ) -> None:
+        self._equivalent = equivalent
+        self._duplicate_of = duplicate_of
+        super().__init__()
+
+    @property
+    def equivalent(self) -> List[bool]:
+        """Whether each mutant compiles to the same object as the original program"""
+        return self._equivalent
+
+    @property
+    def duplicate_of(self) -> List[int]:
+        """The index of the first mutant each mutant compiles to the same object as,
+            None if it is the first one.
+        """
+        return self._duplicate_of
+
+class DetectEquivalentMutantsUseCase(
+    UseCase[DetectEquivalentMutantsRequest, DetectEquivalentMutantsResponse]
+):
+    def do(self, request: DetectEquivalentMutantsRequest) -> DetectEquivalentMutantsResponse:
+        tce = request.tce
+
+        # Step 1: Compile the original and every mutant
+        def hash_mutant(mutation_test_request: RunMutationTestRequest) -> str:
+            source = mutation_test_request.source
+            if source is None:
+                source = mutation_test_request.mutation.apply().text
+            return tce.hash(source, request.file_path)
+
+        original_hash = tce.hash(request.original_source, request.file_path)
+        with ThreadPoolExecutor(max_workers=max(1, request.jobs)) as executor:
+            hashes = list(executor.map(hash_mutant, request.requests))
+
+        # Step 2: Compare the objects, mutants which do not compile
+        #   are never equivalent as they may still be killed by the build
+        equivalent: List[bool] = list()
+        duplicate_of: List[int] = list()
+        first: Dict[str, int] = dict()
+        for r_idx, mutant_hash in enumerate(hashes):
+            is_equivalent = mutant_hash is not None and mutant_hash == original_hash
+            equivalent.append(is_equivalent)
+            if mutant_hash is None or is_equivalent:
+                duplicate_of.append(None)
+            elif mutant_hash in first:
+                duplicate_of.append(first[mutant_hash])
+            else:
+                first[mutant_hash] = r_idx
+                duplicate_of.append(None)
+
+        tce.record(
+            len(hashes),
+            equivalent.count(True),
+            len(duplicate_of) - duplicate_of.count(None),
+        )
+        return DetectEquivalentMutantsResponse(equivalent, duplicate_of)
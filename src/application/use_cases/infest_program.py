@@ -6,6 +6,7 @@ from instrumentor import CCanaryFactory, CTreeInfestator
 from cfa import Node
 from cfa.c_cfa_factory import CCFAFactory
 
+from typing import List
 from utilities import FileHandler
 from ts import (
     Tree,
@@ -20,14 +21,14 @@ class InfestProgramRequest(UseCaseRequest):
         self,
         parser: Parser,
         tree: Tree,
-        unit_function: Node,
+        unit_functions: List[Node],
         filepath: str,
         save_graph: bool = True,
         save_graph_directory: str = "/"
     ) -> None:
         self._parser = parser
         self._tree = tree
-        self._unit_function = unit_function
+        self._unit_functions = unit_functions
         self._filepath = filepath
         self._save_graph = save_graph
         self._save_graph_directory = save_graph_directory
@@ -42,8 +43,9 @@ class InfestProgramRequest(UseCaseRequest):
         return self._tree
 
     @property
-    def unit_function(self) -> Node:
-        return self._unit_function
+    def unit_functions(self) -> List[Node]:
+        """The unit functions which are instrumented together"""
+        return self._unit_functions
 
     @property
     def filepath(self) -> str:
@@ -73,20 +75,23 @@ class InfestProgramUseCase(
     UseCase[InfestProgramRequest, InfestProgramResponse]
 ):
     def do(self, request: InfestProgramRequest) -> InfestProgramResponse:
-        # Step 1: Create CFA for the unit function
-        cfa_factory = CCFAFactory(request.tree)
-        unit_function_body = request.unit_function.child_by_field(
-            CField.BODY
-        )
-        cfa = cfa_factory.create(unit_function_body)
-        if request.save_graph:
-            graph = cfa.draw(request.tree, "cfg")
-            graph.save(directory=request.save_graph_directory)
+        # Step 1: Create CFA for each unit function
+        cfas = list()
+        for u_idx, unit_function in enumerate(request.unit_functions):
+            unit_function_body = unit_function.child_by_field(
+                CField.BODY
+            )
+            # A factory keeps the nodes of the CFA it created, hence one per unit
+            cfa = CCFAFactory(request.tree).create(unit_function_body)
+            if request.save_graph:
+                graph = cfa.draw(request.tree, "cfg" if u_idx == 0 else f"cfg_{u_idx}")
+                graph.save(directory=request.save_graph_directory)
+            cfas.append(cfa)
 
-        # Step 2: Instrument
+        # Step 2: Instrument every unit at once, such that it is built and tested once
         canary_factory = CCanaryFactory()
         infestator = CTreeInfestator(request.parser, canary_factory)
-        instrumented_tree = infestator.infect(request.tree, cfa)
+        instrumented_tree = infestator.infect_all(request.tree, cfas)
 
         # Step 3: Write the instrumented file
         file = open(request.filepath, "w")
@@ -8,5 +8,6 @@ class InitializeSystemUseCase(
     UseCase[InitializeSystemRequest, InitializeSystemResponse]
 ):
     def do(self, _: InitializeSystemRequest) -> InitializeSystemResponse:
-        LanguageLibrary.build()
+        # The grammars are built when stale and loaded once, only C is analysed
+        LanguageLibrary.c()
         return InitializeSystemResponse()
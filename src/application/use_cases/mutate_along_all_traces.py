@@ -1,4 +1,5 @@
 from typing import Dict, List, Tuple
+from execution import ExecutionContext
 from instrumentation_trace import Trace
 from mutator import MutationStrategy
 from cfa import LocalisedCFA, LocalisedNode
@@ -20,7 +21,8 @@ class MutateAlongAllTracesRequest(UseCaseRequest):
         test_results_parser: ResultsParser,
         full_file_path: str,
         out: str = "",
-        base: str = ""
+        base: str = "",
+        execution: ExecutionContext = None,
     ) -> None:
         self._traces = traces
         self._localised_cfg = localised_cfg
@@ -33,6 +35,7 @@ class MutateAlongAllTracesRequest(UseCaseRequest):
         self._full_file_path = full_file_path
         self._out = out
         self._base = base
+        self._execution = execution or ExecutionContext()
         super().__init__()
 
     @property
@@ -79,6 +82,10 @@ class MutateAlongAllTracesRequest(UseCaseRequest):
     def base(self) -> str:
         return self._base
 
+    @property
+    def execution(self) -> ExecutionContext:
+        return self._execution
+
 class MutateAlongAllTracesResponse(UseCaseResponse):
     def __init__(
         self,
@@ -94,7 +101,10 @@ class MutateAlongAllTracesResponse(UseCaseResponse):
         visited_candidates: int,
         visited_mutations: int,
         amount_visited_locations: Dict[str, int],
-        trace_count: int
+        trace_count: int,
+        amount_timed_out: int = 0,
+        amount_no_coverage: int = 0,
+        amount_not_infected: int = 0,
     ) -> None:
         self._visited_locations = visited_locations
         self._unvisited_locations = unvisited_locations
@@ -109,6 +119,9 @@ class MutateAlongAllTracesResponse(UseCaseResponse):
         self._visited_mutations = visited_mutations
         self._amount_visited_locations = amount_visited_locations
         self._trace_count = trace_count
+        self._amount_timed_out = amount_timed_out
+        self._amount_no_coverage = amount_no_coverage
+        self._amount_not_infected = amount_not_infected
         super().__init__()
 
     @property
@@ -139,6 +152,21 @@ class MutateAlongAllTracesResponse(UseCaseResponse):
     def amount_survived(self) -> int:
         return self._amount_survived
 
+    @property
+    def amount_timed_out(self) -> int:
+        """The amount of mutants which timed out, these are included in the amount killed"""
+        return self._amount_timed_out
+
+    @property
+    def amount_no_coverage(self) -> int:
+        """The amount of mutants no test reached, these are included in the amount survived"""
+        return self._amount_no_coverage
+
+    @property
+    def amount_not_infected(self) -> int:
+        """The amount of mutants which never infected the state, these are included in the amount survived"""
+        return self._amount_not_infected
+
     @property
     def random_mutations_runs(self) -> List[Tuple[LocalisedNode, MutateRandomlyResponse]]:
         return self._random_mutations_runs
@@ -216,6 +244,9 @@ class MutateAlongAllTracesUseCase(
         amount_visited_locations: Dict[str, int] = dict()
         amount_killed = 0
         amount_survived = 0
+        amount_timed_out = 0
+        amount_no_coverage = 0
+        amount_not_infected = 0
         random_mutations_runs: List[MutateRandomlyResponse] = list()
         for visited_node in visited_nodes:
             mutate_randomly_request = MutateRandomlyRequest(
@@ -229,13 +260,17 @@ class MutateAlongAllTracesUseCase(
                 request.full_file_path,
                 request.out,
                 request.base,
+                request.execution,
+                request.localised_cfg,
             )
             mutate_randomly_response = MutateRandomlyUseCase().do(
                 mutate_randomly_request
             )
 
             for mutation_test in mutate_randomly_response.mutation_tests:
-                for location in mutation_test.test_results.trace.sequence:
+                # The trace also visits the other instrumented units
+                unit_trace = request.localised_cfg.slice(mutation_test.test_results.trace)
+                for location in unit_trace.sequence:
                     if location.id not in amount_visited_locations:
                         amount_visited_locations[location.id] = 1
                     else: amount_visited_locations[location.id] += 1
@@ -243,6 +278,9 @@ class MutateAlongAllTracesUseCase(
             random_mutations_runs.append((visited_node, mutate_randomly_response))
             amount_killed += mutate_randomly_response.amount_killed
             amount_survived += mutate_randomly_response.amount_survived
+            amount_timed_out += mutate_randomly_response.amount_timed_out
+            amount_no_coverage += mutate_randomly_response.amount_no_coverage
+            amount_not_infected += mutate_randomly_response.amount_not_infected
 
             visited_node.amount_of_candidates = mutate_randomly_response.amount_of_candidates
             visited_node.amount_killed = mutate_randomly_response.amount_killed
@@ -266,5 +304,8 @@ class MutateAlongAllTracesUseCase(
             visited_candidates,
             visited_mutations,
             amount_visited_locations,
-            trace_count
+            trace_count,
+            amount_timed_out,
+            amount_no_coverage,
+            amount_not_infected,
         )
\ No newline at end of file
@@ -1,8 +1,15 @@
-from typing import List
-from mutator import MutationStrategy
-from test_results_parsing import ResultsParser
+import os
+from typing import Callable, Dict, List, Tuple
+from cfa import LocalisedCFA
+from execution import ExecutionContext
+from instrumentation_trace import Trace
+from mutator import MutationStrategy, MutationOutcome
+from test_results_parsing import ResultsParser, TestResults, TestSummary
 from ts import Tree, Parser, Node
-from .run_mutation_test import RunMutationTestRequest, RunMutationTestResponse, RunMutationTestUseCase
+from .run_mutation_test import RunMutationTestRequest, RunMutationTestResponse
+from .run_mutation_tests import RunMutationTestsRequest, RunMutationTestsUseCase
+from .detect_equivalent_mutants import DetectEquivalentMutantsRequest, DetectEquivalentMutantsUseCase
+from .check_infection import CheckInfectionRequest, CheckInfectionUseCase
 from .run_test import RunTestRequest
 from .parse_test_result import ParseTestResultRequest
 from .use_case import UseCaseRequest, UseCaseResponse, UseCase
@@ -20,6 +27,10 @@ class MutateRandomlyRequest(UseCaseRequest):
         full_file_path: str,
         out: str = "",
         base: str = "",
+        execution: ExecutionContext = None,
+        localised_cfg: LocalisedCFA = None,
+        selection: List[Tuple[int, int]] = None,
+        stop: Callable[[List[RunMutationTestResponse]], bool] = None,
     ) -> None:
         self._build_command = build_command
         self._test_command = test_command
@@ -31,6 +42,10 @@ class MutateRandomlyRequest(UseCaseRequest):
         self._full_file_path = full_file_path
         self._out = out
         self._base = base
+        self._execution = execution or ExecutionContext()
+        self._localised_cfg = localised_cfg
+        self._selection = selection
+        self._stop = stop
         super().__init__()
 
     @property
@@ -73,18 +88,46 @@ class MutateRandomlyRequest(UseCaseRequest):
     def base(self) -> str:
         return self._base
 
+    @property
+    def execution(self) -> ExecutionContext:
+        return self._execution
+
+    @property
+    def localised_cfg(self) -> LocalisedCFA:
+        """The locations of the mutated tree, the tests of a mutant are selected by its location"""
+        return self._localised_cfg
+
+    @property
+    def selection(self) -> List[Tuple[int, int]]:
+        """The candidate and mutation indices of the mutants which are tested, in
+            the order they are tested, if None then every mutant of every candidate is"""
+        return self._selection
+
+    @property
+    def stop(self) -> Callable[[List[RunMutationTestResponse]], bool]:
+        """Called with the outcomes so far after every batch of as many mutants as there
+            are jobs, the remaining mutants are not tested once it is True. If None then
+            every mutant is tested at once"""
+        return self._stop
+
 class MutateRandomlyResponse(UseCaseResponse):
     def __init__(
         self,
         amount_killed: int,
         amount_survived: int,
         mutation_tests: List[RunMutationTestResponse],
-        amount_of_candidates: int
+        amount_of_candidates: int,
+        amount_timed_out: int = 0,
+        amount_no_coverage: int = 0,
+        amount_not_infected: int = 0,
     ) -> None:
         self._amount_killed = amount_killed
         self._amount_survived = amount_survived
         self._mutation_tests = mutation_tests
         self._amount_of_candidates = amount_of_candidates
+        self._amount_timed_out = amount_timed_out
+        self._amount_no_coverage = amount_no_coverage
+        self._amount_not_infected = amount_not_infected
         super().__init__()
 
     @property
@@ -99,6 +142,21 @@ class MutateRandomlyResponse(UseCaseResponse):
     def amount_survived(self) -> int:
         return self._amount_survived
 
+    @property
+    def amount_timed_out(self) -> int:
+        """The amount of mutants which timed out, these are included in the amount killed"""
+        return self._amount_timed_out
+
+    @property
+    def amount_no_coverage(self) -> int:
+        """The amount of mutants no test reached, these are included in the amount survived"""
+        return self._amount_no_coverage
+
+    @property
+    def amount_not_infected(self) -> int:
+        """The amount of mutants which never infected the state, these are included in the amount survived"""
+        return self._amount_not_infected
+
     @property
     def mutation_tests(self) -> List[RunMutationTestResponse]:
         return self._mutation_tests
@@ -109,16 +167,58 @@ class MutateRandomlyUseCase(
     def do(self, request: MutateRandomlyRequest) -> MutateRandomlyResponse:
         amount_killed = 0
         amount_survived = 0
-        mutation_tests: List[RunMutationTestResponse] = list()
+        amount_timed_out = 0
+        amount_no_coverage = 0
+        amount_not_infected = 0
+        mutation_test_requests: List[RunMutationTestRequest] = list()
+        mutants: List[Tuple[int, int]] = list()
+        covered: List[bool] = list()
+        locations: List[str] = list()
+        # The location, operator, unit and executed tests of each mutant
+        sites: List[Tuple[str, str, str, List[str]]] = list()
+        selection: Dict[Tuple[int, int], int] = None
+        if request.selection is not None:
+            selection = { mutant: s_idx for s_idx, mutant in enumerate(request.selection) }
+        coverage = request.execution.coverage
+        prioritiser = request.execution.prioritiser
         candidates = request.strategy.capture(
             request.node
         )
         for c_idx, candidate in enumerate(candidates):
+            env = request.execution.env
+            location: str = None
+            if request.localised_cfg is not None:
+                location = request.localised_cfg.location_of(candidate)
+
+            # Only the tests reaching the location of the candidate can kill its mutants
+            is_covered = True
+            tests: List[str] = None
+            if request.execution.test_selection and coverage is not None and \
+                request.localised_cfg is not None:
+                is_covered = location is None or coverage.visits(location)
+                tests = coverage.tests_of(location)
+                if is_covered and tests is not None:
+                    env = dict(env or os.environ, **request.test_results_parser.test_filter(tests))
+
+            # The tests most likely to kill the mutants of the candidate run first
+            site: Tuple[str, str, str, List[str]] = None
+            if prioritiser is not None:
+                unit_node = candidate.get_descendent_of_types([ "function_definition" ])
+                unit = request.tree.contents_of(unit_node.child_by_field_name("declarator")) \
+                    if unit_node is not None else request.full_file_path
+                executed = prioritiser.order(tests, location, candidate.type, unit)
+                order_env = request.test_results_parser.test_order(executed)
+                if order_env is not None:
+                    env = dict(env or os.environ, **order_env)
+                elif tests is not None: executed = tests
+                elif coverage is not None: executed = coverage.tests
+                site = (location, candidate.type, unit, executed)
 
             mutations = request.strategy.mutations(
                 request.parser, request.tree, candidate
             )
             for m_idx, mutation in enumerate(mutations):
+                if selection is not None and (c_idx, m_idx) not in selection: continue
                 test_results_path = f'{request.base}/{request.out}/mutant_{c_idx}_{m_idx}_test_results.txt'
                 run_mutation_test_request = RunMutationTestRequest(
                     mutation,
@@ -126,26 +226,186 @@ class MutateRandomlyUseCase(
                     RunTestRequest(
                         request.build_command,
                         request.test_command,
-                        test_results_path
+                        # The output is parsed as it is produced, only kept when debugging
+                        test_results_path if request.execution.keep_test_output else None,
+                        env=env,
+                        early_abort=request.test_results_parser if request.execution.early_abort else None,
+                        build_timeout=request.execution.build_timeout,
+                        test_timeout=request.execution.test_timeout,
+                        results_parser=request.test_results_parser,
+                        max_trace_length=request.execution.max_trace_length,
                     ),
                     ParseTestResultRequest(
                         test_results_path,
-                        request.test_results_parser
-                    )
+                        request.test_results_parser,
+                        request.execution.max_trace_length,
+                        request.execution.keep_test_output,
+                    ),
+                    result_cache=request.execution.result_cache,
+                    journal=request.execution.journal,
+                )
+                mutation_test_requests.append(run_mutation_test_request)
+                mutants.append((c_idx, m_idx))
+                covered.append(is_covered)
+                sites.append(site)
+                locations.append(location)
+
+        # The selected mutants are tested in the order they were selected in
+        if selection is not None:
+            ordered = sorted(
+                range(len(mutation_test_requests)), key=lambda r_idx: selection[mutants[r_idx]]
+            )
+            mutation_test_requests = [ mutation_test_requests[r_idx] for r_idx in ordered ]
+            covered = [ covered[r_idx] for r_idx in ordered ]
+            sites = [ sites[r_idx] for r_idx in ordered ]
+            locations = [ locations[r_idx] for r_idx in ordered ]
+
+        # Mutants compiling to the same object as the original or as
+        #   another mutant are not tested on their own
+        covered_indices = [
+            r_idx for r_idx in range(len(mutation_test_requests)) if covered[r_idx]
+        ]
+        equivalent = [ False ] * len(mutation_test_requests)
+        duplicate_of = [ None ] * len(mutation_test_requests)
+        if request.execution.tce is not None and len(covered_indices) > 0:
+            detect_equivalent_mutants_response = DetectEquivalentMutantsUseCase().do(
+                DetectEquivalentMutantsRequest(
+                    [ mutation_test_requests[r_idx] for r_idx in covered_indices ],
+                    request.tree.text,
+                    request.full_file_path,
+                    request.execution.tce,
+                    request.execution.jobs,
+                )
+            )
+            for d_idx, r_idx in enumerate(covered_indices):
+                equivalent[r_idx] = detect_equivalent_mutants_response.equivalent[d_idx]
+                if detect_equivalent_mutants_response.duplicate_of[d_idx] is not None:
+                    duplicate_of[r_idx] = covered_indices[
+                        detect_equivalent_mutants_response.duplicate_of[d_idx]
+                    ]
+        tested_indices = [
+            r_idx for r_idx in covered_indices
+            if not equivalent[r_idx] and duplicate_of[r_idx] is None
+        ]
+
+        # Mutants which never change the value of their expression can not be killed,
+        #   such that they are not built on their own
+        not_infected = [ False ] * len(mutation_test_requests)
+        if request.execution.weak_mutation:
+            checked_indices = [
+                r_idx for r_idx in tested_indices
+                if not mutation_test_requests[r_idx].has_result
+            ]
+            check_infection_response = CheckInfectionUseCase().do(
+                CheckInfectionRequest(
+                    [ mutation_test_requests[r_idx] for r_idx in checked_indices ],
+                    request.execution.sandbox_pool,
+                    request.execution.env,
                 )
-                run_mutation_test_response = RunMutationTestUseCase().do(
-                    run_mutation_test_request
+            )
+            for c_idx, r_idx in enumerate(checked_indices):
+                not_infected[r_idx] = check_infection_response.infected[c_idx] is False
+            tested_indices = [
+                r_idx for r_idx in tested_indices if not not_infected[r_idx]
+            ]
+
+        # Every mutant is tested at once, unless the testing may stop early, in
+        #   which case a batch keeps every worker busy
+        tested = set(tested_indices)
+        batch_size = max(
+            len(mutation_test_requests) if request.stop is None else request.execution.jobs, 1
+        )
+        mutation_tests: List[RunMutationTestResponse] = [ None ] * len(mutation_test_requests)
+        amount_done = 0
+        for b_idx in range(0, len(mutation_test_requests), batch_size):
+            batch = range(b_idx, min(b_idx + batch_size, len(mutation_test_requests)))
+            run_indices = [ r_idx for r_idx in batch if r_idx in tested ]
+            run_mutation_tests_response = RunMutationTestsUseCase().do(
+                RunMutationTestsRequest(
+                    [ mutation_test_requests[r_idx] for r_idx in run_indices ],
+                    request.execution.sandbox_pool,
+                    request.execution.schemata,
+                    request.execution.fork_server,
+                    request.execution.coordinator,
+                    [ locations[r_idx] for r_idx in run_indices ]
+                        if request.execution.split_stream else None,
+                    request.execution.pipeline,
                 )
-                mutation_tests.append(run_mutation_test_response)
+            )
+            for r_idx, response in zip(run_indices, run_mutation_tests_response.responses):
+                mutation_tests[r_idx] = response
+            for r_idx in batch:
+                mutation = mutation_test_requests[r_idx].mutation
+                if equivalent[r_idx]:
+                    mutation_tests[r_idx] = RunMutationTestResponse(
+                        mutation.node,
+                        mutation,
+                        TestResults(TestSummary(0, 0, 0), Trace(list())),
+                        MutationOutcome.EQUIVALENT,
+                    )
+                elif not covered[r_idx]:
+                    mutation_tests[r_idx] = RunMutationTestResponse(
+                        mutation.node,
+                        mutation,
+                        TestResults(TestSummary(0, 0, 0), Trace(list())),
+                        MutationOutcome.NO_COVERAGE,
+                    )
+                elif not_infected[r_idx]:
+                    mutation_tests[r_idx] = RunMutationTestResponse(
+                        mutation.node,
+                        mutation,
+                        TestResults(TestSummary(0, 0, 0), Trace(list())),
+                        MutationOutcome.SURVIVED_NOT_INFECTED,
+                    )
+                elif duplicate_of[r_idx] is not None:
+                    # The duplicated mutant comes first, such that it is tested by now
+                    duplicate = mutation_tests[duplicate_of[r_idx]]
+                    mutation_tests[r_idx] = RunMutationTestResponse(
+                        mutation.node,
+                        mutation,
+                        duplicate.test_results,
+                        duplicate.outcome,
+                    )
+
+            # The tests which killed the tested mutants are likely to kill the next ones
+            if prioritiser is not None:
+                for r_idx in run_indices:
+                    response = mutation_tests[r_idx]
+                    if response.outcome not in [ MutationOutcome.KILLED, MutationOutcome.SURVIVED ]:
+                        continue
+                    location, operator, unit, executed = sites[r_idx]
+                    prioritiser.record(
+                        location,
+                        operator,
+                        unit,
+                        executed,
+                        response.test_results.failed_tests,
+                    )
+
+            amount_done = batch.stop
+            if request.stop is not None and request.stop(mutation_tests[:amount_done]): break
+        mutation_tests = mutation_tests[:amount_done]
+
+        for run_mutation_test_response in mutation_tests:
+            outcome = run_mutation_test_response.outcome
+            # Equivalent mutants can not be killed, and do not count towards the score
+            if outcome == MutationOutcome.EQUIVALENT: continue
+            if outcome.is_detected:
+                amount_killed += 1
+            else: amount_survived += 1
+            if outcome == MutationOutcome.TIMEOUT:
+                amount_timed_out += 1
+            if outcome == MutationOutcome.NO_COVERAGE:
+                amount_no_coverage += 1
+            if outcome == MutationOutcome.SURVIVED_NOT_INFECTED:
+                amount_not_infected += 1
 
-                summary = run_mutation_test_response.test_results.summary
-                if summary.failure_count > 0:
-                    amount_killed += 1
-                else: amount_survived += 1
-        
         return MutateRandomlyResponse(
             amount_killed,
             amount_survived,
             mutation_tests,
-            amount_of_candidates = len(candidates)
+            amount_of_candidates = len(candidates),
+            amount_timed_out = amount_timed_out,
+            amount_no_coverage = amount_no_coverage,
+            amount_not_infected = amount_not_infected,
         )
@@ -0,0 +1,289 @@
+import random
+from typing import Dict, List, Tuple
+from cfa import LocalisedCFA
+from execution import ExecutionContext
+from mutator import MutationStrategy, MutationOutcome
+from test_results_parsing import ResultsParser
+from ts import Tree, Parser, Node
+from utilities import wilson_interval
+from .run_mutation_test import RunMutationTestResponse
+from .mutate_randomly import MutateRandomlyRequest, MutateRandomlyUseCase
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+
+class MutateSampledRequest(UseCaseRequest):
+    def __init__(
+        self,
+        node: Node,
+        tree: Tree,
+        parser: Parser,
+        strategy: MutationStrategy,
+        build_command: str,
+        test_command: str,
+        test_results_parser: ResultsParser,
+        full_file_path: str,
+        out: str = "",
+        base: str = "",
+        execution: ExecutionContext = None,
+        localised_cfg: LocalisedCFA = None,
+        margin: float = 0.02,
+        confidence: float = 0.95,
+        budget: int = None,
+        stratified: bool = True,
+        seed: int = None,
+    ) -> None:
+        self._node = node
+        self._tree = tree
+        self._parser = parser
+        self._strategy = strategy
+        self._build_command = build_command
+        self._test_command = test_command
+        self._test_results_parser = test_results_parser
+        self._full_file_path = full_file_path
+        self._out = out
+        self._base = base
+        self._execution = execution or ExecutionContext()
+        self._localised_cfg = localised_cfg
+        self._margin = margin
+        self._confidence = confidence
+        self._budget = budget
+        self._stratified = stratified
+        self._seed = seed
+        super().__init__()
+
+    @property
+    def node(self) -> Node:
+        return self._node
+
+    @property
+    def tree(self) -> Tree:
+        return self._tree
+
+    @property
+    def parser(self) -> Parser:
+        return self._parser
+
+    @property
+    def strategy(self) -> MutationStrategy:
+        return self._strategy
+
+    @property
+    def build_command(self) -> str:
+        return self._build_command
+
+    @property
+    def test_command(self) -> str:
+        return self._test_command
+
+    @property
+    def test_results_parser(self) -> ResultsParser:
+        return self._test_results_parser
+
+    @property
+    def full_file_path(self) -> str:
+        return self._full_file_path
+
+    @property
+    def out(self) -> str:
+        return self._out
+
+    @property
+    def base(self) -> str:
+        return self._base
+
+    @property
+    def execution(self) -> ExecutionContext:
+        return self._execution
+
+    @property
+    def localised_cfg(self) -> LocalisedCFA:
+        """The locations the mutants are stratified by"""
+        return self._localised_cfg
+
+    @property
+    def margin(self) -> float:
+        """The half width of the confidence interval of the score at which the sampling stops"""
+        return self._margin
+
+    @property
+    def confidence(self) -> float:
+        return self._confidence
+
+    @property
+    def budget(self) -> int:
+        """The maximum amount of mutants tested, if None then every mutant may be"""
+        return self._budget
+
+    @property
+    def stratified(self) -> bool:
+        """Whether every location is sampled in proportion to its amount of mutants,
+            if not then the mutants are drawn uniformly"""
+        return self._stratified
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+class MutateSampledResponse(UseCaseResponse):
+    def __init__(
+        self,
+        amount_killed: int,
+        amount_survived: int,
+        mutation_tests: List[RunMutationTestResponse],
+        amount_of_mutants: int,
+        interval: Tuple[float, float],
+    ) -> None:
+        self._amount_killed = amount_killed
+        self._amount_survived = amount_survived
+        self._mutation_tests = mutation_tests
+        self._amount_of_mutants = amount_of_mutants
+        self._interval = interval
+        super().__init__()
+
+    @property
+    def amount_killed(self) -> int:
+        return self._amount_killed
+
+    @property
+    def amount_survived(self) -> int:
+        return self._amount_survived
+
+    @property
+    def mutation_tests(self) -> List[RunMutationTestResponse]:
+        """The sampled mutants in the order they were drawn"""
+        return self._mutation_tests
+
+    @property
+    def amount_of_mutants(self) -> int:
+        """The amount of mutants the sample is drawn from"""
+        return self._amount_of_mutants
+
+    @property
+    def score(self) -> float:
+        """The estimated mutation score, None if no mutant counts towards it"""
+        amount_total = self._amount_killed + self._amount_survived
+        if amount_total == 0: return None
+        return self._amount_killed / amount_total
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        """The confidence interval of the mutation score"""
+        return self._interval
+
+class MutateSampledUseCase(
+    UseCase[MutateSampledRequest, MutateSampledResponse]
+):
+    def do(self, request: MutateSampledRequest) -> MutateSampledResponse:
+        # Step 1: Enumerate every mutant, grouped by the location of its candidate
+        strata: Dict[str, List[Tuple[int, int]]] = dict()
+        candidates = request.strategy.capture(request.node)
+        for c_idx, candidate in enumerate(candidates):
+            location: str = None
+            if request.localised_cfg is not None:
+                location = request.localised_cfg.location_of(candidate)
+            mutations = request.strategy.mutations(
+                request.parser, request.tree, candidate
+            )
+            stratum = strata.setdefault(location, list())
+            stratum.extend((c_idx, m_idx) for m_idx in range(len(mutations)))
+
+        # Step 2: Draw the order the mutants are tested in
+        order = self._order(strata, request.stratified, random.Random(request.seed))
+        amount_of_mutants = len(order)
+        if request.budget is not None:
+            order = order[:request.budget]
+
+        # Step 3: Test the mutants a batch at a time, such that every worker is busy,
+        #   until the score is known to within the margin. The mutants are built and
+        #   checked for equivalence and infection once, before the first batch
+        mutate_randomly_response = MutateRandomlyUseCase().do(
+            MutateRandomlyRequest(
+                request.node,
+                request.tree,
+                request.parser,
+                request.strategy,
+                request.build_command,
+                request.test_command,
+                request.test_results_parser,
+                request.full_file_path,
+                request.out,
+                request.base,
+                request.execution,
+                request.localised_cfg,
+                order,
+                lambda mutation_tests: self._is_within_margin(
+                    request, amount_of_mutants, mutation_tests
+                ),
+            )
+        )
+        mutation_tests = mutate_randomly_response.mutation_tests
+        interval = (0.0, 1.0)
+        if len(mutation_tests) > 0:
+            interval = self._interval(request, amount_of_mutants, mutation_tests)
+
+        return MutateSampledResponse(
+            mutate_randomly_response.amount_killed,
+            mutate_randomly_response.amount_survived,
+            mutation_tests,
+            amount_of_mutants,
+            interval,
+        )
+
+    def _interval(
+        self,
+        request: MutateSampledRequest,
+        amount_of_mutants: int,
+        mutation_tests: List[RunMutationTestResponse],
+    ) -> Tuple[float, float]:
+        amount_killed = 0
+        amount_survived = 0
+        amount_equivalent = 0
+        for mutation_test in mutation_tests:
+            if mutation_test.outcome == MutationOutcome.EQUIVALENT:
+                amount_equivalent += 1
+            elif mutation_test.outcome.is_detected:
+                amount_killed += 1
+            else: amount_survived += 1
+        # Equivalent mutants can not be killed, and are not part of the population
+        return wilson_interval(
+            amount_killed,
+            amount_killed + amount_survived,
+            request.confidence,
+            amount_of_mutants - amount_equivalent,
+        )
+
+    def _is_within_margin(
+        self,
+        request: MutateSampledRequest,
+        amount_of_mutants: int,
+        mutation_tests: List[RunMutationTestResponse],
+    ) -> bool:
+        lower, upper = self._interval(request, amount_of_mutants, mutation_tests)
+        return (upper - lower) / 2 <= request.margin
+
+    def _order(
+        self,
+        strata: Dict[str, List[Tuple[int, int]]],
+        stratified: bool,
+        generator: random.Random,
+    ) -> List[Tuple[int, int]]:
+        if not stratified:
+            order = [ mutant for stratum in strata.values() for mutant in stratum ]
+            generator.shuffle(order)
+            return order
+
+        # Every prefix of the order holds each location in proportion to its
+        #   amount of mutants, such that the sample needs no weighting
+        remaining = { location: list(stratum) for location, stratum in strata.items() }
+        for stratum in remaining.values():
+            generator.shuffle(stratum)
+        total = sum(len(stratum) for stratum in strata.values())
+        drawn = { location: 0 for location in strata }
+        order: List[Tuple[int, int]] = list()
+        while len(order) < total:
+            location = max(
+                [ location for location in remaining if len(remaining[location]) > 0 ],
+                key=lambda location: len(strata[location]) * (len(order) + 1) / total - drawn[location]
+            )
+            order.append(remaining[location].pop())
+            drawn[location] += 1
+        return order
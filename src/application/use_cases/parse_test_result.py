@@ -1,5 +1,4 @@
-from os import linesep, remove
-from time import sleep
+from os import remove
 from test_results_parsing import (
     TestResults,
     CuTestResultsParser,
@@ -12,9 +11,13 @@ class ParseTestResultRequest(UseCaseRequest):
         self,
         file_path: str,
         parser: ResultsParser,
+        max_trace_length: int = None,
+        keep: bool = False,
     ) -> None:
         self._file_path = file_path
         self._parser = parser
+        self._max_trace_length = max_trace_length
+        self._keep = keep
         super().__init__()
 
     @property
@@ -25,6 +28,16 @@ class ParseTestResultRequest(UseCaseRequest):
     def parser(self) -> ResultsParser:
         return self._parser
 
+    @property
+    def max_trace_length(self) -> int:
+        """The maximum amount of locations in the trace, if None then it is unbounded"""
+        return self._max_trace_length
+
+    @property
+    def keep(self) -> bool:
+        """Whether the file is kept after parsing it, otherwise it is removed"""
+        return self._keep
+
 class ParseTestResultResponse(UseCaseResponse): 
     def __init__(
         self, 
@@ -41,11 +54,15 @@ class ParseTestResultUseCase(
     UseCase[ParseTestResultRequest, ParseTestResultResponse]
 ):  
     def do(self, request: ParseTestResultRequest) -> ParseTestResultResponse:
+        # The file is parsed a line at a time, as the trace within it may be large
+        stream = request.parser.stream(request.max_trace_length)
         file = open(request.file_path, "r", errors="replace")
-        contents: str = file.read()
-        lines = contents.split(linesep)
-        test_results = request.parser.parse(lines)
+        for line in file:
+            stream.feed(line.rstrip("\n"))
+        file.close()
+        test_results = stream.finish()
 
-        remove(request.file_path)
+        if not request.keep:
+            remove(request.file_path)
 
-        return ParseTestResultResponse(test_results)
\ No newline at end of file
+        return ParseTestResultResponse(test_results)
@@ -0,0 +1,121 @@
+import os
+from typing import Any, Dict
+from execution import Sandbox
+from test_results_parsing import ResultsParser
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+from .run_test import RunTestRequest
+from .parse_test_result import ParseTestResultRequest
+from .run_mutation_test import RunMutationTestRequest, RunMutationTestUseCase
+
+class RunMutantJobRequest(UseCaseRequest):
+    def __init__(
+        self,
+        job: Dict[str, Any],
+        base: str,
+        sandbox: Sandbox,
+        results_parser: ResultsParser,
+    ) -> None:
+        """
+        Args:
+            job (Dict[str, Any]): The mutant leased from the coordinator, see RunMutantJobRequest.encode
+            base (str): The copy of the project of the worker, to which the paths of the coordinator are mapped
+            sandbox (Sandbox): The sandbox of the worker the mutant is built and tested in
+            results_parser (ResultsParser): The parser of the testing backend
+        """
+        self._job = job
+        self._base = base
+        self._sandbox = sandbox
+        self._results_parser = results_parser
+        super().__init__()
+
+    @staticmethod
+    def encode(base: str, file_path: str, source: str, run_test_request: RunTestRequest) -> Dict[str, Any]:
+        """The job of a mutant, holding everything a worker needs to build and test it
+
+        Args:
+            base (str): The directory of the project of the coordinator
+            file_path (str): The path of the mutated file
+            source (str): The mutated source of the file
+            run_test_request (RunTestRequest): The build and test of the mutant
+
+        Returns:
+            Dict[str, Any]: The job
+        """
+        # Only the variables set by the analysis are sent, the worker has its own environment
+        env = {
+            name: value for name, value in (run_test_request.env or dict()).items()
+            if os.environ.get(name) != value
+        }
+        return {
+            "base": os.path.abspath(base),
+            "file": os.path.abspath(file_path),
+            "source": source,
+            "build_command": run_test_request.build_command,
+            "test_command": run_test_request.test_command,
+            "env": env,
+            "early_abort": run_test_request.early_abort is not None,
+            "build_timeout": run_test_request.build_timeout,
+            "test_timeout": run_test_request.test_timeout,
+            "max_trace_length": run_test_request.max_trace_length,
+        }
+
+    @property
+    def job(self) -> Dict[str, Any]:
+        return self._job
+
+    @property
+    def base(self) -> str:
+        return self._base
+
+    @property
+    def sandbox(self) -> Sandbox:
+        return self._sandbox
+
+    @property
+    def results_parser(self) -> ResultsParser:
+        return self._results_parser
+
+class RunMutantJobResponse(UseCaseResponse):
+    def __init__(self, result: Dict[str, Any]) -> None:
+        self._result = result
+        super().__init__()
+
+    @property
+    def result(self) -> Dict[str, Any]:
+        """The result sent back to the coordinator, see RunMutationTestResponse.encode"""
+        return self._result
+
+class RunMutantJobUseCase(
+    UseCase[RunMutantJobRequest, RunMutantJobResponse]
+):
+    def do(self, request: RunMutantJobRequest) -> RunMutantJobResponse:
+        job = request.job
+        # Step 1: Map the paths of the coordinator to the copy of the project of the worker
+        paths = Sandbox(job["base"], request.base)
+        run_test_request = RunTestRequest(
+            paths.command(job["build_command"]),
+            paths.command(job["test_command"]),
+            env=dict(os.environ, **job["env"]),
+            early_abort=request.results_parser if job["early_abort"] else None,
+            build_timeout=job["build_timeout"],
+            test_timeout=job["test_timeout"],
+            results_parser=request.results_parser,
+            max_trace_length=job["max_trace_length"],
+        )
+
+        # Step 2: Build and test the mutant in the sandbox
+        run_mutation_test_response = RunMutationTestUseCase().do(
+            RunMutationTestRequest(
+                None,
+                paths.path_of(job["file"]),
+                run_test_request,
+                ParseTestResultRequest(
+                    None,
+                    request.results_parser,
+                    job["max_trace_length"],
+                ),
+                request.sandbox,
+                job["source"],
+            )
+        )
+        return RunMutantJobResponse(run_mutation_test_response.encode())
@@ -1,9 +1,14 @@
-from typing import Dict
-from mutator import Mutation
-from test_results_parsing import TestResults
+import os
+import subprocess
+from typing import Any, Dict, Tuple
+from execution import Coordinator, Sandbox, ForkServer, Journal, ResultCache
+from mutator import Mutation, MutationOutcome
+from instrumentation_trace import Trace
+from test_results_parsing import TestResults, TestSummary
 from ts import Node
 from .use_case import UseCaseRequest, UseCaseResponse, UseCase
 from .run_test import RunTestRequest, RunTestUseCase
+from .build_mutant_schemata import BuildMutantSchemataResponse
 from .parse_test_result import ParseTestResultRequest, ParseTestResultUseCase
 
 class RunMutationTestRequest(UseCaseRequest):
@@ -13,11 +18,33 @@ class RunMutationTestRequest(UseCaseRequest):
         file_path: str,
         run_test_request: RunTestRequest,
         parse_test_results_request: ParseTestResultRequest,
+        sandbox: Sandbox = None,
+        source: str = None,
+        mutant_id: int = None,
+        fork_server: ForkServer = None,
+        result_cache: ResultCache = None,
+        result_key: str = None,
+        journal: Journal = None,
+        journal_key: str = None,
+        coordinator: Coordinator = None,
+        job_id: int = None,
+        build: BuildMutantSchemataResponse = None,
     ) -> None:
         self._mutation = mutation
         self._file_path = file_path
         self._run_test_request = run_test_request
         self._parse_test_results_request = parse_test_results_request
+        self._sandbox = sandbox
+        self._source = source
+        self._mutant_id = mutant_id
+        self._fork_server = fork_server
+        self._result_cache = result_cache
+        self._result_key = result_key
+        self._journal = journal
+        self._journal_key = journal_key
+        self._coordinator = coordinator
+        self._job_id = job_id
+        self._build = build
         super().__init__()
 
     @property
@@ -36,16 +63,105 @@ class RunMutationTestRequest(UseCaseRequest):
     def parse_test_results_request(self) -> ParseTestResultRequest:
         return self._parse_test_results_request
 
+    @property
+    def sandbox(self) -> Sandbox:
+        return self._sandbox
+
+    @property
+    def source(self) -> str:
+        """The already mutated source, if None then the mutation is applied"""
+        return self._source
+
+    @property
+    def mutant_id(self) -> int:
+        """The identifier of the mutant within the already built mutant schemata,
+            if None then the mutant is written and built on its own"""
+        return self._mutant_id
+
+    @property
+    def fork_server(self) -> ForkServer:
+        """The fork server of the built mutant schemata, if None
+            then the test command is run for the mutant"""
+        return self._fork_server
+
+    @property
+    def result_cache(self) -> ResultCache:
+        """The store of the results of previous runs, if None then the mutant is always tested"""
+        return self._result_cache
+
+    @property
+    def result_key(self) -> str:
+        """The key of the result of the mutant within the result cache, computed once"""
+        if self._result_cache is None: return None
+        if self._result_key is None:
+            self._result_key = self._result_cache.key(*self._site())
+        return self._result_key
+
+    @property
+    def journal(self) -> Journal:
+        """The log of the outcomes of the analysis, if None then the outcome is not logged"""
+        return self._journal
+
+    @property
+    def journal_key(self) -> str:
+        """The key of the outcome of the mutant within the journal, computed once"""
+        if self._journal is None: return None
+        if self._journal_key is None:
+            self._journal_key = self._journal.key(*self._site())
+        return self._journal_key
+
+    @property
+    def coordinator(self) -> Coordinator:
+        """The coordinator of the workers, if None then the mutant is tested locally"""
+        return self._coordinator
+
+    @property
+    def job_id(self) -> int:
+        """The job of the mutant queued at the coordinator, whose result a worker sends"""
+        return self._job_id
+
+    @property
+    def build(self) -> BuildMutantSchemataResponse:
+        """The build of the source already written to the sandbox, if None then
+            it is written and built together with the tests"""
+        return self._build
+
+    @property
+    def has_result(self) -> bool:
+        """Whether the mutant already has a result from the journal or the result cache"""
+        return (self._journal is not None and self._journal.contains(self.journal_key)) or \
+            (self._result_cache is not None and self._result_cache.contains(self.result_key))
+
+    def _site(self) -> Tuple[str, int, int, str]:
+        # A mutant is identified by the unit it is within, such
+        #   that changes to other units do not invalidate it
+        node = self._mutation.node
+        unit = node.get_descendent_of_types([ "function_definition" ])
+        unit_start = unit.start_byte if unit is not None else 0
+        unit_source = self._mutation.tree.contents_of(unit) if unit is not None \
+            else self._mutation.tree.text
+        return (
+            unit_source,
+            node.start_byte - unit_start,
+            node.end_byte - unit_start,
+            self._mutation.replacement,
+        )
+
 class RunMutationTestResponse(UseCaseResponse):
     def __init__(
         self,
         candidate: Node,
         mutation: Mutation,
-        test_results: TestResults
+        test_results: TestResults,
+        outcome: MutationOutcome = None,
     ) -> None:
         self._candidate = candidate
         self._test_results = test_results
         self._mutation = mutation
+        if outcome is None:
+            outcome = MutationOutcome.KILLED if test_results.summary.failure_count > 0 \
+                else MutationOutcome.SURVIVED
+        self._outcome = outcome
         super().__init__()
 
     @property
@@ -59,7 +175,36 @@ class RunMutationTestResponse(UseCaseResponse):
     @property
     def test_results(self) -> TestResults:
         return self._test_results
+
+    @property
+    def outcome(self) -> MutationOutcome:
+        return self._outcome
     
+    def encode(self) -> Dict[str, Any]:
+        """The outcome and the test results, as sent by a worker to the coordinator"""
+        summary = self._test_results.summary
+        trace = self._test_results.trace
+        return {
+            "outcome": self._outcome.value,
+            "summary": [ summary.test_count, summary.failure_count, summary.success_count ],
+            "trace": ResultCache.encode_trace(trace),
+            "truncated": trace is not None and trace.truncated,
+            "failed_tests": self._test_results.failed_tests,
+        }
+
+    @staticmethod
+    def decode(mutation: Mutation, result: Dict[str, Any]) -> "RunMutationTestResponse":
+        return RunMutationTestResponse(
+            mutation.node if mutation is not None else None,
+            mutation,
+            TestResults(
+                TestSummary(*result["summary"]),
+                ResultCache.decode_trace(result["trace"], result["truncated"]),
+                result["failed_tests"],
+            ),
+            MutationOutcome(result["outcome"]),
+        )
+
     @property
     def location_visitations(self) -> Dict[str, int]:
         visitations: Dict[str, int] = dict()
@@ -73,26 +218,156 @@ class RunMutationTestUseCase(
     UseCase[RunMutationTestRequest, RunMutationTestResponse]
 ):
     def do(self, request: RunMutationTestRequest) -> RunMutationTestResponse:
-        # Step 1: Create the mutated tree
-        mutated_tree = request.mutation.apply()
+        # Step 0: Reuse the outcome of an interrupted analysis, or
+        #   the result of a previous run of the same mutant
+        if request.journal is not None:
+            journaled = request.journal.get(request.journal_key)
+            if journaled is not None:
+                return RunMutationTestResponse(
+                    request.mutation.node,
+                    request.mutation,
+                    journaled[1],
+                    MutationOutcome(journaled[0]),
+                )
+
+        cached = None
+        if request.result_cache is not None:
+            cached = request.result_cache.get(request.result_key)
+        if cached is not None:
+            response = RunMutationTestResponse(
+                request.mutation.node,
+                request.mutation,
+                cached[1],
+                MutationOutcome(cached[0]),
+            )
+        else:
+            response = self._do(request)
+            if request.result_cache is not None:
+                request.result_cache.put(
+                    request.result_key,
+                    response.outcome.value,
+                    response.test_results,
+                )
+
+        if request.journal is not None:
+            request.journal.put(
+                request.journal_key,
+                response.outcome.value,
+                response.test_results,
+            )
+        return response
+
+    def _do(self, request: RunMutationTestRequest) -> RunMutationTestResponse:
+        if request.job_id is not None:
+            # Step 1-4: A worker built and tested the mutant
+            return RunMutationTestResponse.decode(
+                request.mutation, request.coordinator.result(request.job_id)
+            )
 
-        # Step 2: Write the mutated tree to file
-        file = open(request.file_path, "w")
-        file.write(mutated_tree.text)
-        file.close()
+        # A worker only has the mutated source, not the mutation
+        candidate = request.mutation.node if request.mutation is not None else None
+        run_test_request = request.run_test_request
+        if request.build is not None and not request.build.built:
+            # Step 1-4: The mutant was built beforehand and did not build, such
+            #   that there is nothing to test
+            return RunMutationTestResponse(
+                candidate,
+                request.mutation,
+                TestResults(TestSummary(0, 0, 0), Trace(list())),
+                MutationOutcome.TIMEOUT if request.build.timed_out else MutationOutcome.BUILD_FAILED,
+            )
+        if request.mutant_id is not None:
+            # Step 1-2: The mutant schemata is already built, the
+            #   mutant is only selected by its identifier
+            run_test_request = run_test_request.replace(
+                build_command=None,
+                env=dict(
+                    run_test_request.env or os.environ,
+                    CANARY_MUTANT_ID=str(request.mutant_id)
+                ),
+            )
+        elif request.build is not None:
+            # Step 1-2: The mutated source is already written and built
+            run_test_request = run_test_request.replace(build_command=None)
+        else:
+            # Step 1: Create the mutated tree
+            source = request.source
+            if source is None:
+                source = request.mutation.apply().text
+
+            # Step 2: Write the mutated tree to file
+            if request.sandbox is None:
+                file = open(request.file_path, "w")
+                file.write(source)
+                file.close()
+            else: request.sandbox.write(request.file_path, source)
+
+        if request.sandbox is not None:
+            # The original file is never touched, the build and test
+            #   commands are redirected into the sandbox instead
+            run_test_request = run_test_request.replace(
+                build_command=request.sandbox.command(run_test_request.build_command),
+                test_command=request.sandbox.command(run_test_request.test_command),
+                cwd=request.sandbox.cwd,
+            )
 
         # Step 3: Run tests
-        RunTestUseCase().do(
-            request.run_test_request
-        )
+        parse_test_results_request = request.parse_test_results_request
+        test_results: TestResults = None
+        streamed = False
+        returncode: int = None
+        build_failed = False
+        if request.mutant_id is not None and request.fork_server is not None:
+            # The forked tests can only write their output to a file
+            try:
+                request.fork_server.run(request.mutant_id, parse_test_results_request.file_path)
+                timed_out = False
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                if not parse_test_results_request.keep and \
+                    os.path.isfile(parse_test_results_request.file_path):
+                    os.remove(parse_test_results_request.file_path)
+        else:
+            run_test_response = RunTestUseCase().do(run_test_request)
+            timed_out = run_test_response.timed_out
+            test_results = run_test_response.test_results
+            streamed = run_test_request.results_parser is not None
+            returncode = run_test_response.returncode
+            build_failed = run_test_response.build_failed
 
-        # Step 4: Analyse the test results
-        parse_test_results_response = ParseTestResultUseCase().do(
-            request.parse_test_results_request
-        )
+        # Step 4: Analyse the test results, the output of a timed out
+        #   mutant is incomplete and its trace may be unbounded
+        if timed_out:
+            return RunMutationTestResponse(
+                candidate,
+                request.mutation,
+                TestResults(TestSummary(0, 0, 0), Trace(list())),
+                MutationOutcome.TIMEOUT,
+            )
+        if build_failed:
+            # The tests did not run, as they would have tested the previous build
+            return RunMutationTestResponse(
+                candidate,
+                request.mutation,
+                TestResults(TestSummary(0, 0, 0), Trace(list())),
+                MutationOutcome.BUILD_FAILED,
+            )
+        if test_results is None and streamed:
+            # The tests ended without a summary, such as a crashed mutant. Its
+            #   output was only streamed, not written, so the return code decides
+            return RunMutationTestResponse(
+                candidate,
+                request.mutation,
+                TestResults(TestSummary(0, 0, 0), Trace(list())),
+                MutationOutcome.KILLED if returncode != 0 else MutationOutcome.SURVIVED,
+            )
+        if test_results is None:
+            test_results = ParseTestResultUseCase().do(
+                parse_test_results_request
+            ).test_results
 
         return RunMutationTestResponse(
-            request.mutation.node,
+            candidate,
             request.mutation,
-            parse_test_results_response.test_results,
+            test_results,
         )
@@ -0,0 +1,484 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from execution import Coordinator, Sandbox, SandboxPool, ForkServer
+from mutator import MutantSchemata
+from .use_case import UseCaseRequest, UseCaseResponse, UseCase
+from .build_mutant_schemata import BuildMutantSchemataRequest, BuildMutantSchemataResponse, BuildMutantSchemataUseCase
+from .run_subprocess import RunSubsystemUseCase
+from .run_mutation_test import RunMutationTestRequest, RunMutationTestResponse, RunMutationTestUseCase
+from .run_mutant_job import RunMutantJobRequest
+
+class RunMutationTestsRequest(UseCaseRequest):
+    def __init__(
+        self,
+        requests: List[RunMutationTestRequest],
+        sandbox_pool: SandboxPool = None,
+        schemata: bool = False,
+        fork_server: bool = False,
+        coordinator: Coordinator = None,
+        split_locations: List[str] = None,
+        pipeline: bool = False,
+    ) -> None:
+        self._requests = requests
+        self._sandbox_pool = sandbox_pool
+        self._schemata = schemata
+        self._fork_server = fork_server
+        self._coordinator = coordinator
+        self._split_locations = split_locations
+        self._pipeline = pipeline
+        super().__init__()
+
+    @property
+    def requests(self) -> List[RunMutationTestRequest]:
+        return self._requests
+
+    @property
+    def sandbox_pool(self) -> SandboxPool:
+        return self._sandbox_pool
+
+    @property
+    def schemata(self) -> bool:
+        """Whether the mutants are built once as a mutant schemata"""
+        return self._schemata
+
+    @property
+    def fork_server(self) -> bool:
+        """Whether the mutants of the schemata are forked from a single test process"""
+        return self._fork_server
+
+    @property
+    def coordinator(self) -> Coordinator:
+        """The coordinator of the workers, if set then the workers build and test the mutants"""
+        return self._coordinator
+
+    @property
+    def split_locations(self) -> List[str]:
+        """The location of each mutant, in the same order as the requests. If set then the
+            mutants are built as a mutant schemata, and the tests of the mutants of a
+            location are forked from a single test process once it reaches the location"""
+        return self._split_locations
+
+    @property
+    def pipeline(self) -> bool:
+        """Whether the next mutant is built while the current one is tested, each in
+            a sandbox of their own"""
+        return self._pipeline
+
+class RunMutationTestsResponse(UseCaseResponse):
+    def __init__(
+        self,
+        responses: List[RunMutationTestResponse],
+    ) -> None:
+        self._responses = responses
+        super().__init__()
+
+    @property
+    def responses(self) -> List[RunMutationTestResponse]:
+        """The responses in the same order as the requests"""
+        return self._responses
+
+class RunMutationTestsUseCase(
+    UseCase[RunMutationTestsRequest, RunMutationTestsResponse]
+):
+    def do(self, request: RunMutationTestsRequest) -> RunMutationTestsResponse:
+        # Step 0: The mutants with a result of a previous run are neither built nor tested
+        cached_indices = [
+            r_idx for r_idx, mutation_test_request in enumerate(request.requests)
+            if mutation_test_request.has_result
+        ]
+        if len(cached_indices) > 0:
+            uncached_indices = [
+                r_idx for r_idx in range(len(request.requests))
+                if r_idx not in set(cached_indices)
+            ]
+            uncached_responses = self.do(
+                RunMutationTestsRequest(
+                    [ request.requests[r_idx] for r_idx in uncached_indices ],
+                    request.sandbox_pool,
+                    request.schemata,
+                    request.fork_server,
+                    request.coordinator,
+                    [ request.split_locations[r_idx] for r_idx in uncached_indices ]
+                        if request.split_locations is not None else None,
+                    request.pipeline,
+                )
+            ).responses
+            responses: List[RunMutationTestResponse] = [ None ] * len(request.requests)
+            for r_idx in cached_indices:
+                responses[r_idx] = RunMutationTestUseCase().do(request.requests[r_idx])
+            for r_idx, response in zip(uncached_indices, uncached_responses):
+                responses[r_idx] = response
+            return RunMutationTestsResponse(responses)
+
+        if request.coordinator is not None:
+            return RunMutationTestsResponse(
+                self._run_remotely(request.requests, request.coordinator)
+            )
+
+        split_stream = request.split_locations is not None
+        if not (request.schemata or split_stream) or len(request.requests) == 0:
+            return RunMutationTestsResponse(
+                self._run(request.requests, request.sandbox_pool, pipeline=request.pipeline)
+            )
+
+        # Step 1: Combine every mutant of the file into a mutant schemata,
+        #   the mutants which cannot be combined are built on their own
+        first = request.requests[0]
+        schemata = MutantSchemata(first.mutation.parser, first.mutation.tree)
+        mutant_ids: Dict[int, int] = dict()
+        for r_idx, mutation_test_request in enumerate(request.requests):
+            if mutation_test_request.file_path != first.file_path: continue
+            mutant_id = schemata.add(mutation_test_request.mutation)
+            if mutant_id is not None: mutant_ids[r_idx] = mutant_id
+
+        # Step 2: Build the mutant schemata once, if it does not
+        #   build then every mutant is built on its own instead
+        if len(mutant_ids) > 0 and not self._build(
+            schemata, first, request.sandbox_pool
+        ): mutant_ids = dict()
+
+        # Step 3-4: Run the mutants of the schemata before the others,
+        #   as those replace the schemata when building
+        schemata_indices = list(mutant_ids)
+        other_indices = [
+            r_idx for r_idx in range(len(request.requests))
+            if r_idx not in mutant_ids
+        ]
+        if split_stream:
+            schemata_responses = self._run_split(
+                request, schemata_indices, mutant_ids, first
+            )
+        else:
+            schemata_responses = self._run_forked(
+                request, schemata_indices, mutant_ids, first, request.fork_server
+            )
+        other_responses = self._run(
+            [ request.requests[r_idx] for r_idx in other_indices ],
+            request.sandbox_pool,
+            pipeline=request.pipeline,
+        )
+
+        responses: List[RunMutationTestResponse] = [ None ] * len(request.requests)
+        for r_idx, response in zip(schemata_indices, schemata_responses):
+            responses[r_idx] = response
+        for r_idx, response in zip(other_indices, other_responses):
+            responses[r_idx] = response
+        return RunMutationTestsResponse(responses)
+
+    def _run_forked(
+        self,
+        request: RunMutationTestsRequest,
+        indices: List[int],
+        mutant_ids: Dict[int, int],
+        first: RunMutationTestRequest,
+        fork_server: bool,
+        split_location: str = None,
+    ) -> List[RunMutationTestResponse]:
+        # Step 3: Start the test processes the mutants of the schemata are forked from
+        fork_servers: Dict[Sandbox, ForkServer] = dict()
+        if len(indices) > 0 and fork_server:
+            fork_servers = self._start_fork_servers(
+                first, request.sandbox_pool, split_location
+            )
+
+        # Step 4: Run the mutants of the schemata
+        try:
+            return self._run(
+                [
+                    self._select(
+                        request.requests[r_idx],
+                        mutant_ids[r_idx],
+                        fork_servers.get(None),
+                    )
+                    for r_idx in indices
+                ],
+                request.sandbox_pool,
+                fork_servers,
+            )
+        finally:
+            for started in fork_servers.values():
+                started.stop()
+
+    def _run_split(
+        self,
+        request: RunMutationTestsRequest,
+        indices: List[int],
+        mutant_ids: Dict[int, int],
+        first: RunMutationTestRequest,
+    ) -> List[RunMutationTestResponse]:
+        """Runs the mutants of each location split-stream, the tests run the original
+            program up to the location once, after which they fork for every mutant.
+            The mutants without a location run the whole tests instead.
+        """
+        groups: Dict[str, List[int]] = dict()
+        for r_idx in indices:
+            groups.setdefault(request.split_locations[r_idx], list()).append(r_idx)
+
+        responses: Dict[int, RunMutationTestResponse] = dict()
+        for location, group in groups.items():
+            group_responses = self._run_forked(
+                request, group, mutant_ids, first, location is not None, location
+            )
+            for r_idx, response in zip(group, group_responses):
+                responses[r_idx] = response
+        return [ responses[r_idx] for r_idx in indices ]
+
+    def _build(
+        self,
+        schemata: MutantSchemata,
+        request: RunMutationTestRequest,
+        sandbox_pool: SandboxPool,
+    ) -> bool:
+        source = schemata.apply().text
+        build_command = request.run_test_request.build_command
+        env = request.run_test_request.env
+        timeout = request.run_test_request.build_timeout
+        if sandbox_pool is None:
+            return BuildMutantSchemataUseCase().do(
+                BuildMutantSchemataRequest(
+                    source, request.file_path, build_command, env=env, timeout=timeout
+                )
+            ).built
+
+        # Every sandbox must hold the schemata, as any of them may run any mutant
+        with ThreadPoolExecutor(max_workers=sandbox_pool.size) as executor:
+            responses = executor.map(
+                lambda sandbox: BuildMutantSchemataUseCase().do(
+                    BuildMutantSchemataRequest(
+                        source, request.file_path, build_command, sandbox, env, timeout
+                    )
+                ),
+                sandbox_pool.sandboxes
+            )
+            return all(response.built for response in responses)
+
+    def _start_fork_servers(
+        self,
+        request: RunMutationTestRequest,
+        sandbox_pool: SandboxPool,
+        split_location: str = None,
+    ) -> Dict[Sandbox, ForkServer]:
+        """Starts a fork server for every build of the schemata, keyed by their sandbox.
+            The builds without a fork server run the test command for every mutant.
+        """
+        test_command = request.run_test_request.test_command
+        timeout = request.run_test_request.test_timeout or RunSubsystemUseCase.DEFAULT_TIMEOUT
+        fork_servers: Dict[Sandbox, ForkServer] = dict()
+        if sandbox_pool is None:
+            fork_servers[None] = ForkServer(
+                test_command, request.run_test_request.cwd, timeout, split_location
+            )
+        else:
+            for sandbox in sandbox_pool.sandboxes:
+                fork_servers[sandbox] = ForkServer(
+                    sandbox.command(test_command), sandbox.cwd, timeout, split_location
+                )
+
+        started: Dict[Sandbox, ForkServer] = dict()
+        for sandbox, fork_server in fork_servers.items():
+            try:
+                fork_server.start()
+                started[sandbox] = fork_server
+            except Exception as excep:
+                print(f"Running mutants without a fork server :: {excep}")
+        return started
+
+    def _select(
+        self,
+        request: RunMutationTestRequest,
+        mutant_id: int,
+        fork_server: ForkServer = None,
+    ) -> RunMutationTestRequest:
+        return RunMutationTestRequest(
+            request.mutation,
+            request.file_path,
+            request.run_test_request,
+            request.parse_test_results_request,
+            request.sandbox,
+            mutant_id=mutant_id,
+            fork_server=fork_server,
+            result_cache=request.result_cache,
+            result_key=request.result_key,
+            journal=request.journal,
+            journal_key=request.journal_key,
+        )
+
+    def _run(
+        self,
+        requests: List[RunMutationTestRequest],
+        sandbox_pool: SandboxPool,
+        fork_servers: Dict[Sandbox, ForkServer] = None,
+        pipeline: bool = False,
+    ) -> List[RunMutationTestResponse]:
+        if sandbox_pool is None:
+            return [
+                RunMutationTestUseCase().do(mutation_test_request)
+                for mutation_test_request in requests
+            ]
+        if pipeline and sandbox_pool.size >= 2 and \
+            all(mutation_test_request.mutant_id is None for mutation_test_request in requests):
+            return self._run_pipelined(requests, sandbox_pool)
+
+        # Step 1: Apply the mutations up front, as the parser
+        #   and the trees are not shared between the workers
+        sources: List[str] = [
+            mutation_test_request.mutation.apply().text
+            if mutation_test_request.mutant_id is None else None
+            for mutation_test_request in requests
+        ]
+
+        # Step 2: Run every mutant in the first available sandbox
+        with ThreadPoolExecutor(max_workers=sandbox_pool.size) as executor:
+            futures = [
+                executor.submit(
+                    self._run_in_sandbox,
+                    sandbox_pool,
+                    mutation_test_request,
+                    source,
+                    fork_servers or dict(),
+                )
+                for mutation_test_request, source in zip(requests, sources)
+            ]
+            return [ future.result() for future in futures ]
+
+    def _run_pipelined(
+        self,
+        requests: List[RunMutationTestRequest],
+        sandbox_pool: SandboxPool,
+    ) -> List[RunMutationTestResponse]:
+        """Builds the next mutant in one sandbox while the current mutant is tested in
+            the other. The mutants are tested in order, on the calling thread."""
+        sources: List[str] = [
+            mutation_test_request.mutation.apply().text
+            for mutation_test_request in requests
+        ]
+        sandboxes = [ sandbox_pool.acquire(), sandbox_pool.acquire() ]
+        responses: List[RunMutationTestResponse] = list()
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                building = None
+                if len(requests) > 0:
+                    building = executor.submit(self._build_in_sandbox, requests[0], sources[0], sandboxes[0])
+                for r_idx, mutation_test_request in enumerate(requests):
+                    build = building.result()
+                    # The other sandbox is free, as the previous mutant finished testing
+                    if r_idx + 1 < len(requests):
+                        building = executor.submit(
+                            self._build_in_sandbox,
+                            requests[r_idx + 1],
+                            sources[r_idx + 1],
+                            sandboxes[(r_idx + 1) % 2],
+                        )
+                    responses.append(self._test_in_sandbox(
+                        mutation_test_request, sources[r_idx], sandboxes[r_idx % 2], build
+                    ))
+        finally:
+            for sandbox in sandboxes: sandbox_pool.release(sandbox)
+        return responses
+
+    def _build_in_sandbox(
+        self,
+        request: RunMutationTestRequest,
+        source: str,
+        sandbox: Sandbox,
+    ) -> BuildMutantSchemataResponse:
+        run_test_request = request.run_test_request
+        return BuildMutantSchemataUseCase().do(
+            BuildMutantSchemataRequest(
+                source,
+                request.file_path,
+                run_test_request.build_command,
+                sandbox,
+                run_test_request.env,
+                run_test_request.build_timeout,
+            )
+        )
+
+    def _test_in_sandbox(
+        self,
+        request: RunMutationTestRequest,
+        source: str,
+        sandbox: Sandbox,
+        build: BuildMutantSchemataResponse,
+    ) -> RunMutationTestResponse:
+        # A mutant which did not build is not tested, such that its outcome
+        #   does not depend on what the failed build left in the sandbox
+        return RunMutationTestUseCase().do(
+            RunMutationTestRequest(
+                request.mutation,
+                request.file_path,
+                request.run_test_request,
+                request.parse_test_results_request,
+                sandbox,
+                source,
+                result_cache=request.result_cache,
+                result_key=request.result_key,
+                journal=request.journal,
+                journal_key=request.journal_key,
+                build=build,
+            )
+        )
+
+    def _run_remotely(
+        self,
+        requests: List[RunMutationTestRequest],
+        coordinator: Coordinator,
+    ) -> List[RunMutationTestResponse]:
+        # Step 1: Queue every mutant up front, such that all the workers are kept busy
+        job_ids: List[int] = [
+            coordinator.submit(
+                RunMutantJobRequest.encode(
+                    coordinator.base,
+                    mutation_test_request.file_path,
+                    mutation_test_request.source or mutation_test_request.mutation.apply().text,
+                    mutation_test_request.run_test_request,
+                )
+            )
+            for mutation_test_request in requests
+        ]
+
+        # Step 2: Wait for the results in order, which are journaled as they are taken
+        return [
+            RunMutationTestUseCase().do(
+                RunMutationTestRequest(
+                    mutation_test_request.mutation,
+                    mutation_test_request.file_path,
+                    mutation_test_request.run_test_request,
+                    mutation_test_request.parse_test_results_request,
+                    result_cache=mutation_test_request.result_cache,
+                    result_key=mutation_test_request.result_key,
+                    journal=mutation_test_request.journal,
+                    journal_key=mutation_test_request.journal_key,
+                    coordinator=coordinator,
+                    job_id=job_id,
+                )
+            )
+            for mutation_test_request, job_id in zip(requests, job_ids)
+        ]
+
+    def _run_in_sandbox(
+        self,
+        sandbox_pool: SandboxPool,
+        request: RunMutationTestRequest,
+        source: str,
+        fork_servers: Dict[Sandbox, ForkServer],
+    ) -> RunMutationTestResponse:
+        sandbox = sandbox_pool.acquire()
+        try:
+            return RunMutationTestUseCase().do(
+                RunMutationTestRequest(
+                    request.mutation,
+                    request.file_path,
+                    request.run_test_request,
+                    request.parse_test_results_request,
+                    sandbox,
+                    source,
+                    request.mutant_id,
+                    fork_servers.get(sandbox),
+                    request.result_cache,
+                    request.result_key,
+                    request.journal,
+                    request.journal_key,
+                )
+            )
+        finally: sandbox_pool.release(sandbox)
@@ -1,5 +1,9 @@
+import os
+import signal
 import subprocess
-from typing import IO, Any
+import threading
+from typing import IO, Any, Callable, Dict
+from execution import AsyncRunner
 from .use_case import *
 
 class RunSubsystemRequest(UseCaseRequest):
@@ -8,11 +12,15 @@ class RunSubsystemRequest(UseCaseRequest):
         command: str,
         input: Any = None,
         capture_output: bool = False,
-        timeout: int = None,
+        timeout: float = None,
         check: bool = False,
         stdin: IO[Any] = None,
         stdout: IO[Any] = None,
         stderr: IO[Any] = None,
+        cwd: str = None,
+        env: Dict[str, str] = None,
+        abort: Callable[[str], bool] = None,
+        output: Callable[[str], None] = None,
     ) -> None:
         self._command = command
         self._input = input
@@ -22,6 +30,10 @@ class RunSubsystemRequest(UseCaseRequest):
         self._stdin = stdin
         self._stdout = stdout
         self._stderr = stderr
+        self._cwd = cwd
+        self._env = env
+        self._abort = abort
+        self._output = output
         super().__init__()
 
     @property
@@ -37,7 +49,8 @@ class RunSubsystemRequest(UseCaseRequest):
         return self._capture_output
 
     @property
-    def timeout(self) -> int:
+    def timeout(self) -> float:
+        """The timeout in seconds, if None then the default timeout is used"""
         return self._timeout
 
     @property
@@ -56,17 +69,123 @@ class RunSubsystemRequest(UseCaseRequest):
     def stderr(self) -> IO[Any]:
         return self._stderr
 
-class RunSubsystemResponse(UseCaseResponse): pass
+    @property
+    def cwd(self) -> str:
+        return self._cwd
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """The environment of the subprocess, if None then it is inherited"""
+        return self._env
+
+    @property
+    def abort(self) -> Callable[[str], bool]:
+        """Called with every line of the output, once it returns True the
+            subprocess and its children are killed. The stderr is merged into
+            the stdout when set."""
+        return self._abort
+
+    @property
+    def output(self) -> Callable[[str], None]:
+        """Called with every line of the output as it is produced, without its
+            newline. The stderr is merged into the stdout when set."""
+        return self._output
+
+class RunSubsystemResponse(UseCaseResponse):
+    def __init__(self, returncode: int, aborted: bool = False) -> None:
+        self._returncode = returncode
+        self._aborted = aborted
+        super().__init__()
+
+    @property
+    def returncode(self) -> int:
+        return self._returncode
+
+    @property
+    def aborted(self) -> bool:
+        return self._aborted
 
 class RunSubsystemUseCase(
     UseCase[RunSubsystemRequest, RunSubsystemResponse]
 ):
+    # The timeout in seconds of subprocesses without a timeout of their own
+    DEFAULT_TIMEOUT = 10
+    # The event loop every subprocess runs on, if None then each blocks a thread of its own
+    RUNNER: AsyncRunner = None
+
+    @staticmethod
+    def use(runner: AsyncRunner) -> None:
+        """Runs the subprocesses of every use case on the runner, None to run them blocking again"""
+        RunSubsystemUseCase.RUNNER = runner
+
     def do(self, request: RunSubsystemRequest) -> RunSubsystemResponse:
-        subprocess.run(
+        timeout = request.timeout
+        if timeout is None: timeout = RunSubsystemUseCase.DEFAULT_TIMEOUT
+        if RunSubsystemUseCase.RUNNER is not None:
+            returncode, aborted = RunSubsystemUseCase.RUNNER.run(
+                request.command.split(),
+                request.cwd,
+                request.env,
+                timeout,
+                request.stdout,
+                request.stderr,
+                request.output,
+                request.abort,
+            )
+            return RunSubsystemResponse(returncode, aborted)
+        if request.abort is not None or request.output is not None:
+            return self._stream(request, timeout)
+
+        completed = subprocess.run(
             # If we dont split it will attempt to open it as a file
             request.command.split(),
             stdout=request.stdout,
             stderr=request.stderr,
-            timeout=10
+            cwd=request.cwd,
+            env=request.env,
+            timeout=timeout
         )
-        return RunSubsystemResponse()
+        return RunSubsystemResponse(completed.returncode)
+
+    def _stream(self, request: RunSubsystemRequest, timeout: float) -> RunSubsystemResponse:
+        # A session of its own, such that the whole process group can be killed
+        process = subprocess.Popen(
+            request.command.split(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=request.cwd,
+            env=request.env,
+            text=True,
+            errors="replace",
+            start_new_session=True,
+        )
+        timed_out = threading.Event()
+        def expire() -> None:
+            timed_out.set()
+            self._kill(process)
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+
+        aborted = False
+        try:
+            for line in process.stdout:
+                if hasattr(request.stdout, "write"):
+                    request.stdout.write(line)
+                line = line.rstrip("\n")
+                if request.output is not None:
+                    request.output(line)
+                if request.abort is not None and request.abort(line):
+                    aborted = True
+                    self._kill(process)
+                    break
+            process.stdout.close()
+            process.wait()
+        finally: timer.cancel()
+
+        if timed_out.is_set() and not aborted:
+            raise subprocess.TimeoutExpired(request.command, timeout)
+        return RunSubsystemResponse(process.returncode, aborted)
+
+    def _kill(self, process: subprocess.Popen) -> None:
+        try: os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError: pass
@@ -1,4 +1,7 @@
-from typing import IO, Any, Union
+import os
+import time
+from typing import IO, Any, Dict, Union
+from test_results_parsing import ResultsParser, TestResults
 from .use_case import *
 from .run_subprocess import *
 
@@ -8,10 +11,24 @@ class RunTestRequest(UseCaseRequest):
         build_command: str,
         test_command: str,
         out: Union[str, IO[Any]] = None,
+        cwd: str = None,
+        env: Dict[str, str] = None,
+        early_abort: ResultsParser = None,
+        build_timeout: float = None,
+        test_timeout: float = None,
+        results_parser: ResultsParser = None,
+        max_trace_length: int = None,
     ) -> None:
         self._build_command = build_command
         self._test_command = test_command
         self._out = out
+        self._cwd = cwd
+        self._env = env
+        self._early_abort = early_abort
+        self._build_timeout = build_timeout
+        self._test_timeout = test_timeout
+        self._results_parser = results_parser
+        self._max_trace_length = max_trace_length
         super().__init__()
 
     @property
@@ -24,9 +41,105 @@ class RunTestRequest(UseCaseRequest):
 
     @property
     def out(self) -> Union[str, IO[Any]]:
+        """Where the output of the tests is written. If None, the output is discarded
+            when it is parsed as it is produced, and otherwise inherited"""
         return self._out
 
-class RunTestResponse(UseCaseResponse): pass
+    @property
+    def cwd(self) -> str:
+        return self._cwd
+
+    @property
+    def env(self) -> Dict[str, str]:
+        return self._env
+
+    @property
+    def early_abort(self) -> ResultsParser:
+        """The parser detecting failed tests in the output, if set then the
+            tests are killed as soon as one of them fails"""
+        return self._early_abort
+
+    @property
+    def build_timeout(self) -> float:
+        return self._build_timeout
+
+    @property
+    def test_timeout(self) -> float:
+        return self._test_timeout
+
+    @property
+    def results_parser(self) -> ResultsParser:
+        """The parser of the output of the tests, if set then the output is
+            parsed as it is produced instead of after the tests finished"""
+        return self._results_parser
+
+    @property
+    def max_trace_length(self) -> int:
+        return self._max_trace_length
+
+    def replace(self, **changes: Any) -> "RunTestRequest":
+        """A copy of the request, with the given arguments of its constructor replaced"""
+        arguments: Dict[str, Any] = {
+            "build_command": self._build_command,
+            "test_command": self._test_command,
+            "out": self._out,
+            "cwd": self._cwd,
+            "env": self._env,
+            "early_abort": self._early_abort,
+            "build_timeout": self._build_timeout,
+            "test_timeout": self._test_timeout,
+            "results_parser": self._results_parser,
+            "max_trace_length": self._max_trace_length,
+        }
+        arguments.update(changes)
+        return RunTestRequest(**arguments)
+
+class RunTestResponse(UseCaseResponse):
+    def __init__(
+        self,
+        build_duration: float,
+        test_duration: float,
+        timed_out: bool = False,
+        test_results: TestResults = None,
+        returncode: int = None,
+        build_failed: bool = False,
+    ) -> None:
+        self._build_duration = build_duration
+        self._test_duration = test_duration
+        self._timed_out = timed_out
+        self._test_results = test_results
+        self._returncode = returncode
+        self._build_failed = build_failed
+        super().__init__()
+
+    @property
+    def build_duration(self) -> float:
+        """The duration of the build in seconds, 0 if there was no build"""
+        return self._build_duration
+
+    @property
+    def test_duration(self) -> float:
+        return self._test_duration
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the build or the tests were killed for exceeding their timeout"""
+        return self._timed_out
+
+    @property
+    def test_results(self) -> TestResults:
+        """The parsed output of the tests, None without a results parser"""
+        return self._test_results
+
+    @property
+    def returncode(self) -> int:
+        """The return code of the tests, None if they timed out or did not run"""
+        return self._returncode
+
+    @property
+    def build_failed(self) -> bool:
+        """Whether the build failed, in which case the tests did not run"""
+        return self._build_failed
 
 class RunTestUseCase(
     UseCase[RunTestRequest, RunTestResponse]
@@ -37,22 +150,60 @@ class RunTestUseCase(
             test_output = open(request.out, 'w+')
         else: test_output = request.out
 
+        stream = None
+        if request.results_parser is not None:
+            stream = request.results_parser.stream(request.max_trace_length)
+
+        # The tests are only ended early if their runner can report the failed test
+        env = request.env
+        abort = None
+        abort_env = request.early_abort.early_abort() if request.early_abort is not None else None
+        if abort_env is not None:
+            env = dict(env if env is not None else os.environ, **abort_env)
+            abort = request.early_abort.is_kill
+
         runner = RunSubsystemUseCase()
-        if request.build_command is not None:
-            build_request = RunSubsystemRequest(
-                request.build_command,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+        build_duration = 0
+        test_duration = 0
+        try:
+            if request.build_command is not None:
+                build_request = RunSubsystemRequest(
+                    request.build_command,
+                    timeout=request.build_timeout,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=request.cwd,
+                    env=request.env,
+                )
+                build_start = time.perf_counter()
+                build_response = runner.do(build_request)
+                build_duration = time.perf_counter() - build_start
+                # The tests would run whatever the last successful build left behind
+                if build_response.returncode != 0:
+                    return RunTestResponse(build_duration, test_duration, build_failed=True)
+
+            test_request = RunSubsystemRequest(
+                request.test_command,
+                timeout=request.test_timeout,
+                stdout=test_output,
+                stderr=test_output,
+                cwd=request.cwd,
+                env=env,
+                abort=abort,
+                output=stream.feed if stream is not None else None,
             )
-            runner.do(build_request)
+            test_start = time.perf_counter()
+            test_response = runner.do(test_request)
+            test_duration = time.perf_counter() - test_start
+        except subprocess.TimeoutExpired:
+            return RunTestResponse(build_duration, test_duration, True)
+        finally:
+            if isinstance(request.out, str):
+                test_output.close()
 
-        test_request = RunSubsystemRequest(
-            request.test_command,
-            stdout=test_output,
-            stderr=test_output,
+        return RunTestResponse(
+            build_duration,
+            test_duration,
+            test_results=stream.finish() if stream is not None else None,
+            returncode=test_response.returncode,
         )
-        runner.do(test_request)
-
-        test_output.close()
-
-        return RunTestResponse()
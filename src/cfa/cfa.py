@@ -1,4 +1,4 @@
-from typing import Dict, Generic, List, Iterable, Tuple
+from typing import Dict, Generic, List, Iterable, Set, Tuple
 from queue import Queue
 from graphviz import Digraph
 
@@ -24,7 +24,7 @@ class CFA(Generic[TCFANode]):
         self._additional_finals = list()
 
     def __contains__(self, node: TCFANode) -> bool:
-        return node in self._nodes
+        return node in self._outgoing_edges
 
     @property
     def node_len(self) -> int:
@@ -50,7 +50,7 @@ class CFA(Generic[TCFANode]):
         return finals
 
     def add_final(self, final: TCFANode, label: str = None) -> bool:
-        if final not in self._nodes: return False
+        if final not in self._outgoing_edges: return False
         self._additional_finals.append((final, label))
         return True
 
@@ -63,12 +63,12 @@ class CFA(Generic[TCFANode]):
         return children
 
     def outgoing_edges(self, source: TCFANode) -> List[CFAEdge[TCFANode]]:
-        if source not in self._nodes:
+        if source not in self._outgoing_edges:
             return list()
         return self._outgoing_edges[source]
 
     def ingoing(self, destination: TCFANode) -> List[TCFANode]:
-        if destination not in self._nodes:
+        if destination not in self._ingoing_edges:
             return list()
         children: List[TCFANode] = list()
         for edge in self._ingoing_edges[destination]:
@@ -79,11 +79,11 @@ class CFA(Generic[TCFANode]):
         return self._ingoing_edges[source]
 
     def branch(self, source: TCFANode, destination: TCFANode, label: str = None) -> None:
-        if source not in self._nodes:
+        if source not in self._outgoing_edges:
             self._nodes.append(source)
             self._outgoing_edges[source] = list()
             self._ingoing_edges[source] = list()
-        if destination not in self._nodes:
+        if destination not in self._outgoing_edges:
             self._nodes.append(destination)
             self._outgoing_edges[destination] = list()
             self._ingoing_edges[destination] = list()
@@ -166,9 +166,9 @@ class CFA(Generic[TCFANode]):
 
     def breadth_first_traverse(self) -> Iterable[TCFANode]:
         queue: Queue[TCFANode] = Queue()
-        visited: List[TCFANode] = list()
+        visited: Set[TCFANode] = set()
         queue.put(self.root)
-        visited.append(self.root)
+        visited.add(self.root)
 
         while not queue.empty():
             current: TCFANode = queue.get()
@@ -176,7 +176,7 @@ class CFA(Generic[TCFANode]):
             for outgoing in self._outgoing_edges[current]:
                 if outgoing.destination not in visited:
                     queue.put(outgoing.destination)
-                    visited.append(outgoing.destination)
+                    visited.add(outgoing.destination)
 
     def all_paths(self) -> List[List[TCFANode]]:
         visited: List[TCFANode] = list()
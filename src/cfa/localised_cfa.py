@@ -1,7 +1,7 @@
 from typing import Iterable, List
 from graphviz import Digraph
 from instrumentation_trace import Trace, Location
-from ts import Tree
+from ts import Node, Tree
 from .cfa import CFA
 from .localised_node import LocalisedNode
 
@@ -57,6 +57,29 @@ class LocalisedCFA(CFA[LocalisedNode]):
                     current = outgoing
                     found_end = False
 
+    def location_of(self, node: Node) -> str:
+        """The location of the innermost CFA node containing the node, None if there is none"""
+        location: str = None
+        size: int = None
+        for cfa_node in self.nodes:
+            if cfa_node.node is None or cfa_node.location is None: continue
+            if cfa_node.node.start_byte > node.start_byte or \
+                cfa_node.node.end_byte < node.end_byte: continue
+            cfa_node_size = cfa_node.node.end_byte - cfa_node.node.start_byte
+            if size is None or cfa_node_size < size:
+                location = cfa_node.location
+                size = cfa_node_size
+        return location
+
+    def slice(self, trace: Trace) -> Trace:
+        """The part of a trace visiting the locations of this CFA, which is that
+            of its unit when the locations are unique between the units"""
+        locations = set(cfa_node.location for cfa_node in self.nodes)
+        return Trace(
+            [ location for location in trace.sequence if location.id in locations ],
+            trace.truncated,
+        )
+
     def split_on_finals(self, trace: Trace) -> List["Trace"]:
         finals = [ node[0].location for node in self.finals ]
         
@@ -1,3 +1,4 @@
 from .generate_tests import *
 from .create_cfg import *
 from .mutation_analysis import *
+from .worker import *
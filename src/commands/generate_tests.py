@@ -74,7 +74,7 @@ def generate_tests(
     infest_program_request = InfestProgramRequest(
         Parser.c(),
         unit_analysis_response.tree,
-        unit_analysis_response.unit_functions,
+        [ unit_function[0] for unit_function in unit_analysis_response.unit_functions ],
         filepath
     )
     InfestProgramUseCase().do(infest_program_request)
@@ -1,8 +1,9 @@
 from shutil import register_unpack_format
+import os
 import time
 from traceback import print_exception
 import traceback
-from typing import Dict
+from typing import Dict, List, Tuple
 from urllib import request
 from application import (
     InitializeSystemRequest,
@@ -21,11 +22,18 @@ from application import (
     MutateAlongAllTracesUseCase,
     MutateRandomlyRequest,
     MutateRandomlyUseCase,
+    MutateSampledRequest,
+    MutateSampledUseCase,
+    RevertRequest,
+    RevertUseCase,
+    RunSubsystemUseCase,
 )
 from cfa import CCFAFactory
 from decorators import LocationDecorator
-from mutator import MutationStrategyFactory
-from test_results_parsing import ResultsParserFactory
+from instrumentation_trace import CoverageMap
+from execution import AsyncRunner, ExecutionContext, Journal, ObjectCache, ResultCache, SandboxPool, Prioritiser, TrivialCompilerEquivalence, Workspace, Coordinator, parse_address, format_address
+from mutator import MutationStrategyFactory, MutationOutcome
+from test_results_parsing import ResultsParserFactory, TestResults
 from ts import (
     Parser,
     LanguageLibrary,
@@ -42,9 +50,214 @@ def mutation_analysis(
     placement_strategy: str = "randomly",
     mutation_strategy: str = "obom",
     unit_whitelist: str = None,
-    unit_blacklist: str = None
+    unit_blacklist: str = None,
+    jobs: int = 1,
+    schemata: bool = False,
+    fork_server: bool = False,
+    object_cache: str = None,
+    object_cache_size: int = 1024,
+    early_abort: bool = False,
+    timeout_multiplier: float = 3.0,
+    timeout_floor: float = 1.0,
+    baseline_timeout: float = 300.0,
+    max_trace_length: int = 1000000,
+    keep_test_output: bool = False,
+    tce: bool = False,
+    tce_flags: str = "-O2",
+    result_cache: str = None,
+    resume: bool = False,
+    test_selection: bool = False,
+    prioritise: bool = False,
+    workspace: str = None,
+    coordinator: str = None,
+    lease_timeout: float = 600.0,
+    async_subprocesses: int = None,
+    weak_mutation: bool = False,
+    sample_margin: float = 0.02,
+    sample_confidence: float = 0.95,
+    sample_budget: int = None,
+    sample_uniform: bool = False,
+    sample_seed: int = None,
+    pipeline: bool = False,
+) -> None:
+    # The outcome of every tested mutant is journaled, such that an interrupted
+    #   analysis is resumed from where it stopped instead of started over
+    journal = Journal(f'{base}/{out}/journal.jsonl')
+    journal.open(resume)
+    if resume:
+        journal.restore()
+
+    # The mutants are built and tested in a copy of the project in memory, the
+    #   journal is kept in the project such that it survives being killed
+    project_workspace = None
+    project_out = f'{base}/{out}'
+    cwd = os.getcwd()
+    if workspace is not None:
+        if base == "":
+            raise Exception("A base directory is required to analyse in a workspace")
+        project_workspace = Workspace(base, workspace)
+        project_workspace.create()
+        build_command = project_workspace.command(build_command)
+        test_command = project_workspace.command(test_command)
+        base = project_workspace.root
+
+    # Compiled objects are shared between the builds of every mutant, unit and run
+    cache = None
+    if object_cache is not None:
+        cache = ObjectCache(object_cache, object_cache_size * 1024 * 1024)
+        cache.create()
+        cache_hits, cache_misses = cache.hits, cache.misses
+
+    # Each parallel worker builds and tests its mutants in a sandbox copy of the base,
+    #   a pipeline builds the next mutant in a second sandbox while the current one tests
+    pipelined = pipeline and jobs == 1
+    sandbox_pool = None
+    if jobs > 1 or pipelined:
+        if base == "":
+            raise Exception("A base directory is required to test mutants in parallel")
+        sandbox_pool = SandboxPool(
+            base,
+            2 if pipelined else jobs,
+            project_workspace.directory if project_workspace is not None else None
+        )
+        sandbox_pool.create()
+
+    # The mutants are built and tested by the workers pulling them from the coordinator
+    mutant_coordinator = None
+    if coordinator is not None:
+        if base == "":
+            raise Exception("A base directory is required to distribute the mutants")
+        mutant_coordinator = Coordinator(parse_address(coordinator), base, lease_timeout)
+        mutant_coordinator.start()
+        print(f"Serving mutants on {format_address(mutant_coordinator.address)}")
+
+    # The builds and tests are supervised by a single event loop instead of a thread each
+    runner = None
+    if async_subprocesses is not None:
+        runner = AsyncRunner(async_subprocesses)
+        RunSubsystemUseCase.use(runner)
+
+    # Mutants compiling to the same object as the original or as another mutant are not tested
+    trivial_compiler_equivalence = TrivialCompilerEquivalence(tce_flags) if tce else None
+
+    # The tests of a mutant which are likely to kill it run first
+    prioritiser = Prioritiser() if prioritise else None
+
+    # The results of previous runs are reused for the mutants of unchanged units
+    results = None
+    if result_cache is not None:
+        results = ResultCache(result_cache)
+        results.open()
+
+    execution = ExecutionContext(
+        sandbox_pool,
+        schemata,
+        fork_server,
+        cache,
+        early_abort,
+        timeout_multiplier,
+        timeout_floor,
+        baseline_timeout,
+        max_trace_length,
+        keep_test_output,
+        trivial_compiler_equivalence,
+        results,
+        journal,
+        test_selection,
+        prioritiser,
+        project_workspace,
+        mutant_coordinator,
+        weak_mutation,
+        # Split-stream places the mutants along the paths as well
+        placement_strategy == "splitstream",
+        pipelined,
+    )
+
+    try:
+        # Commands relative to the working directory run in the workspace as well
+        if project_workspace is not None and project_workspace.cwd is not None:
+            os.chdir(project_workspace.cwd)
+        _mutation_analysis(
+            files,
+            unit,
+            build_command,
+            test_command,
+            out,
+            base,
+            testing_backend,
+            placement_strategy,
+            mutation_strategy,
+            unit_whitelist,
+            unit_blacklist,
+            execution,
+            sample_margin,
+            sample_confidence,
+            sample_budget,
+            sample_uniform,
+            sample_seed,
+        )
+    finally:
+        journal.close()
+        if resume:
+            print(f"Resumed {journal.resumed} mutants from the journal")
+        if sandbox_pool is not None:
+            sandbox_pool.destroy()
+        if runner is not None:
+            RunSubsystemUseCase.use(None)
+            runner.close()
+        if mutant_coordinator is not None:
+            mutant_coordinator.stop()
+            for worker_name, completed in mutant_coordinator.workers.items():
+                print(f"Worker {worker_name} completed {completed} mutants")
+            print(f"Re-queued {mutant_coordinator.queue.requeued} mutants of lost workers")
+        if cache is not None:
+            print(f"Object cache {cache.hits - cache_hits} hits and {cache.misses - cache_misses} misses")
+        if results is not None:
+            print(f"Result cache {results.hits} hits and {results.misses} misses")
+            results.close()
+        if prioritiser is not None:
+            print(f"Test prioritisation killed {prioritiser.killed} mutants", end="")
+            if prioritiser.killed > 0:
+                print(f" after a mean of {prioritiser.mean_tests_executed} tests executed", end="")
+            print()
+        if trivial_compiler_equivalence is not None:
+            compiled = trivial_compiler_equivalence.compiled
+            equivalent = trivial_compiler_equivalence.equivalent
+            duplicate = trivial_compiler_equivalence.duplicate
+            print(f"Trivial compiler equivalence {equivalent} equivalent and {duplicate} duplicate of {compiled} mutants", end="")
+            if compiled > 0:
+                print(f", a hit rate of {(equivalent + duplicate) / compiled}", end="")
+            print()
+        if project_workspace is not None:
+            # Only the reports are kept, the journal was written to the project directly
+            os.chdir(cwd)
+            project_workspace.sync(project_out, [ journal.path ])
+            print(f"Workspace least free space {project_workspace.least_free_space} bytes")
+            project_workspace.destroy()
+
+def _mutation_analysis(
+    files: str,
+    unit: str,
+    build_command: str,
+    test_command: str,
+    out: str,
+    base: str,
+    testing_backend: str,
+    placement_strategy: str,
+    mutation_strategy: str,
+    unit_whitelist: str,
+    unit_blacklist: str,
+    execution: ExecutionContext,
+    sample_margin: float = 0.02,
+    sample_confidence: float = 0.95,
+    sample_budget: int = None,
+    sample_uniform: bool = False,
+    sample_seed: int = None,
 ) -> None:
     for file in files.split():
+        if execution.workspace is not None and execution.workspace.low_on_space:
+            print(f"The workspace {execution.workspace.directory} has only {execution.workspace.free_space} bytes free")
+
         # Step 0: Initialize the system
         initialize_system_request = InitializeSystemRequest()
         InitializeSystemUseCase().do(initialize_system_request)
@@ -57,332 +270,464 @@ def mutation_analysis(
             unit_analysis_of_file_request
         )
         
+        if execution.journal is not None:
+            execution.journal.begin_file(
+                unit_analysis_of_file_request.filepath,
+                unit_analysis_of_file_response.tree.text,
+            )
+
+        # The results of the mutants are only reused while the tests are unchanged
+        if execution.result_cache is not None:
+            execution.result_cache.fingerprint_tests(
+                base,
+                [ unit_analysis_of_file_request.filepath ],
+                [
+                    build_command,
+                    test_command,
+                    testing_backend,
+                    execution.early_abort,
+                    execution.max_trace_length,
+                    execution.timeout_multiplier,
+                    execution.timeout_floor,
+                    execution.test_selection,
+                ],
+            )
+
         whitelist = (unit_whitelist or "").split()
         blacklist = (unit_blacklist or "").split()
 
+        units: List[Tuple[int, str]] = list()
         for u_idx, unit_tuple in enumerate(unit_analysis_of_file_response.unit_functions):
-            try:
-                start_time = time.perf_counter()
-
-                unit_node = unit_tuple[0]
-                unit_name = unit_tuple[1]
-
-                if (len(whitelist) > 0 and unit_name not in whitelist) or \
-                    (len(blacklist) > 0 and unit_name in blacklist):
-                    print(f'Skipping unit {unit_name}')
-                    continue
-                print(f"Unit {unit_name}")
-
-                # Step 2: Instrument the mutable version
-                instrumentation_request = InfestProgramRequest(
-                    Parser.c(),
-                    unit_analysis_of_file_response.tree,
-                    unit_node,
-                    unit_analysis_of_file_request.filepath
-                )
-                instrumentation_response = InfestProgramUseCase().do(
-                    instrumentation_request
-                )
-
-                # Step 3: Instrumented tree unit analysis
-                instrumented_unit_analysis_of_file_request = UnitAnalyseFileRequest(
-                    unit_analysis_of_file_request.filepath, LanguageLibrary.c(), unit_name
-                )
-                instrumented_unit_analysis_of_file_response = UnitAnalyseFileUseCase().do(
-                    instrumented_unit_analysis_of_file_request
-                )
-
-                # Step 4: Get the localised CFG
-                unit_analysis_of_tree_request = UnitAnalyseTreeRequest(
-                    instrumented_unit_analysis_of_file_response.tree,
-                    LanguageLibrary.c(),
-                    unit_analysis_of_file_request.unit
-                )
-                unit_analysis_of_tree_response = UnitAnalyseTreeUseCase().do(
-                    unit_analysis_of_tree_request
-                )
-                instrumented_cfg = CCFAFactory(instrumentation_response.instrumented_tree).create(
-                    unit_analysis_of_tree_response.unit_functions[u_idx][0]
-                )
-                localised_cfg = LocationDecorator(instrumentation_response.instrumented_tree).decorate(
-                    instrumented_cfg
-                )
-
-                # Step 5: Run tests on original program
-                original_test_request = RunTestRequest(
-                    build_command, test_command, f'{base}/{out}/original_test_results.txt'
-                )
-                RunTestUseCase().do(original_test_request)
-
-                # Step 6: Parse test results
-                test_results_parser = ResultsParserFactory().create(
-                    testing_backend
-                )
-                parse_test_results_request = ParseTestResultRequest(
-                    original_test_request.out,
-                    test_results_parser
-                )
-                parse_test_results_response = ParseTestResultUseCase().do(
-                    parse_test_results_request
+            unit_name = unit_tuple[1]
+            if (len(whitelist) > 0 and unit_name not in whitelist) or \
+                (len(blacklist) > 0 and unit_name in blacklist):
+                print(f'Skipping unit {unit_name}')
+                continue
+            units.append((u_idx, unit_name))
+        if len(units) == 0: continue
+
+        try:
+            # Step 2: Instrument every unit at once, such that the original
+            #   program only has to be built and tested once per file
+            instrumentation_request = InfestProgramRequest(
+                Parser.c(),
+                unit_analysis_of_file_response.tree,
+                [ unit_analysis_of_file_response.unit_functions[u_idx][0] for u_idx, _ in units ],
+                unit_analysis_of_file_request.filepath
+            )
+            instrumentation_response = InfestProgramUseCase().do(
+                instrumentation_request
+            )
+
+            # Step 3: Instrumented tree unit analysis
+            instrumented_unit_analysis_of_file_request = UnitAnalyseFileRequest(
+                unit_analysis_of_file_request.filepath, LanguageLibrary.c(), unit
+            )
+            instrumented_unit_analysis_of_file_response = UnitAnalyseFileUseCase().do(
+                instrumented_unit_analysis_of_file_request
+            )
+
+            # Step 4: Find the instrumented units
+            unit_analysis_of_tree_request = UnitAnalyseTreeRequest(
+                instrumented_unit_analysis_of_file_response.tree,
+                LanguageLibrary.c(),
+                unit_analysis_of_file_request.unit
+            )
+            unit_analysis_of_tree_response = UnitAnalyseTreeUseCase().do(
+                unit_analysis_of_tree_request
+            )
+
+            # Step 5: Run tests on original program
+            original_test_request = RunTestRequest(
+                build_command,
+                test_command,
+                f'{base}/{out}/original_test_results.txt',
+                env=execution.env,
+                build_timeout=execution.baseline_timeout,
+                test_timeout=execution.baseline_timeout,
+            )
+            original_test_response = RunTestUseCase().do(original_test_request)
+            if original_test_response.timed_out:
+                raise Exception(
+                    f"The original program did not finish within {execution.baseline_timeout} seconds"
                 )
-
-                # Step 7: Create mutation strategy
-                applied_mutation_strategy = MutationStrategyFactory().create(
-                    mutation_strategy, instrumentation_request.parser
-                )
-
-                if placement_strategy == "randomly":
-                    # Step 7: Mutate 'randomly'
-                    randomly_mutate_request = MutateRandomlyRequest(
-                        instrumented_unit_analysis_of_file_response.unit_functions,
-                        instrumentation_response.instrumented_tree,
-                        instrumentation_request.parser,
-                        applied_mutation_strategy,
-                        build_command,
-                        test_command,
-                        test_results_parser,
-                        unit_analysis_of_file_request.filepath,
-                        out,
-                        base,
+            if original_test_response.build_failed:
+                raise Exception(f"The original program does not build with '{build_command}'")
+            # The mutants are given a multiple of the time the original program took
+            execution.calibrate(
+                original_test_response.build_duration,
+                original_test_response.test_duration,
+            )
+
+            # Step 6: Parse test results
+            test_results_parser = ResultsParserFactory().create(
+                testing_backend
+            )
+            parse_test_results_request = ParseTestResultRequest(
+                original_test_request.out,
+                test_results_parser
+            )
+            parse_test_results_response = ParseTestResultUseCase().do(
+                parse_test_results_request
+            )
+            original_test_results = parse_test_results_response.test_results
+            # The tests of each mutant are selected and ordered by the locations each test visited
+            execution.cover(CoverageMap(original_test_results.trace))
+
+            # Step 7: Create mutation strategy
+            applied_mutation_strategy = MutationStrategyFactory().create(
+                mutation_strategy, instrumentation_request.parser
+            )
+
+            for u_idx, unit_name in units:
+                try:
+                    start_time = time.perf_counter()
+                    print(f"Unit {unit_name}")
+
+                    # Step 8: Get the localised CFG
+                    instrumented_cfg = CCFAFactory(instrumentation_response.instrumented_tree).create(
+                        unit_analysis_of_tree_response.unit_functions[u_idx][0]
                     )
-                    MutateRandomlyUseCase().do(
-                        randomly_mutate_request
-                    )
-                elif placement_strategy == "pathbased":
-                    # Step 7: Get individual unit sequences
-                    unit_traces = localised_cfg.split_on_finals(
-                        parse_test_results_response.test_results.trace
+                    localised_cfg = LocationDecorator(instrumentation_response.instrumented_tree).decorate(
+                        instrumented_cfg
                     )
 
-                    # Step 8: Mutate 'pathbased'
-                    mutate_along_trace_request = MutateAlongAllTracesRequest(
-                        unit_traces,
-                        localised_cfg,
-                        instrumentation_response.instrumented_tree,
-                        instrumentation_request.parser,
-                        applied_mutation_strategy,
-                        build_command,
-                        test_command,
-                        test_results_parser,
-                        unit_analysis_of_file_request.filepath,
-                        out,
-                        base,
-                    )
-                    mutation_start_time = time.perf_counter()
-                    mutate_along_trace_response = MutateAlongAllTracesUseCase().do(
-                        mutate_along_trace_request
+                    # The locations are numbered across the units, such that
+                    #   the part of the trace within this unit can be sliced
+                    unit_test_results = TestResults(
+                        original_test_results.summary,
+                        localised_cfg.slice(original_test_results.trace),
+                        original_test_results.failed_tests,
                     )
-                    mutation_end_time = time.perf_counter()
-                    mutation_duration = mutation_end_time - mutation_start_time
-
-                    results_file = open(f"{mutate_along_trace_request.base}/{mutate_along_trace_request.out}/{unit_name}_{u_idx}.txt", "w")
-                    results_file.write(f"Mutation took {mutation_duration} seconds\n")
 
-                    results_file.write(f"Original execution {len(mutate_along_trace_request.traces)} traces\n")
-
-                    results_file.write("\Visited count\n")
-                    for location in parse_test_results_response.test_results.visitations:
-                        if location == "" or location is None: continue
-                        amount = parse_test_results_response.test_results.visitations[location]
-                        results_file.write(f"{location} was visited {amount} times\n")
-                    results_file.write("\n")
-
-                    results_file.write(f"Visited locations " + ", ".join(mutate_along_trace_response.visited_locations) + "\n")
-                    results_file.write(f"Unvisited locations " + ", ".join(mutate_along_trace_response.unvisited_locations) + "\n")
-                    amount_visited = len(mutate_along_trace_response.visited_locations)
-                    amount_unvisited = len(mutate_along_trace_response.unvisited_locations)
-                    results_file.write(f"Visited {amount_visited}, Unvisted {amount_unvisited}")
-                    if amount_visited + amount_unvisited > 0:
-                        results_file.write(f", percentage visited {amount_visited / (amount_visited + amount_unvisited)}")
-                    results_file.write("\n")
+                    if placement_strategy == "randomly":
+                        # Step 9: Mutate 'randomly'
+                        randomly_mutate_request = MutateRandomlyRequest(
+                            instrumented_unit_analysis_of_file_response.unit_functions[u_idx][0],
+                            instrumentation_response.instrumented_tree,
+                            instrumentation_request.parser,
+                            applied_mutation_strategy,
+                            build_command,
+                            test_command,
+                            test_results_parser,
+                            unit_analysis_of_file_request.filepath,
+                            out,
+                            base,
+                            execution,
+                            localised_cfg,
+                        )
+                        mutation_start_time = time.perf_counter()
+                        mutate_randomly_response = MutateRandomlyUseCase().do(
+                            randomly_mutate_request
+                        )
+                        mutation_duration = time.perf_counter() - mutation_start_time
+
+                        results_file = open(f"{base}/{out}/{unit_name}_{u_idx}.txt", "w")
+                        results_file.write(f"Mutation took {mutation_duration} seconds\n")
+                        results_file.write(f"Candidates {mutate_randomly_response.amount_of_candidates}\n\n")
+                        for mutation_test in mutate_randomly_response.mutation_tests:
+                            results_file.write(f"[{mutation_test.candidate.start_point}, {mutation_test.candidate.end_point}]")
+                            results_file.write(f" {str(mutation_test.mutation)}")
+                            results_file.write(f" :: {mutation_test.outcome.value}\n")
+
+                        results_file.write(f"\nTotal killed {mutate_randomly_response.amount_killed} and {mutate_randomly_response.amount_survived} total survived\n")
+                        results_file.write(f"Total timed out {mutate_randomly_response.amount_timed_out}\n")
+                        results_file.write(f"Total no coverage {mutate_randomly_response.amount_no_coverage}\n")
+                        results_file.write(f"Total not infected {mutate_randomly_response.amount_not_infected}\n")
+                    elif placement_strategy == "sampling":
+                        # Step 9: Mutate a sample of the unit, until its score is known to within the margin
+                        mutate_sampled_request = MutateSampledRequest(
+                            instrumented_unit_analysis_of_file_response.unit_functions[u_idx][0],
+                            instrumentation_response.instrumented_tree,
+                            instrumentation_request.parser,
+                            applied_mutation_strategy,
+                            build_command,
+                            test_command,
+                            test_results_parser,
+                            unit_analysis_of_file_request.filepath,
+                            out,
+                            base,
+                            execution,
+                            localised_cfg,
+                            sample_margin,
+                            sample_confidence,
+                            sample_budget,
+                            not sample_uniform,
+                            sample_seed,
+                        )
+                        mutation_start_time = time.perf_counter()
+                        mutate_sampled_response = MutateSampledUseCase().do(
+                            mutate_sampled_request
+                        )
+                        mutation_duration = time.perf_counter() - mutation_start_time
+
+                        results_file = open(f"{base}/{out}/{unit_name}_{u_idx}.txt", "w")
+                        results_file.write(f"Mutation took {mutation_duration} seconds\n")
+                        results_file.write(f"Sampled {len(mutate_sampled_response.mutation_tests)} of {mutate_sampled_response.amount_of_mutants} mutants\n\n")
+                        for mutation_test in mutate_sampled_response.mutation_tests:
+                            results_file.write(f"[{mutation_test.candidate.start_point}, {mutation_test.candidate.end_point}]")
+                            results_file.write(f" {str(mutation_test.mutation)}")
+                            results_file.write(f" :: {mutation_test.outcome.value}\n")
+
+                        results_file.write(f"\nTotal killed {mutate_sampled_response.amount_killed} and {mutate_sampled_response.amount_survived} total survived\n")
+                        if mutate_sampled_response.score is not None:
+                            lower, upper = mutate_sampled_response.interval
+                            results_file.write(f"Estimated mutation score {mutate_sampled_response.score}")
+                            results_file.write(f", with a {sample_confidence * 100:g}% confidence interval of [{lower}, {upper}]\n")
+                    elif placement_strategy in [ "pathbased", "splitstream" ]:
+                        # Step 9: Get individual unit sequences
+                        unit_traces = localised_cfg.split_on_finals(
+                            unit_test_results.trace
+                        )
+
+                        # Step 10: Mutate 'pathbased'
+                        mutate_along_trace_request = MutateAlongAllTracesRequest(
+                            unit_traces,
+                            localised_cfg,
+                            instrumentation_response.instrumented_tree,
+                            instrumentation_request.parser,
+                            applied_mutation_strategy,
+                            build_command,
+                            test_command,
+                            test_results_parser,
+                            unit_analysis_of_file_request.filepath,
+                            out,
+                            base,
+                            execution,
+                        )
+                        mutation_start_time = time.perf_counter()
+                        mutate_along_trace_response = MutateAlongAllTracesUseCase().do(
+                            mutate_along_trace_request
+                        )
+                        mutation_end_time = time.perf_counter()
+                        mutation_duration = mutation_end_time - mutation_start_time
+
+                        results_file = open(f"{mutate_along_trace_request.base}/{mutate_along_trace_request.out}/{unit_name}_{u_idx}.txt", "w")
+                        results_file.write(f"Mutation took {mutation_duration} seconds\n")
+
+                        results_file.write(f"Original execution {len(mutate_along_trace_request.traces)} traces\n")
+
+                        results_file.write("\Visited count\n")
+                        for location in unit_test_results.visitations:
+                            if location == "" or location is None: continue
+                            amount = unit_test_results.visitations[location]
+                            results_file.write(f"{location} was visited {amount} times\n")
+                        results_file.write("\n")
+
+                        results_file.write(f"Visited locations " + ", ".join(mutate_along_trace_response.visited_locations) + "\n")
+                        results_file.write(f"Unvisited locations " + ", ".join(mutate_along_trace_response.unvisited_locations) + "\n")
+                        amount_visited = len(mutate_along_trace_response.visited_locations)
+                        amount_unvisited = len(mutate_along_trace_response.unvisited_locations)
+                        results_file.write(f"Visited {amount_visited}, Unvisted {amount_unvisited}")
+                        if amount_visited + amount_unvisited > 0:
+                            results_file.write(f", percentage visited {amount_visited / (amount_visited + amount_unvisited)}")
+                        results_file.write("\n")
+
+                        results_file.write("\n")
+
+                        results_file.write(f"Visited nodes {len(mutate_along_trace_response.visited_nodes)}\n")
+                        results_file.write(f"Unvisited nodes {len(mutate_along_trace_response.unvisited_nodes)}\n")
+                        nodes_total = len(mutate_along_trace_response.visited_nodes) + len(mutate_along_trace_response.unvisited_nodes)
+                        if nodes_total > 0:
+                            results_file.write(f"Percentage visited {len(mutate_along_trace_response.visited_nodes) / nodes_total}\n")
+
+                        results_file.write("\n")
+
+                        results_file.write(f"Visited candidates {mutate_along_trace_response.visited_candidates}\n")
+                        results_file.write(f"Unvisited candidates {mutate_along_trace_response.unvisited_candidates}\n")
+                        candidates_total = mutate_along_trace_response.visited_candidates + mutate_along_trace_response.unvisited_candidates
+                        if candidates_total > 0:
+                            results_file.write(f"Percentage visited {mutate_along_trace_response.visited_candidates / candidates_total}\n")
+
+                        results_file.write("\n")
+
+                        results_file.write(f"Tested mutations {mutate_along_trace_response.visited_mutations}\n")
+                        results_file.write(f"Untested mutations {mutate_along_trace_response.unvisited_mutations}\n")
+                        mutations_total = mutate_along_trace_response.visited_mutations + mutate_along_trace_response.unvisited_mutations
+                        if mutations_total > 0:
+                            results_file.write(f"Percentage visited {mutate_along_trace_response.visited_mutations / mutations_total}\n")
+
+                        all_locations_total_killed = 0
+                        all_locations_total_survied = 0
+                        all_locations_total_equivalent = 0
+                        total_if_conditional_killed = 0
+                        total_if_conditional_survived = 0
+                        total_for_initilisation_killed = 0
+                        total_for_initilisation_survived = 0
+                        total_for_condition_killed = 0
+                        total_for_condition_survived = 0
+                        total_for_update_killed = 0
+                        total_for_update_survived = 0
+                        total_do_while_condition_killed = 0
+                        total_do_while_condition_survived = 0
+                        total_while_condition_killed = 0
+                        total_while_condition_survived = 0
+                        total_switch_condition_killed = 0
+                        total_switch_condition_survived = 0
+                        c_syntax = LanguageLibrary.c().syntax
+                        for visited_locaiton in mutate_along_trace_response.visited_locations:
+                            results_file.write(f"\nLocation {visited_locaiton}\n")
+                            if len(mutate_along_trace_response.random_mutations_runs) == 0:
+                                results_file.write("No runs\n")
+                                continue
+                            results_file.write(f"{len(mutate_along_trace_response.random_mutations_runs)} Runs\n")
 
-                    results_file.write("\n")
+                            location_total_killed = 0
+                            location_total_survied = 0
+                            for mutation_run in mutate_along_trace_response.random_mutations_runs:
+                                cfa_node = mutation_run[0]
+                                run_result = mutation_run[1]
 
-                    results_file.write(f"Visited nodes {len(mutate_along_trace_response.visited_nodes)}\n")
-                    results_file.write(f"Unvisited nodes {len(mutate_along_trace_response.unvisited_nodes)}\n")
-                    nodes_total = len(mutate_along_trace_response.visited_nodes) + len(mutate_along_trace_response.unvisited_nodes)
-                    if nodes_total > 0:
-                        results_file.write(f"Percentage visited {len(mutate_along_trace_response.visited_nodes) / nodes_total}\n")
+                                if cfa_node.location != visited_locaiton:
+                                    continue
+                                results_file.write("\n")
 
-                    results_file.write("\n")
+                                results_file.write(f"Code :: '{mutate_along_trace_request.tree.contents_of(cfa_node.node)}'\n")
+
+                                if len(run_result.mutation_tests) == 0:
+                                    results_file.write("No mutations\n")
+                                    continue
+
+                                amount_killed = 0
+                                amount_survived = 0
+                                amount_equivalent = 0
+
+                                # "if"-condition
+                                if c_syntax.is_condition_of_if(cfa_node.node):
+                                    results_file.write("Is :: if-condition\n")
+                                # "for" initialisation
+                                if c_syntax.is_initialisation_of_for(cfa_node.node):
+                                    results_file.write("Is :: for-initalisation\n")
+                                # "for" conditional
+                                if c_syntax.is_condition_of_for(cfa_node.node):
+                                    results_file.write("Is :: for-condition\n")
+                                # "for" update
+                                if c_syntax.is_update_of_for(cfa_node.node):
+                                    results_file.write("Is :: for-udapte\n")
+                                # "do while" condition
+                                if c_syntax.is_condition_of_do_while(cfa_node.node):
+                                    results_file.write("Is :: do_while-condition\n")
+                                # "while" condition
+                                if c_syntax.is_condition_of_while(cfa_node.node):
+                                    results_file.write("Is :: while-condition\n")
+                                # "switch" condition
+                                if c_syntax.is_condition_of_switch(cfa_node.node):
+                                    results_file.write("Is :: switch-condition\n")
+
+                                if len(run_result.mutation_tests) == 0: continue
+
+                                for mutation_test in run_result.mutation_tests:
+                                    mutant_trace = mutate_along_trace_request.localised_cfg.slice(
+                                        mutation_test.test_results.trace
+                                    )
+                                    split_traces = mutate_along_trace_request.localised_cfg.split_on_finals(
+                                        mutant_trace
+                                    )
+                                    results_file.write(f"Mutant trace count {len(split_traces)}\n")
+                                
+                                    location_visitations: Dict[str, int] = dict()
+                                    for location in mutant_trace.sequence:
+                                        if location.id not in location_visitations:
+                                            location_visitations[location.id] = 1
+                                        else: location_visitations[location.id] += 1
+
+                                    for location in location_visitations:
+                                        amount = location_visitations[location]
+                                        results_file.write(f"{location} was visited {amount} times\n")
+
+                                    results_file.write(f"[{mutation_test.candidate.start_point}, {mutation_test.candidate.end_point}]")
+                                    results_file.write(f" {str(mutation_test.mutation)}")
+                                    if mutation_test.outcome == MutationOutcome.EQUIVALENT:
+                                        amount_equivalent += 1
+                                    elif mutation_test.outcome.is_detected:
+                                        amount_killed += 1
+                                    else:
+                                        amount_survived += 1
+                                    results_file.write(f" :: {mutation_test.outcome.value}\n")
+                                    results_file.write("\n")
+
+                                # "if"-condition
+                                if c_syntax.is_condition_of_if(cfa_node.node):
+                                    total_if_conditional_killed += amount_killed
+                                    total_if_conditional_survived += amount_survived
+                                # "for" initialisation
+                                if c_syntax.is_initialisation_of_for(cfa_node.node):
+                                    total_for_initilisation_killed += amount_killed
+                                    total_for_initilisation_survived += amount_survived
+                                # "for" conditional
+                                if c_syntax.is_condition_of_for(cfa_node.node):
+                                    total_for_condition_killed += amount_killed
+                                    total_for_condition_survived += amount_survived
+                                # "for" update
+                                if c_syntax.is_update_of_for(cfa_node.node):
+                                    total_for_update_killed += amount_killed
+                                    total_for_update_survived += amount_survived
+                                # "do while" condition
+                                if c_syntax.is_condition_of_do_while(cfa_node.node):
+                                    total_do_while_condition_killed += amount_killed
+                                    total_do_while_condition_survived += amount_survived
+                                # "while" condition
+                                if c_syntax.is_condition_of_while(cfa_node.node):
+                                    total_while_condition_killed += amount_killed
+                                    total_while_condition_survived += amount_survived
+                                # "switch" condition
+                                if c_syntax.is_condition_of_switch(cfa_node.node):
+                                    total_switch_condition_killed += amount_killed
+                                    total_switch_condition_survived += amount_survived
+
+                                results_file.write(f"Killed {amount_killed} and {amount_survived} survived")
+                                amount_total = amount_killed + amount_survived
+                                if amount_total > 0:
+                                    results_file.write(f", mutation score of {amount_killed / (amount_killed + amount_survived)}")
+                                results_file.write("\n")
 
-                    results_file.write(f"Visited candidates {mutate_along_trace_response.visited_candidates}\n")
-                    results_file.write(f"Unvisited candidates {mutate_along_trace_response.unvisited_candidates}\n")
-                    candidates_total = mutate_along_trace_response.visited_candidates + mutate_along_trace_response.unvisited_candidates
-                    if candidates_total > 0:
-                        results_file.write(f"Percentage visited {mutate_along_trace_response.visited_candidates / candidates_total}\n")
+                                location_total_killed += amount_killed
+                                location_total_survied += amount_survived
+                                all_locations_total_equivalent += amount_equivalent
 
-                    results_file.write("\n")
+                            all_locations_total_killed += location_total_killed
+                            all_locations_total_survied += location_total_survied
 
-                    results_file.write(f"Tested mutations {mutate_along_trace_response.visited_mutations}\n")
-                    results_file.write(f"Untested mutations {mutate_along_trace_response.unvisited_mutations}\n")
-                    mutations_total = mutate_along_trace_response.visited_mutations + mutate_along_trace_response.unvisited_mutations
-                    if mutations_total > 0:
-                        results_file.write(f"Percentage visited {mutate_along_trace_response.visited_mutations / mutations_total}\n")
-
-                    all_locations_total_killed = 0
-                    all_locations_total_survied = 0
-                    total_if_conditional_killed = 0
-                    total_if_conditional_survived = 0
-                    total_for_initilisation_killed = 0
-                    total_for_initilisation_survived = 0
-                    total_for_condition_killed = 0
-                    total_for_condition_survived = 0
-                    total_for_update_killed = 0
-                    total_for_update_survived = 0
-                    total_do_while_condition_killed = 0
-                    total_do_while_condition_survived = 0
-                    total_while_condition_killed = 0
-                    total_while_condition_survived = 0
-                    total_switch_condition_killed = 0
-                    total_switch_condition_survived = 0
-                    c_syntax = LanguageLibrary.c().syntax
-                    for visited_locaiton in mutate_along_trace_response.visited_locations:
-                        results_file.write(f"\nLocation {visited_locaiton}\n")
-                        if len(mutate_along_trace_response.random_mutations_runs) == 0:
-                            results_file.write("No runs\n")
-                            continue
-                        results_file.write(f"{len(mutate_along_trace_response.random_mutations_runs)} Runs\n")
-
-                        location_total_killed = 0
-                        location_total_survied = 0
-                        for mutation_run in mutate_along_trace_response.random_mutations_runs:
-                            cfa_node = mutation_run[0]
-                            run_result = mutation_run[1]
-
-                            if cfa_node.location != visited_locaiton:
-                                continue
-                            results_file.write("\n")
+                            location_total_sum = location_total_killed + location_total_survied
+                            results_file.write(f"\nLocation Killed {location_total_killed} and {location_total_survied} survived")
+                            if location_total_sum > 0:
+                                results_file.write(f", mutation score of {location_total_killed / (location_total_sum)}")
+                            results_file.write("\n\n")
 
-                            results_file.write(f"Code :: '{mutate_along_trace_request.tree.contents_of(cfa_node.node)}'\n")
+                        results_file.write(f"\nTotal killed {all_locations_total_killed} and {all_locations_total_survied} total survived")
+                        if all_locations_total_killed + all_locations_total_survied > 0:
+                            results_file.write(f", with a total mutations score of {all_locations_total_killed/(all_locations_total_killed + all_locations_total_survied)}")
+                        results_file.write("\n")
+                        results_file.write(f"Total timed out {mutate_along_trace_response.amount_timed_out}\n")
+                        results_file.write(f"Total no coverage {mutate_along_trace_response.amount_no_coverage}\n")
+                        results_file.write(f"Total not infected {mutate_along_trace_response.amount_not_infected}\n")
+                        results_file.write(f"Total equivalent {all_locations_total_equivalent}\n")
 
-                            if run_result.amount_killed + run_result.amount_survived == 0:
-                                results_file.write("No mutations\n")
-                                continue
+                        for node in mutate_along_trace_request.localised_cfg.nodes:
+                            if node.location in unit_test_results.visitations:
+                                node.amount_visited = unit_test_results.visitations[node.location]
 
-                            amount_killed = 0
-                            amount_survived = 0
-
-                            # "if"-condition
-                            if c_syntax.is_condition_of_if(cfa_node.node):
-                                results_file.write("Is :: if-condition\n")
-                            # "for" initialisation
-                            if c_syntax.is_initialisation_of_for(cfa_node.node):
-                                results_file.write("Is :: for-initalisation\n")
-                            # "for" conditional
-                            if c_syntax.is_condition_of_for(cfa_node.node):
-                                results_file.write("Is :: for-condition\n")
-                            # "for" update
-                            if c_syntax.is_update_of_for(cfa_node.node):
-                                results_file.write("Is :: for-udapte\n")
-                            # "do while" condition
-                            if c_syntax.is_condition_of_do_while(cfa_node.node):
-                                results_file.write("Is :: do_while-condition\n")
-                            # "while" condition
-                            if c_syntax.is_condition_of_while(cfa_node.node):
-                                results_file.write("Is :: while-condition\n")
-                            # "switch" condition
-                            if c_syntax.is_condition_of_switch(cfa_node.node):
-                                results_file.write("Is :: switch-condition\n")
-
-                            if len(run_result.mutation_tests) == 0: continue
-
-                            for mutation_test in run_result.mutation_tests:
-                                split_traces = mutate_along_trace_request.localised_cfg.split_on_finals(
-                                    mutation_test.test_results.trace
-                                )
-                                results_file.write(f"Mutant trace count {len(split_traces)}\n")
-                                
-                                location_visitations: Dict[str, int] = dict()
-                                for location in mutation_test.test_results.trace.sequence:
-                                    if location.id not in location_visitations:
-                                        location_visitations[location.id] = 1
-                                    else: location_visitations[location.id] += 1
-
-                                for location in location_visitations:
-                                    amount = location_visitations[location]
-                                    results_file.write(f"{location} was visited {amount} times\n")
-
-                                results_file.write(f"[{mutation_test.candidate.start_point}, {mutation_test.candidate.end_point}]")
-                                results_file.write(f" {str(mutation_test.mutation)}")
-                                if mutation_test.test_results.summary.failure_count > 0:
-                                    amount_killed += 1
-                                    mutation_state = "KILLED"
-                                else:
-                                    amount_survived += 1
-                                    mutation_state = "SURVIVED"
-                                results_file.write(f" :: {mutation_state}\n")
-                                results_file.write("\n")
+                        mutate_along_trace_request.localised_cfg.draw(
+                            mutate_along_trace_request.tree, f"{unit_name}_localised_{u_idx}"
+                        ).save(directory=f"{mutate_along_trace_request.base}/{mutate_along_trace_request.out}")
 
-                            # "if"-condition
-                            if c_syntax.is_condition_of_if(cfa_node.node):
-                                total_if_conditional_killed += amount_killed
-                                total_if_conditional_survived += amount_survived
-                            # "for" initialisation
-                            if c_syntax.is_initialisation_of_for(cfa_node.node):
-                                total_for_initilisation_killed += amount_killed
-                                total_for_initilisation_survived += amount_survived
-                            # "for" conditional
-                            if c_syntax.is_condition_of_for(cfa_node.node):
-                                total_for_condition_killed += amount_killed
-                                total_for_condition_survived += amount_survived
-                            # "for" update
-                            if c_syntax.is_update_of_for(cfa_node.node):
-                                total_for_update_killed += amount_killed
-                                total_for_update_survived += amount_survived
-                            # "do while" condition
-                            if c_syntax.is_condition_of_do_while(cfa_node.node):
-                                total_do_while_condition_killed += amount_killed
-                                total_do_while_condition_survived += amount_survived
-                            # "while" condition
-                            if c_syntax.is_condition_of_while(cfa_node.node):
-                                total_while_condition_killed += amount_killed
-                                total_while_condition_survived += amount_survived
-                            # "switch" condition
-                            if c_syntax.is_condition_of_switch(cfa_node.node):
-                                total_switch_condition_killed += amount_killed
-                                total_switch_condition_survived += amount_survived
-
-                            results_file.write(f"Killed {amount_killed} and {amount_survived} survived")
-                            amount_total = amount_killed + amount_survived
-                            if amount_total > 0:
-                                results_file.write(f", mutation score of {amount_killed / (amount_killed + amount_survived)}")
-                            results_file.write("\n")
-
-                            location_total_killed += amount_killed
-                            location_total_survied += amount_survived
-
-                        all_locations_total_killed += location_total_killed
-                        all_locations_total_survied += location_total_survied
-
-                        location_total_sum = location_total_killed + location_total_survied
-                        results_file.write(f"\nLocation Killed {location_total_killed} and {location_total_survied} survived")
-                        if location_total_sum > 0:
-                            results_file.write(f", mutation score of {location_total_killed / (location_total_sum)}")
-                        results_file.write("\n\n")
-
-                    results_file.write(f"\nTotal killed {all_locations_total_killed} and {all_locations_total_survied} total survived")
-                    if all_locations_total_killed + all_locations_total_survied > 0:
-                        results_file.write(f", with a total mutations score of {all_locations_total_killed/(all_locations_total_killed + all_locations_total_survied)}")
                     results_file.write("\n")
-
-                    for node in mutate_along_trace_request.localised_cfg.nodes:
-                        if node.location in parse_test_results_response.test_results.visitations:
-                            node.amount_visited = parse_test_results_response.test_results.visitations[node.location]
-
-                    mutate_along_trace_request.localised_cfg.draw(
-                        mutate_along_trace_request.tree, f"{unit_name}_localised_{u_idx}"
-                    ).save(directory=f"{mutate_along_trace_request.base}/{mutate_along_trace_request.out}")
-
-                results_file.write("\n")
-                results_file.write(f"Took {time.perf_counter() - start_time} seconds")
-                results_file.close()
-                
-            except Exception as excep:
-                print(f"{unit} encountered an exception :: {excep}")
-                traceback.print_tb(excep.__traceback__)
-
-            # Step 6: Revert to the original program after mutation
-            file = open(unit_analysis_of_file_request.filepath, "w")
-            file.write(unit_analysis_of_file_response.tree.text)
-            file.close()
\ No newline at end of file
+                    results_file.write(f"Took {time.perf_counter() - start_time} seconds")
+                    results_file.close()
+
+                except Exception as excep:
+                    print(f"{unit_name} encountered an exception :: {excep}")
+                    traceback.print_tb(excep.__traceback__)
+
+        except Exception as excep:
+            print(f"{file} encountered an exception :: {excep}")
+            traceback.print_tb(excep.__traceback__)
+        finally:
+            # Step 11: Revert to the original program after mutation, also
+            #   when the analysis is interrupted
+            RevertUseCase().do(
+                RevertRequest(
+                    unit_analysis_of_file_request.filepath,
+                    unit_analysis_of_file_response.tree.text,
+                )
+            )
\ No newline at end of file
@@ -0,0 +1,71 @@
+import os
+import socket
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from application import (
+    RunMutantJobRequest,
+    RunMutantJobUseCase,
+)
+from execution import CoordinatorClient, SandboxPool, parse_address
+from test_results_parsing import ResultsParserFactory
+
+def worker(
+    coordinator: str,
+    base: str,
+    testing_backend: str = "ffs_gnu_assert",
+    jobs: int = 1,
+    connect_timeout: float = 60.0,
+) -> None:
+    """Builds and tests the mutants served by the coordinator of a mutation
+        analysis, until the analysis is done
+
+    Args:
+        coordinator (str): The address of the coordinator, "host:port" or "unix:path"
+        base (str): The copy of the project of this worker
+        testing_backend (str, optional): The testing backend of the project. Defaults to "ffs_gnu_assert".
+        jobs (int, optional): The amount of mutants to build and test in parallel. Defaults to 1.
+        connect_timeout (float, optional): The amount of seconds to keep trying to reach
+            the coordinator. Defaults to 60.0.
+    """
+    if base == "":
+        raise Exception("A base directory is required to run as a worker")
+    address = parse_address(coordinator)
+    results_parser = ResultsParserFactory().create(testing_backend)
+    name = f"{socket.gethostname()}-{os.getpid()}"
+
+    # The mutants are built and tested in sandbox copies, the base itself is never mutated
+    sandbox_pool = SandboxPool(base, jobs)
+    sandbox_pool.create()
+
+    def work(w_idx: int) -> int:
+        client = CoordinatorClient(address, f"{name}-{w_idx}", connect_timeout)
+        completed = 0
+        try:
+            while True:
+                leased = client.lease()
+                if leased is None: break
+                job_id, job = leased
+
+                sandbox = sandbox_pool.acquire()
+                try:
+                    response = RunMutantJobUseCase().do(
+                        RunMutantJobRequest(job, base, sandbox, results_parser)
+                    )
+                except Exception as excep:
+                    # The lease of the job expires, such that another worker retries it
+                    print(f"Job {job_id} encountered an exception :: {excep}")
+                    traceback.print_tb(excep.__traceback__)
+                    continue
+                finally: sandbox_pool.release(sandbox)
+
+                client.complete(job_id, response.result)
+                completed += 1
+        finally: client.close()
+        return completed
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            completed = sum(executor.map(work, range(jobs)))
+    finally:
+        sandbox_pool.destroy()
+    print(f"Worker {name} completed {completed} mutants")
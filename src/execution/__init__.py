@@ -0,0 +1,13 @@
+from .sandbox import *
+from .sandbox_pool import *
+from .workspace import *
+from .fork_server import *
+from .async_runner import *
+from .object_cache import *
+from .trivial_compiler_equivalence import *
+from .result_cache import *
+from .journal import *
+from .prioritiser import *
+from .work_queue import *
+from .coordinator import *
+from .execution_context import *
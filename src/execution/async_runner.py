@@ -0,0 +1,150 @@
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+from typing import IO, Any, Callable, Dict, List, Tuple
+from asyncio.subprocess import Process
+
+class AsyncRunner:
+    """Runs subprocesses on an asyncio event loop in a thread of its own, such
+        that any amount of threads can supervise their subprocesses while at
+        most a bounded amount of them run at once. A subprocess runs in a
+        session of its own, such that its whole process group is killed when
+        it times out, is aborted or is cancelled.
+    """
+    # The longest line of output read at once, longer lines are split
+    LINE_LIMIT: int = 16 * 1024 * 1024
+
+    def __init__(self, concurrency: int = None) -> None:
+        """
+        Args:
+            concurrency (int, optional): The maximum amount of subprocesses
+                running at once. Defaults to None, the amount of processors.
+        """
+        self._concurrency = concurrency or os.cpu_count() or 1
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # The semaphore belongs to the loop it is created in
+        self._semaphore: asyncio.Semaphore = asyncio.run_coroutine_threadsafe(
+            self._create_semaphore(), self._loop
+        ).result()
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    def run(
+        self,
+        args: List[str],
+        cwd: str = None,
+        env: Dict[str, str] = None,
+        timeout: float = None,
+        stdout: IO[Any] = None,
+        stderr: IO[Any] = None,
+        output: Callable[[str], None] = None,
+        abort: Callable[[str], bool] = None,
+    ) -> Tuple[int, bool]:
+        """Blocks until the subprocess finished, see RunSubsystemRequest for the arguments
+
+        Raises:
+            subprocess.TimeoutExpired: The subprocess did not finish within the timeout
+
+        Returns:
+            Tuple[int, bool]: The return code, and whether the subprocess was aborted
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.run_async(args, cwd, env, timeout, stdout, stderr, output, abort),
+            self._loop
+        ).result()
+
+    async def run_async(
+        self,
+        args: List[str],
+        cwd: str = None,
+        env: Dict[str, str] = None,
+        timeout: float = None,
+        stdout: IO[Any] = None,
+        stderr: IO[Any] = None,
+        output: Callable[[str], None] = None,
+        abort: Callable[[str], bool] = None,
+    ) -> Tuple[int, bool]:
+        """The coroutine of run, for callers on the loop of the runner"""
+        streaming = output is not None or abort is not None
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE if streaming else stdout,
+                stderr=asyncio.subprocess.STDOUT if streaming else stderr,
+                cwd=cwd,
+                env=env,
+                start_new_session=True,
+                limit=AsyncRunner.LINE_LIMIT,
+            )
+            try:
+                if streaming:
+                    aborted = await asyncio.wait_for(
+                        self._read(process, stdout, output, abort), timeout
+                    )
+                else:
+                    aborted = False
+                    await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                raise subprocess.TimeoutExpired(args, timeout)
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+            return process.returncode, aborted
+
+    def close(self) -> None:
+        """Cancels the running subprocesses and stops the loop"""
+        async def cancel() -> None:
+            tasks = [
+                task for task in asyncio.all_tasks(self._loop)
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks: task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        asyncio.run_coroutine_threadsafe(cancel(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _create_semaphore(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self._concurrency)
+
+    async def _read(
+        self,
+        process: Process,
+        stdout: IO[Any],
+        output: Callable[[str], None],
+        abort: Callable[[str], bool],
+    ) -> bool:
+        while True:
+            try:
+                raw = await process.stdout.readuntil(b"\n")
+            except asyncio.IncompleteReadError as excep:
+                # The last line is not ended by a newline
+                raw = excep.partial
+            except asyncio.LimitOverrunError as excep:
+                # A line beyond the limit is read in parts instead
+                raw = await process.stdout.readexactly(excep.consumed)
+            if not raw: break
+            line = raw.decode(errors="replace")
+            if hasattr(stdout, "write"):
+                stdout.write(line)
+            line = line.rstrip("\n")
+            if output is not None:
+                output(line)
+            if abort is not None and abort(line):
+                await self._kill(process)
+                return True
+        await process.wait()
+        return False
+
+    async def _kill(self, process: Process) -> None:
+        try: os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError: pass
+        await process.wait()
@@ -0,0 +1,210 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, Dict, Tuple, Union
+from .work_queue import WorkQueue
+
+Address = Union[Tuple[str, int], str]
+
+def parse_address(address: str) -> Address:
+    """Parses "host:port" into a TCP address and "unix:path" into the path of a Unix socket"""
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+def format_address(address: Address) -> str:
+    if isinstance(address, str):
+        return f"unix:{address}"
+    return f"{address[0]}:{address[1]}"
+
+class _Handler(socketserver.StreamRequestHandler):
+    # Every message is a single line of JSON, answered by a single line of JSON
+    def handle(self) -> None:
+        coordinator: "Coordinator" = self.server.coordinator
+        for line in self.rfile:
+            try: message = json.loads(line)
+            except ValueError: return
+            reply = coordinator.handle(message)
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+            self.wfile.flush()
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+class Coordinator:
+    """Serves the mutants of a distributed analysis to the workers, see
+        CoordinatorClient. A job is a JSON object describing a mutant and its
+        result is the JSON object of its outcome, both are opaque to the
+        coordinator.
+
+        The protocol has two messages:
+            { "lease": <worker> } answered by { "job_id": <id>, "job": <job> },
+                { "wait": <seconds> } when no job is queued or { "stop": true }
+                once the analysis is done.
+            { "complete": <id>, "result": <result> } answered by { "kept": <bool> }.
+    """
+    # The amount of seconds a worker waits before asking for a job again
+    POLL_INTERVAL: float = 0.5
+
+    def __init__(self, address: Address, base: str, lease_timeout: float = 600.0) -> None:
+        """
+        Args:
+            address (Address): The TCP address, port 0 for any free port, or the path of a Unix socket
+            base (str): The directory of the project, whose paths in the jobs the workers map to their own copy
+            lease_timeout (float, optional): The amount of seconds a worker has to complete
+                a job before it is considered lost. Defaults to 600.0.
+        """
+        self._address = address
+        self._base = os.path.abspath(base)
+        self._queue = WorkQueue(lease_timeout)
+        self._server: socketserver.BaseServer = None
+        self._thread: threading.Thread = None
+        self._stopping = False
+        self._workers: Dict[str, int] = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def address(self) -> Address:
+        """The address the coordinator listens on, with the port assigned to it"""
+        if self._server is not None:
+            return self._server.server_address
+        return self._address
+
+    @property
+    def base(self) -> str:
+        return self._base
+
+    @property
+    def queue(self) -> WorkQueue:
+        return self._queue
+
+    @property
+    def workers(self) -> Dict[str, int]:
+        """The amount of jobs completed by each worker"""
+        return self._workers
+
+    def start(self) -> None:
+        if isinstance(self._address, str):
+            if os.path.exists(self._address): os.remove(self._address)
+            self._server = _UnixServer(self._address, _Handler)
+        else:
+            self._server = _TCPServer(self._address, _Handler)
+        self._server.coordinator = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Tells the workers the analysis is done and stops serving"""
+        self._stopping = True
+        # The workers polling for a job are told to stop before the socket is closed
+        time.sleep(Coordinator.POLL_INTERVAL * 2)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.remove(self._address)
+
+    def submit(self, job: Dict[str, Any]) -> int:
+        return self._queue.put(job)
+
+    def result(self, job_id: int) -> Dict[str, Any]:
+        """Blocks until a worker completed the job"""
+        return self._queue.result(job_id)
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        if "lease" in message:
+            if self._stopping: return { "stop": True }
+            leased = self._queue.lease(str(message["lease"]))
+            if leased is None: return { "wait": Coordinator.POLL_INTERVAL }
+            return { "job_id": leased[0], "job": leased[1] }
+        if "complete" in message:
+            kept = self._queue.complete(int(message["complete"]), message["result"])
+            if kept:
+                worker = str(message.get("worker"))
+                with self._lock:
+                    self._workers[worker] = self._workers.get(worker, 0) + 1
+            return { "kept": kept }
+        return { "error": "Unknown message" }
+
+class CoordinatorClient:
+    """The connection of a worker to the coordinator"""
+    def __init__(self, address: Address, name: str, connect_timeout: float = 60.0) -> None:
+        """
+        Args:
+            address (Address): The address of the coordinator
+            name (str): The name of the worker
+            connect_timeout (float, optional): The amount of seconds to keep trying
+                to reach the coordinator, which may not have started yet. Defaults to 60.0.
+        """
+        self._address = address
+        self._name = name
+        self._connect_timeout = connect_timeout
+        self._socket: socket.socket = None
+        self._file = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def lease(self) -> Tuple[int, Dict[str, Any]]:
+        """Blocks until the coordinator hands out a job
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: The identifier and the job, None once the analysis is done
+        """
+        while True:
+            reply = self._request({ "lease": self._name })
+            if reply is None or reply.get("stop"): return None
+            if "job" in reply: return reply["job_id"], reply["job"]
+            time.sleep(reply.get("wait", Coordinator.POLL_INTERVAL))
+
+    def complete(self, job_id: int, result: Dict[str, Any]) -> bool:
+        """Sends the result of a job, False if the coordinator already had one"""
+        reply = self._request({ "complete": job_id, "result": result, "worker": self._name })
+        return reply is not None and reply.get("kept", False)
+
+    def close(self) -> None:
+        if self._socket is None: return
+        self._file.close()
+        self._socket.close()
+        self._socket = None
+        self._file = None
+
+    def _connect(self) -> bool:
+        deadline = time.monotonic() + self._connect_timeout
+        while True:
+            family = socket.AF_UNIX if isinstance(self._address, str) else socket.AF_INET
+            connection = socket.socket(family, socket.SOCK_STREAM)
+            try:
+                connection.connect(self._address)
+                self._socket = connection
+                self._file = connection.makefile("rwb")
+                return True
+            except OSError:
+                connection.close()
+                if time.monotonic() >= deadline: return False
+                time.sleep(Coordinator.POLL_INTERVAL)
+
+    def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Sends a message, None if the coordinator cannot be reached"""
+        # A connection lost to a restarted coordinator is made again
+        for _ in range(2):
+            if self._socket is None and not self._connect(): return None
+            try:
+                self._file.write((json.dumps(message) + "\n").encode())
+                self._file.flush()
+                line = self._file.readline()
+                if line: return json.loads(line)
+            except OSError: pass
+            self.close()
+        return None
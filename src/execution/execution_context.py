@@ -0,0 +1,204 @@
+import os
+from typing import Dict
+from instrumentation_trace import CoverageMap
+from .object_cache import ObjectCache
+from .journal import Journal
+from .result_cache import ResultCache
+from .sandbox_pool import SandboxPool
+from .prioritiser import Prioritiser
+from .trivial_compiler_equivalence import TrivialCompilerEquivalence
+from .workspace import Workspace
+from .coordinator import Coordinator
+
+class ExecutionContext:
+    """The resources shared by every mutant executed during a mutation analysis"""
+    def __init__(
+        self,
+        sandbox_pool: SandboxPool = None,
+        schemata: bool = False,
+        fork_server: bool = False,
+        object_cache: ObjectCache = None,
+        early_abort: bool = False,
+        timeout_multiplier: float = 3.0,
+        timeout_floor: float = 1.0,
+        baseline_timeout: float = 300.0,
+        max_trace_length: int = 1000000,
+        keep_test_output: bool = False,
+        tce: TrivialCompilerEquivalence = None,
+        result_cache: ResultCache = None,
+        journal: Journal = None,
+        test_selection: bool = False,
+        prioritiser: Prioritiser = None,
+        workspace: Workspace = None,
+        coordinator: Coordinator = None,
+        weak_mutation: bool = False,
+        split_stream: bool = False,
+        pipeline: bool = False,
+    ) -> None:
+        self._sandbox_pool = sandbox_pool
+        self._schemata = schemata
+        self._fork_server = fork_server
+        self._object_cache = object_cache
+        self._early_abort = early_abort
+        self._timeout_multiplier = timeout_multiplier
+        self._timeout_floor = timeout_floor
+        self._baseline_timeout = baseline_timeout
+        self._max_trace_length = max_trace_length
+        self._keep_test_output = keep_test_output
+        self._tce = tce
+        self._result_cache = result_cache
+        self._journal = journal
+        self._test_selection = test_selection
+        self._prioritiser = prioritiser
+        self._workspace = workspace
+        self._coordinator = coordinator
+        self._weak_mutation = weak_mutation
+        self._split_stream = split_stream
+        self._pipeline = pipeline
+        self._coverage: CoverageMap = None
+        self._build_duration: float = None
+        self._test_duration: float = None
+
+    @property
+    def sandbox_pool(self) -> SandboxPool:
+        return self._sandbox_pool
+
+    @property
+    def jobs(self) -> int:
+        if self._sandbox_pool is None: return 1
+        return self._sandbox_pool.size
+
+    @property
+    def schemata(self) -> bool:
+        """Whether the mutants are built once as a mutant schemata"""
+        return self._schemata
+
+    @property
+    def fork_server(self) -> bool:
+        """Whether the mutants of a schemata are forked from a single test process"""
+        return self._fork_server
+
+    @property
+    def object_cache(self) -> ObjectCache:
+        return self._object_cache
+
+    @property
+    def early_abort(self) -> bool:
+        """Whether the tests of a mutant are killed as soon as one of them fails"""
+        return self._early_abort
+
+    @property
+    def timeout_multiplier(self) -> float:
+        return self._timeout_multiplier
+
+    @property
+    def timeout_floor(self) -> float:
+        """The least amount of seconds a mutant is given to build or test"""
+        return self._timeout_floor
+
+    @property
+    def baseline_timeout(self) -> float:
+        """The timeout of the original program, which the mutant timeouts are calibrated from"""
+        return self._baseline_timeout
+
+    @property
+    def max_trace_length(self) -> int:
+        """The maximum amount of locations kept of the trace of a mutant"""
+        return self._max_trace_length
+
+    @property
+    def keep_test_output(self) -> bool:
+        """Whether the output of the tests of every mutant is written to the output directory"""
+        return self._keep_test_output
+
+    @property
+    def tce(self) -> TrivialCompilerEquivalence:
+        """The detection of equivalent and duplicate mutants, if None then every mutant is tested"""
+        return self._tce
+
+    @property
+    def result_cache(self) -> ResultCache:
+        """The results of previous runs, if None then every mutant is tested"""
+        return self._result_cache
+
+    @property
+    def journal(self) -> Journal:
+        """The log of the outcomes of the analysis, which it can be resumed from"""
+        return self._journal
+
+    @property
+    def test_selection(self) -> bool:
+        """Whether a mutant is only tested by the tests reaching its location"""
+        return self._test_selection
+
+    @property
+    def coverage(self) -> CoverageMap:
+        """The locations each test of the baseline run visited"""
+        return self._coverage
+
+    @property
+    def prioritiser(self) -> Prioritiser:
+        """The order of the tests of a mutant, if None then they run in their own order"""
+        return self._prioritiser
+
+    @property
+    def workspace(self) -> Workspace:
+        """The copy of the project in memory which is analysed, None if the project itself is"""
+        return self._workspace
+
+    @property
+    def coordinator(self) -> Coordinator:
+        """The coordinator serving the mutants to the workers, None if they are tested locally"""
+        return self._coordinator
+
+    @property
+    def weak_mutation(self) -> bool:
+        """Whether the mutants which never infect the state are classified without being tested"""
+        return self._weak_mutation
+
+    @property
+    def split_stream(self) -> bool:
+        """Whether the tests of the mutants of a location are forked once they reach it"""
+        return self._split_stream
+
+    @property
+    def pipeline(self) -> bool:
+        """Whether the next mutant is built while the current one is tested"""
+        return self._pipeline
+
+    @property
+    def build_timeout(self) -> float:
+        """The timeout of building a mutant, None until calibrated"""
+        return self._timeout(self._build_duration)
+
+    @property
+    def test_timeout(self) -> float:
+        """The timeout of testing a mutant, None until calibrated"""
+        return self._timeout(self._test_duration)
+
+    def calibrate(self, build_duration: float, test_duration: float) -> None:
+        """Derives the mutant timeouts from the durations of the baseline run
+
+        Args:
+            build_duration (float): The seconds it took to build the original program
+            test_duration (float): The seconds it took to test the original program
+        """
+        self._build_duration = build_duration
+        self._test_duration = test_duration
+
+    def cover(self, coverage: CoverageMap) -> None:
+        """Sets the coverage of the baseline run, which the tests of the mutants are selected
+            and ordered by"""
+        self._coverage = coverage
+        if self._prioritiser is not None:
+            self._prioritiser.calibrate(coverage)
+
+    def _timeout(self, duration: float) -> float:
+        if duration is None: return None
+        return max(self._timeout_floor, self._timeout_multiplier * duration)
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """The environment of the builds and tests, if None then it is inherited"""
+        if self._object_cache is None: return None
+        return dict(os.environ, **self._object_cache.env)
@@ -0,0 +1,164 @@
+import os
+import select
+import signal
+import subprocess
+import tempfile
+import time
+from typing import Dict
+
+class ForkServer:
+    """Drives a test binary which stops at the fork server handshake of Canary.h.
+        The binary is started once, afterwards every mutant only costs a fork of
+        the already loaded and initialised process.
+
+        With a split location the binary runs the original program until it first
+        reaches the location, such that the mutants of the location share the prefix
+        of the tests and only the remainder runs for each of them. The output of
+        the prefix is put in front of the output of every mutant, such that its
+        trace and failed tests are the same as without a split.
+    """
+    def __init__(
+        self,
+        command: str,
+        cwd: str = None,
+        timeout: float = 10,
+        split_location: str = None,
+    ) -> None:
+        self._command = command
+        self._cwd = cwd
+        self._timeout = timeout
+        self._split_location = split_location
+        self._process: subprocess.Popen = None
+        self._control: int = None
+        self._status: int = None
+        self._buffer = b""
+        self._prefix = b""
+
+    @property
+    def command(self) -> str:
+        return self._command
+
+    @property
+    def split_location(self) -> str:
+        """The location the tests are forked at, None if they are forked before main"""
+        return self._split_location
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Starts the test binary and waits for its handshake
+
+        Raises:
+            Exception: If the binary does not start a fork server, or
+                does not reach the split location
+        """
+        control_read, control_write = os.pipe()
+        status_read, status_write = os.pipe()
+        env: Dict[str, str] = dict(os.environ)
+        env["CANARY_FORK_SERVER"] = f"{control_read} {status_write}"
+        if self._split_location is not None:
+            env["CANARY_SPLIT_LOCATION"] = str(self._split_location)
+        # The output before the fork server is only produced once
+        prefix = tempfile.TemporaryFile()
+        try:
+            self._process = subprocess.Popen(
+                self._command.split(),
+                stdin=subprocess.DEVNULL,
+                stdout=prefix,
+                stderr=subprocess.STDOUT,
+                cwd=self._cwd,
+                env=env,
+                pass_fds=(control_read, status_write),
+            )
+            os.close(control_read)
+            os.close(status_write)
+            self._control = control_write
+            self._status = status_read
+
+            try: ready = self._read_line(time.monotonic() + self._timeout)
+            except Exception: ready = None
+            if ready != "ready":
+                self.stop()
+                raise Exception(f"'{self._command}' did not start a fork server")
+
+            # The server flushed its output before the handshake
+            prefix.seek(0)
+            self._prefix = prefix.read()
+        finally: prefix.close()
+
+    def run(self, mutant_id: int, out: str) -> int:
+        """Runs the tests of a single mutant in a fresh child of the server
+
+        Args:
+            mutant_id (int): The mutant to select, 0 being the original program
+            out (str): The file receiving the output of the tests, after the
+                output of the server before the fork
+
+        Raises:
+            subprocess.TimeoutExpired: If the tests did not finish within the timeout
+
+        Returns:
+            int: The exit code of the tests
+        """
+        if "\n" in out:
+            raise Exception(f"Cannot redirect the fork server to '{out}'")
+        os.write(self._control, f"{mutant_id} {os.path.abspath(out)}\n".encode())
+
+        deadline = time.monotonic() + self._timeout
+        started = self._read_line(deadline)
+        if started is None:
+            raise Exception(f"Fork server of '{self._command}' did not respond")
+        pid = int(started.split()[2])
+
+        exited = self._read_line(deadline)
+        if exited is None:
+            # The child outlived the timeout, killing it lets the server continue
+            os.kill(pid, signal.SIGKILL)
+            self._read_line(time.monotonic() + self._timeout)
+            raise subprocess.TimeoutExpired(self._command, self._timeout)
+
+        if len(self._prefix) > 0:
+            file = open(out, "rb")
+            output = file.read()
+            file.close()
+            file = open(out, "wb")
+            file.write(self._prefix + output)
+            file.close()
+        return os.waitstatus_to_exitcode(int(exited.split()[2]))
+
+    def stop(self) -> None:
+        if self._control is not None:
+            os.close(self._control)
+            self._control = None
+        if self._process is not None:
+            try: self._process.wait(self._timeout)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._status is not None:
+            os.close(self._status)
+            self._status = None
+
+    def _read_line(self, deadline: float) -> str:
+        """Reads a line from the status descriptor
+
+        Raises:
+            Exception: If the server stopped before a line was read
+
+        Returns:
+            str: The line without its newline, None if the deadline passed
+        """
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: return None
+            readable, _, _ = select.select([ self._status ], [], [], remaining)
+            if len(readable) == 0: return None
+            chunk = os.read(self._status, 4096)
+            if len(chunk) == 0:
+                raise Exception(f"Fork server of '{self._command}' stopped unexpectedly")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode()
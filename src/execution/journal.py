@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, IO, Tuple
+from test_results_parsing import TestResults, TestSummary
+from .result_cache import ResultCache
+
+class Journal:
+    """An append-only log of the outcomes of the tested mutants, such that an
+        interrupted analysis can be resumed without testing those mutants again.
+        It also holds the original source of every mutated file, which is
+        restored on resume in case the analysis stopped while it was mutated.
+    """
+    def __init__(self, path: str) -> None:
+        self._path = os.path.abspath(path)
+        self._file: IO[str] = None
+        self._file_path = ""
+        self._originals: Dict[str, str] = dict()
+        # The entries of the previous analysis, those of this analysis are only appended
+        self._results: Dict[str, Dict[str, Any]] = dict()
+        # The journal is appended to by the workers testing mutants in parallel
+        self._lock = threading.Lock()
+        self._resumed = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def originals(self) -> Dict[str, str]:
+        """The original source of every file mutated by the journaled analysis"""
+        return self._originals
+
+    @property
+    def resumed(self) -> int:
+        """The amount of mutants whose outcome was taken from the journal"""
+        return self._resumed
+
+    def open(self, resume: bool = False) -> None:
+        """Opens the journal for appending
+
+        Args:
+            resume (bool, optional): Whether the entries of the previous analysis
+                are kept, otherwise the journal is started anew. Defaults to False.
+        """
+        if os.path.dirname(self._path) != "":
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        complete = True
+        if resume and os.path.isfile(self._path):
+            file = open(self._path, "r")
+            for line in file:
+                complete = line.endswith("\n")
+                # The last entry may be incomplete if the analysis was killed while writing it
+                try: entry = json.loads(line)
+                except ValueError: continue
+                if "source" in entry:
+                    self._originals.setdefault(entry["file"], entry["source"])
+                else: self._results[entry["key"]] = entry
+            file.close()
+        self._file = open(self._path, "a" if resume else "w")
+        # The next entry is not appended to an incomplete one
+        if resume and not complete: self._file.write("\n")
+
+    def close(self) -> None:
+        if self._file is None: return
+        self._file.close()
+        self._file = None
+
+    def restore(self) -> None:
+        """Writes back the original source of every file the journaled analysis mutated"""
+        for file_path, source in self._originals.items():
+            # The workspace an earlier analysis mutated its files in may be removed
+            if not os.path.isdir(os.path.dirname(file_path)): continue
+            file = open(file_path, "w")
+            file.write(source)
+            file.close()
+
+    def begin_file(self, file_path: str, source: str) -> None:
+        """Records the original source of a file before it is mutated, the
+            outcomes which follow are of the mutants of this file
+
+        Args:
+            file_path (str): The path of the file
+            source (str): The original source of the file
+        """
+        self._file_path = os.path.abspath(file_path)
+        if self._file_path in self._originals: return
+        self._originals[self._file_path] = source
+        self._append({ "file": self._file_path, "source": source })
+
+    def key(self, unit_source: str, start_byte: int, end_byte: int, replacement: str) -> str:
+        """The key of the outcome of a mutant, see ResultCache.key"""
+        key = hashlib.sha256()
+        for part in [ self._file_path, unit_source, str(start_byte), str(end_byte), replacement ]:
+            key.update(part.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def get(self, key: str) -> Tuple[str, TestResults]:
+        """The outcome and the test results of a mutant, None if it is not journaled"""
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None: return None
+            self._resumed += 1
+        return entry["outcome"], TestResults(
+            TestSummary(*entry["summary"]),
+            ResultCache.decode_trace(entry["trace"], entry["truncated"]),
+        )
+
+    def put(self, key: str, outcome: str, test_results: TestResults) -> None:
+        summary = test_results.summary
+        entry = {
+            "key": key,
+            "outcome": outcome,
+            "summary": [ summary.test_count, summary.failure_count, summary.success_count ],
+            "trace": ResultCache.encode_trace(test_results.trace),
+            "truncated": test_results.trace is not None and test_results.trace.truncated,
+        }
+        self._append(entry)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            # Flushed per entry, such that it survives the analysis being killed
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
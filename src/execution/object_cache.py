@@ -0,0 +1,258 @@
+import hashlib
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+class ObjectCache:
+    """A content addressed cache of compiled objects. The build is pointed at a compiler
+        wrapper through CC, which looks up every compilation of a single translation unit
+        by a hash of its preprocessed source and the compiler flags. Everything else is
+        passed through to the compiler. The cache is shared between the mutants, units,
+        sandboxes and runs, and is bounded by evicting the least recently used objects.
+    """
+    SOURCE_EXTENSIONS: List[str] = [ ".c", ".i" ]
+
+    # Flags producing outputs besides the object, which a cache hit would not reproduce
+    UNCACHEABLE_FLAGS: List[str] = [
+        "-E", "-S", "-M", "-MM", "-MD", "-MMD", "-MF", "-MG", "-MP", "-MQ", "-MT",
+        "-save-temps", "--coverage", "-fprofile-arcs", "-ftest-coverage",
+    ]
+
+    # Flags only affecting the preprocessor, of which the preprocessed source
+    #   captures the effect, such as absolute include paths into a sandbox
+    PREPROCESSOR_FLAGS: List[str] = [
+        "-D", "-U", "-I", "-include", "-imacros", "-isystem", "-iquote", "-idirafter",
+        "-Xpreprocessor",
+    ]
+
+    # Flags followed by a separate argument
+    FLAGS_WITH_ARGUMENT: List[str] = [
+        "-D", "-U", "-I", "-include", "-imacros", "-isystem", "-iquote", "-idirafter",
+        "-x", "-MF", "-MT", "-MQ", "-Xpreprocessor", "-Xassembler", "-Xlinker",
+    ]
+
+    def __init__(
+        self,
+        directory: str,
+        size: int = 1024 * 1024 * 1024,
+        compiler: str = "cc",
+    ) -> None:
+        self._directory = os.path.abspath(directory)
+        self._size = size
+        self._compiler = compiler
+
+    @staticmethod
+    def from_environment() -> "ObjectCache":
+        return ObjectCache(
+            os.environ["CANARY_OBJECT_CACHE"],
+            int(os.environ.get("CANARY_OBJECT_CACHE_SIZE", 1024 * 1024 * 1024)),
+            os.environ.get("CANARY_CC", "cc"),
+        )
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """The maximum amount of bytes of cached objects"""
+        return self._size
+
+    @property
+    def compiler(self) -> str:
+        return self._compiler
+
+    @property
+    def wrapper(self) -> str:
+        return os.path.join(self._directory, "cc")
+
+    @property
+    def objects_path(self) -> str:
+        return os.path.join(self._directory, "objects")
+
+    @property
+    def stats_path(self) -> str:
+        return os.path.join(self._directory, "stats")
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """The environment variables pointing a build at the cache"""
+        return {
+            "CC": self.wrapper,
+            "CANARY_CC": self._compiler,
+            "CANARY_OBJECT_CACHE": self._directory,
+            "CANARY_OBJECT_CACHE_SIZE": str(self._size),
+        }
+
+    @property
+    def hits(self) -> int:
+        return self._stats().count("hit")
+
+    @property
+    def misses(self) -> int:
+        return self._stats().count("miss")
+
+    def create(self) -> None:
+        """Creates the cache directory and the compiler wrapper within it"""
+        os.makedirs(self._directory, exist_ok=True)
+        # Only compilations are looked up, linking directly runs the compiler
+        file = open(self.wrapper, "w")
+        file.write(
+            "#!/bin/sh\n" +
+            "case \" $* \" in\n" +
+            f"    *\" -c \"*) exec {shlex.quote(sys.executable)} -S {shlex.quote(os.path.abspath(__file__))} \"$@\" ;;\n" +
+            "esac\n" +
+            "exec \"${CANARY_CC:-cc}\" \"$@\"\n"
+        )
+        file.close()
+        os.chmod(self.wrapper, 0o755)
+
+    def compile(self, arguments: List[str]) -> int:
+        """Compiles like the compiler, using the cached object if it exists
+
+        Args:
+            arguments (List[str]): The arguments of the compiler
+
+        Returns:
+            int: The exit code of the compiler
+        """
+        unit = self._translation_unit(arguments)
+        if unit is None: return self._run(arguments)
+        source, output = unit
+
+        key = self._key(arguments, source)
+        if key is None: return self._run(arguments)
+
+        entry = os.path.join(self.objects_path, key[:2], key[2:] + ".o")
+        if os.path.isfile(entry):
+            shutil.copyfile(entry, output)
+            # The modification time of an entry is the time it was last used
+            os.utime(entry)
+            self._record("hit")
+            return 0
+
+        returncode = self._run(arguments)
+        if returncode != 0 or not os.path.isfile(output): return returncode
+        self._record("miss")
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            temporary, temporary_path = tempfile.mkstemp(dir=os.path.dirname(entry))
+            os.close(temporary)
+            shutil.copyfile(output, temporary_path)
+            os.replace(temporary_path, entry)
+            self.evict()
+        # The object is built regardless of whether it could be cached
+        except OSError: pass
+        return returncode
+
+    def evict(self) -> None:
+        """Removes the least recently used objects until the cache fits its size"""
+        entries: List[Tuple[float, int, str]] = list()
+        for root, _, files in os.walk(self.objects_path):
+            for name in files:
+                if not name.endswith(".o"): continue
+                path = os.path.join(root, name)
+                try: stat = os.stat(path)
+                except FileNotFoundError: continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(entry[1] for entry in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._size: break
+            try: os.remove(path)
+            except FileNotFoundError: pass
+            total -= size
+
+    def _translation_unit(self, arguments: List[str]) -> Tuple[str, str]:
+        """The source and object of a compilation of a single translation unit,
+            None if the arguments do anything else.
+        """
+        if "-c" not in arguments: return None
+        sources: List[str] = list()
+        output: str = None
+        skip = False
+        for idx, argument in enumerate(arguments):
+            if skip:
+                skip = False
+                continue
+            if argument in ObjectCache.UNCACHEABLE_FLAGS: return None
+            if argument == "-o":
+                if idx + 1 >= len(arguments): return None
+                output = arguments[idx + 1]
+                skip = True
+            elif argument in ObjectCache.FLAGS_WITH_ARGUMENT:
+                skip = True
+            elif not argument.startswith("-") and \
+                os.path.splitext(argument)[1] in ObjectCache.SOURCE_EXTENSIONS:
+                sources.append(argument)
+        if len(sources) != 1: return None
+        if output is None:
+            output = os.path.splitext(os.path.basename(sources[0]))[0] + ".o"
+        return sources[0], output
+
+    def _key(self, arguments: List[str], source: str) -> str:
+        # The object only depends on the preprocessed source and the code generation
+        #   flags, not on where the source, its includes or the object are located
+        flags: List[str] = list()
+        code_generation_flags: List[str] = list()
+        skip = False
+        for idx, argument in enumerate(arguments):
+            if skip:
+                skip = False
+                continue
+            if argument == "-o":
+                skip = True
+                continue
+            if argument in [ "-c", source ]: continue
+            if argument in ObjectCache.FLAGS_WITH_ARGUMENT:
+                skip = True
+                flags.extend(arguments[idx: idx + 2])
+                if argument not in ObjectCache.PREPROCESSOR_FLAGS:
+                    code_generation_flags.extend(arguments[idx: idx + 2])
+                continue
+            flags.append(argument)
+            if not any(argument.startswith(flag) for flag in ObjectCache.PREPROCESSOR_FLAGS):
+                code_generation_flags.append(argument)
+
+        preprocessed = subprocess.run(
+            [ self._compiler, "-E", "-P" ] + flags + [ source ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        if preprocessed.returncode != 0: return None
+
+        key = hashlib.sha256()
+        key.update(self._compiler_identity().encode())
+        key.update(b"\0".join(flag.encode() for flag in code_generation_flags))
+        key.update(b"\0\0")
+        key.update(preprocessed.stdout)
+        return key.hexdigest()
+
+    def _compiler_identity(self) -> str:
+        path = shutil.which(self._compiler)
+        if path is None: return self._compiler
+        stat = os.stat(os.path.realpath(path))
+        return f"{os.path.realpath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _run(self, arguments: List[str]) -> int:
+        return subprocess.run([ self._compiler ] + arguments).returncode
+
+    def _record(self, event: str) -> None:
+        # Appending a single line is atomic, as concurrent builds share the cache
+        descriptor = os.open(self.stats_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(descriptor, f"{event}\n".encode())
+        os.close(descriptor)
+
+    def _stats(self) -> List[str]:
+        if not os.path.isfile(self.stats_path): return list()
+        file = open(self.stats_path, "r")
+        events = file.read().split()
+        file.close()
+        return events
+
+if __name__ == "__main__":
+    sys.exit(ObjectCache.from_environment().compile(sys.argv[1:]))
@@ -0,0 +1,114 @@
+import threading
+from typing import Dict, List, Tuple
+from instrumentation_trace import CoverageMap
+
+class Prioritiser:
+    """Orders the tests of a mutant by how likely they are to kill it, such that a
+        killing test runs as early as possible. The likelihood is learned from the
+        tests which killed the earlier mutants at the same location, of the same
+        operator and within the same unit. Equally likely tests are ordered by
+        their cost, the amount of locations they visited in the baseline run.
+    """
+    # The kill rates of the more specific sites weigh more
+    LOCATION_WEIGHT: float = 4.0
+    OPERATOR_WEIGHT: float = 2.0
+    UNIT_WEIGHT: float = 1.0
+
+    def __init__(self) -> None:
+        self._coverage: CoverageMap = None
+        # The amount of mutants and the kills of each test, per site
+        self._mutants: Dict[Tuple[str, str], int] = dict()
+        self._kills: Dict[Tuple[str, str], Dict[str, int]] = dict()
+        # The mutants are tested in parallel
+        self._lock = threading.Lock()
+        self._killed = 0
+        self._tests_executed = 0
+
+    @property
+    def killed(self) -> int:
+        """The amount of killed mutants whose killing test is known"""
+        return self._killed
+
+    @property
+    def mean_tests_executed(self) -> float:
+        """The mean amount of tests executed up to and including the first
+            killing test of a mutant, None if no mutant was killed"""
+        if self._killed == 0: return None
+        return self._tests_executed / self._killed
+
+    def calibrate(self, coverage: CoverageMap) -> None:
+        """Sets the baseline run, whose tests are ordered and whose order they run in otherwise"""
+        self._coverage = coverage
+
+    def order(self, tests: List[str], location: str, operator: str, unit: str) -> List[str]:
+        """Orders tests by the likelihood of killing a mutant
+
+        Args:
+            tests (List[str]): The tests to order, if None then every test of the baseline run
+            location (str): The location of the mutant, unique within the unit
+            operator (str): The operator which the mutant replaces
+            unit (str): The unit the mutant is within
+
+        Returns:
+            List[str]: The tests, the most likely killer first
+        """
+        if tests is None:
+            tests = self._coverage.tests if self._coverage is not None else list()
+        sites = self._sites(location, operator, unit)
+        with self._lock:
+            def likelihood(test: str) -> float:
+                score = 0.0
+                for site, weight in sites:
+                    mutants = self._mutants.get(site, 0)
+                    if mutants == 0: continue
+                    kills = self._kills[site].get(test, 0)
+                    score += weight * kills / mutants
+                return score
+            scores = { test: likelihood(test) for test in tests }
+
+        def cost(test: str) -> int:
+            if self._coverage is None: return 0
+            return self._coverage.length_of(test)
+        # Sorting is stable, such that ties remain in the order of the baseline run
+        return sorted(tests, key=lambda test: (-scores[test], cost(test)))
+
+    def record(
+        self,
+        location: str,
+        operator: str,
+        unit: str,
+        executed: List[str],
+        failed_tests: List[str],
+    ) -> None:
+        """Learns from the outcome of a tested mutant
+
+        Args:
+            location (str): The location of the mutant, unique within the unit
+            operator (str): The operator which the mutant replaces
+            unit (str): The unit the mutant is within
+            executed (List[str]): The tests in the order they ran
+            failed_tests (List[str]): The tests which killed the mutant, None if unknown
+        """
+        if failed_tests is None: return
+        sites = self._sites(location, operator, unit)
+        with self._lock:
+            for site, _ in sites:
+                self._mutants[site] = self._mutants.get(site, 0) + 1
+                kills = self._kills.setdefault(site, dict())
+                for test in failed_tests:
+                    kills[test] = kills.get(test, 0) + 1
+
+            # The tests up to the first killing one were executed before the kill
+            for t_idx, test in enumerate(executed):
+                if test in failed_tests:
+                    self._killed += 1
+                    self._tests_executed += t_idx + 1
+                    break
+
+    def _sites(self, location: str, operator: str, unit: str) -> List[Tuple[Tuple[str, str], float]]:
+        # The locations are only unique within a unit
+        return [
+            (("location", f"{unit}:{location}"), Prioritiser.LOCATION_WEIGHT),
+            (("operator", operator), Prioritiser.OPERATOR_WEIGHT),
+            (("unit", unit), Prioritiser.UNIT_WEIGHT),
+        ]
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Dict, List, Tuple
+from instrumentation_trace import Location, Test, Trace, Unit
+from test_results_parsing import TestResults, TestSummary
+
+class ResultCache:
+    """A persistent store of the results of mutants, such that re-running the
+        analysis of an unchanged unit does not build and test its mutants again.
+        A result is keyed by the source of the unit, the mutation within it and a
+        fingerprint of the tests, which covers the test sources and commands.
+    """
+    # The files of the project which the test binary is built from
+    SOURCE_EXTENSIONS: List[str] = [
+        ".c", ".h", ".i", ".cc", ".cpp", ".cxx", ".hh", ".hpp", ".hxx", ".mk",
+    ]
+    BUILD_FILES: List[str] = [ "Makefile", "makefile", "GNUmakefile", "CMakeLists.txt" ]
+
+    def __init__(self, path: str) -> None:
+        self._path = os.path.abspath(path)
+        self._fingerprint = ""
+        self._connection: sqlite3.Connection = None
+        # The connection is shared between the workers testing mutants in parallel
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the tests which the results are currently stored under"""
+        return self._fingerprint
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def open(self) -> None:
+        if os.path.dirname(self._path) != "":
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (" +
+            "key TEXT PRIMARY KEY, " +
+            "outcome TEXT NOT NULL, " +
+            "test_count INTEGER, " +
+            "failure_count INTEGER, " +
+            "success_count INTEGER, " +
+            "trace BLOB NOT NULL, " +
+            "truncated INTEGER NOT NULL)"
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        if self._connection is None: return
+        self._connection.close()
+        self._connection = None
+
+    def fingerprint_tests(self, base: str, excluded: List[str], arguments: List[str]) -> str:
+        """Fingerprints the tests of the project, which every following result is stored under
+
+        Args:
+            base (str): The directory of the project, whose sources and build files are hashed
+            excluded (List[str]): The files which are not part of the fingerprint,
+                such as the mutated file as it is covered by the key of every result
+            arguments (List[str]): The commands and options the results depend on
+
+        Returns:
+            str: The fingerprint
+        """
+        excluded_paths = [ os.path.realpath(path) for path in excluded ]
+        fingerprint = hashlib.sha256()
+        for argument in arguments:
+            fingerprint.update(str(argument).encode())
+            fingerprint.update(b"\0")
+
+        for root, directories, files in os.walk(base or "."):
+            # The hidden directories hold version control and tooling, not the tests
+            directories[:] = sorted(
+                directory for directory in directories if not directory.startswith(".")
+            )
+            for name in sorted(files):
+                if os.path.splitext(name)[1] not in ResultCache.SOURCE_EXTENSIONS and \
+                    name not in ResultCache.BUILD_FILES: continue
+                path = os.path.join(root, name)
+                if os.path.realpath(path) in excluded_paths: continue
+                fingerprint.update(os.path.relpath(path, base or ".").encode())
+                fingerprint.update(b"\0")
+                file = open(path, "rb")
+                fingerprint.update(hashlib.sha256(file.read()).digest())
+                file.close()
+
+        self._fingerprint = fingerprint.hexdigest()
+        return self._fingerprint
+
+    def key(self, unit_source: str, start_byte: int, end_byte: int, replacement: str) -> str:
+        """The key of the result of a mutant
+
+        Args:
+            unit_source (str): The source of the unit which is mutated
+            start_byte (int): The start of the mutated range, relative to the unit
+            end_byte (int): The end of the mutated range, relative to the unit
+            replacement (str): The source replacing the mutated range
+        """
+        key = hashlib.sha256()
+        for part in [ self._fingerprint, unit_source, str(start_byte), str(end_byte), replacement ]:
+            key.update(part.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT 1 FROM results WHERE key = ?", (key,)
+            ).fetchone() is not None
+
+    def get(self, key: str) -> Tuple[str, TestResults]:
+        """The outcome and the test results of a mutant, None if it is not cached"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT outcome, test_count, failure_count, success_count, trace, truncated " +
+                "FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        outcome, test_count, failure_count, success_count, trace, truncated = row
+        return outcome, TestResults(
+            TestSummary(test_count, failure_count, success_count),
+            ResultCache.decode_trace(
+                json.loads(zlib.decompress(trace)), bool(truncated)
+            ),
+        )
+
+    def put(self, key: str, outcome: str, test_results: TestResults) -> None:
+        summary = test_results.summary
+        trace = zlib.compress(
+            json.dumps(ResultCache.encode_trace(test_results.trace)).encode()
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    outcome,
+                    summary.test_count,
+                    summary.failure_count,
+                    summary.success_count,
+                    trace,
+                    int(test_results.trace is not None and test_results.trace.truncated),
+                )
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def encode_trace(trace: Trace) -> List[List[str]]:
+        """The test, unit and identifier of every location of a trace"""
+        locations: List[List[str]] = list()
+        if trace is not None:
+            for location in trace.sequence:
+                locations.append([
+                    location.test.name if location.test is not None else None,
+                    location.unit.name if location.unit is not None else None,
+                    location.id,
+                ])
+        return locations
+
+    @staticmethod
+    def decode_trace(locations: List[List[str]], truncated: bool = False) -> Trace:
+        # The locations of the same test or unit share a single test or unit
+        tests: Dict[str, Test] = dict()
+        units: Dict[str, Unit] = dict()
+        sequence: List[Location] = list()
+        for test_name, unit_name, location_id in locations:
+            test = None
+            if test_name is not None:
+                test = tests.setdefault(test_name, Test(test_name))
+            unit = None
+            if unit_name is not None:
+                unit = units.setdefault(unit_name, Unit(unit_name))
+            sequence.append(Location(test, unit, location_id))
+        return Trace(sequence, truncated)
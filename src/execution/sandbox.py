@@ -0,0 +1,107 @@
+import os
+import re
+import shutil
+import subprocess
+from typing import Set
+
+class Sandbox:
+    def __init__(self, base: str, root: str) -> None:
+        self._base = os.path.abspath(base)
+        self._root = os.path.abspath(root)
+        self._written: Set[str] = set()
+
+    @property
+    def base(self) -> str:
+        return self._base
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    @property
+    def cwd(self) -> str:
+        """The sandboxed equivalent of the current working directory
+
+        Returns:
+            str: The working directory within the sandbox, None if the
+                current working directory is not within the base
+        """
+        cwd = os.getcwd()
+        if not self.contains(cwd): return None
+        return self.path_of(cwd)
+
+    def contains(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        return path == self._base or \
+            path.startswith(self._base + os.sep)
+
+    def path_of(self, path: str) -> str:
+        """Maps a path within the base directory to the same path within the sandbox
+
+        Args:
+            path (str): A path within the base directory
+
+        Returns:
+            str: The path within the sandbox, or the path itself if it is outside the base
+        """
+        if not self.contains(path): return path
+        relative = os.path.relpath(os.path.abspath(path), self._base)
+        return os.path.normpath(os.path.join(self._root, relative))
+
+    def command(self, command: str) -> str:
+        """Rewrites every occurrence of the base directory in a command to the sandbox
+
+        Args:
+            command (str): A build or test command referring to the base directory
+
+        Returns:
+            str: The same command referring to the sandbox
+        """
+        if command is None: return None
+        return re.sub(
+            re.escape(self._base) + r"(?=/|\s|$)",
+            lambda _: self._root,
+            command
+        )
+
+    def create(self) -> None:
+        """Clones the base directory into the sandbox, as a copy-on-write
+            clone where the file system supports it and as a copy otherwise.
+            Hardlinks are not used since builds truncate their outputs in place,
+            which would write through to the original project.
+        """
+        os.makedirs(self._root, exist_ok=True)
+        if shutil.which("cp") is not None:
+            clone = subprocess.run(
+                [ "cp", "-a", "--reflink=auto", f"{self._base}/.", self._root ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if clone.returncode == 0: return
+        shutil.copytree(self._base, self._root, symlinks=True, dirs_exist_ok=True)
+
+    def write(self, file_path: str, contents: str) -> None:
+        """Writes the contents to the sandboxed version of the file. Files written by
+            earlier mutants are restored from the base first, such that only a single
+            file in the sandbox deviates from the base at any time.
+
+        Args:
+            file_path (str): The path of the file within the base directory
+            contents (str): The new contents of the file
+        """
+        for written in list(self._written):
+            if written != file_path: self.restore(written)
+
+        file = open(self.path_of(file_path), "w")
+        file.write(contents)
+        file.close()
+        self._written.add(file_path)
+
+    def restore(self, file_path: str) -> None:
+        # The restored file must be newer than any object built from
+        #   the mutant, otherwise the build would consider it up to date.
+        shutil.copyfile(file_path, self.path_of(file_path))
+        self._written.discard(file_path)
+
+    def destroy(self) -> None:
+        shutil.rmtree(self._root, ignore_errors=True)
@@ -0,0 +1,46 @@
+import tempfile
+from queue import Queue
+from typing import List
+from .sandbox import Sandbox
+
+class SandboxPool:
+    def __init__(self, base: str, size: int, directory: str = None) -> None:
+        self._base = base
+        self._sandboxes: List[Sandbox] = list()
+        for idx in range(size):
+            self._sandboxes.append(Sandbox(
+                base, tempfile.mkdtemp(prefix=f"canary-sandbox-{idx}-", dir=directory)
+            ))
+        self._available: "Queue[Sandbox]" = Queue()
+
+    @property
+    def base(self) -> str:
+        return self._base
+
+    @property
+    def size(self) -> int:
+        return len(self._sandboxes)
+
+    @property
+    def sandboxes(self) -> List[Sandbox]:
+        return self._sandboxes
+
+    def create(self) -> None:
+        for sandbox in self._sandboxes:
+            sandbox.create()
+            self._available.put(sandbox)
+
+    def acquire(self) -> Sandbox:
+        """Blocks until a sandbox is available and takes it out of the pool
+
+        Returns:
+            Sandbox: A sandbox which is not used by any other worker
+        """
+        return self._available.get()
+
+    def release(self, sandbox: Sandbox) -> None:
+        self._available.put(sandbox)
+
+    def destroy(self) -> None:
+        for sandbox in self._sandboxes:
+            sandbox.destroy()
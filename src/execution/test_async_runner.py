@@ -0,0 +1,55 @@
+import subprocess
+import threading
+import time
+import unittest
+from typing import List
+
+from . import AsyncRunner
+
+class TestAsyncRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        self._runner = AsyncRunner(2)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._runner.close()
+        return super().tearDown()
+
+    def test_returncode(self) -> None:
+        self.assertEqual(self._runner.run([ "true" ], timeout=5), (0, False))
+        self.assertEqual(self._runner.run([ "false" ], timeout=5), (1, False))
+
+    def test_output_is_streamed(self) -> None:
+        lines: List[str] = list()
+        self._runner.run([ "printf", "a\\nb\\nc" ], timeout=5, output=lines.append)
+        self.assertEqual(lines, [ "a", "b", "c" ])
+
+    def test_abort_kills(self) -> None:
+        lines: List[str] = list()
+        start = time.perf_counter()
+        _, aborted = self._runner.run(
+            [ "sh", "-c", "echo fail; sleep 5; echo late" ],
+            timeout=10,
+            output=lines.append,
+            abort=lambda line: line == "fail",
+        )
+        self.assertTrue(aborted)
+        self.assertEqual(lines, [ "fail" ])
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_timeout_kills_process_group(self) -> None:
+        start = time.perf_counter()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self._runner.run([ "sh", "-c", "sleep 5 & wait" ], timeout=0.2)
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_concurrency_is_bounded(self) -> None:
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._runner.run, args=([ "sleep", "0.3" ],), kwargs={ "timeout": 5 })
+            for _ in range(4)
+        ]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        # Four subprocesses of which two run at once take at least two rounds
+        self.assertGreaterEqual(time.perf_counter() - start, 0.6)
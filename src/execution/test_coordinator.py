@@ -0,0 +1,88 @@
+import os
+import tempfile
+import threading
+import unittest
+from typing import List
+
+from . import Coordinator, CoordinatorClient, parse_address, format_address
+
+class TestCoordinator(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._coordinator = Coordinator(("127.0.0.1", 0), self._directory.name, 0.5)
+        self._coordinator.start()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._coordinator.stop()
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def client(self, name: str) -> CoordinatorClient:
+        return CoordinatorClient(self._coordinator.address, name, 1.0)
+
+    def test_parse_address(self) -> None:
+        self.assertEqual(parse_address("localhost:7000"), ("localhost", 7000))
+        self.assertEqual(parse_address(":7000"), ("127.0.0.1", 7000))
+        self.assertEqual(parse_address("unix:/tmp/canary.sock"), "/tmp/canary.sock")
+        self.assertEqual(format_address(("localhost", 7000)), "localhost:7000")
+
+    def test_several_workers(self) -> None:
+        job_ids = [ self._coordinator.submit({ "mutant": m_idx }) for m_idx in range(20) ]
+
+        # The workers pull the mutants until the coordinator stops
+        def work(client: CoordinatorClient) -> None:
+            while True:
+                leased = client.lease()
+                if leased is None: break
+                job_id, job = leased
+                client.complete(job_id, { "outcome": job["mutant"] * 2 })
+            client.close()
+
+        workers: List[threading.Thread] = [
+            threading.Thread(target=work, args=(self.client(f"w{w_idx}"),))
+            for w_idx in range(3)
+        ]
+        for thread in workers: thread.start()
+        results = [ self._coordinator.result(job_id) for job_id in job_ids ]
+        self._coordinator.stop()
+        for thread in workers: thread.join()
+
+        self.assertEqual(results, [ { "outcome": m_idx * 2 } for m_idx in range(20) ])
+        self.assertEqual(sum(self._coordinator.workers.values()), 20)
+
+    def test_lost_worker_is_requeued(self) -> None:
+        job_id = self._coordinator.submit({ "mutant": 0 })
+        lost = self.client("lost")
+        self.assertEqual(lost.lease(), (job_id, { "mutant": 0 }))
+        lost.close()
+
+        # The lease expires while the coordinator waits for the result
+        survivor = self.client("survivor")
+        thread = threading.Thread(
+            target=lambda: survivor.complete(survivor.lease()[0], { "outcome": "killed" })
+        )
+        thread.start()
+        result = self._coordinator.result(job_id)
+        thread.join()
+        survivor.close()
+
+        self.assertEqual(result, { "outcome": "killed" })
+        self.assertEqual(self._coordinator.queue.requeued, 1)
+        self.assertEqual(self._coordinator.workers, { "survivor": 1 })
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Unix sockets are not available")
+    def test_unix_socket(self) -> None:
+        path = os.path.join(self._directory.name, "canary.sock")
+        coordinator = Coordinator(path, self._directory.name)
+        coordinator.start()
+        job_id = coordinator.submit({ "mutant": 0 })
+
+        client = CoordinatorClient(path, "w0", 1.0)
+        leased = client.lease()
+        client.complete(leased[0], { "outcome": "survived" })
+        client.close()
+
+        self.assertEqual(coordinator.result(job_id), { "outcome": "survived" })
+        coordinator.stop()
+        self.assertFalse(os.path.exists(path))
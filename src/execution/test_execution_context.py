@@ -0,0 +1,21 @@
+import unittest
+
+from . import ExecutionContext
+
+class TestExecutionContext(unittest.TestCase):
+    def test_timeouts_are_none_until_calibrated(self) -> None:
+        execution = ExecutionContext()
+        self.assertIsNone(execution.build_timeout)
+        self.assertIsNone(execution.test_timeout)
+
+    def test_timeouts_are_multiples_of_the_baseline(self) -> None:
+        execution = ExecutionContext(timeout_multiplier=2.0, timeout_floor=0.5)
+        execution.calibrate(4.0, 1.5)
+        self.assertEqual(execution.build_timeout, 8.0)
+        self.assertEqual(execution.test_timeout, 3.0)
+
+    def test_timeouts_are_at_least_the_floor(self) -> None:
+        execution = ExecutionContext(timeout_multiplier=2.0, timeout_floor=1.0)
+        execution.calibrate(0.0, 0.1)
+        self.assertEqual(execution.build_timeout, 1.0)
+        self.assertEqual(execution.test_timeout, 1.0)
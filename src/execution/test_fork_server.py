@@ -0,0 +1,108 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from . import ForkServer
+
+CANARY_HEADER = os.path.join(
+    os.path.dirname(__file__), "..", "..", "examples", "c_06", "src", "Canary.h"
+)
+
+PROGRAM = """
+#include "Canary.h"
+
+int main(void) {
+    printf("Mutant=%ld\\n", CanaryMutantId());
+    if (CANARY_MUTANT(2)) for (;;);
+    return CANARY_MUTANT(1) ? 3 : 0;
+}
+"""
+
+SPLIT_PROGRAM = """
+#include "Canary.h"
+
+int main(void) {
+    printf("Prefix\\n");
+    CANARY_TWEET_LOCATION(7);
+    printf("Mutant=%ld\\n", CanaryMutantId());
+    CANARY_TWEET_LOCATION(7);
+    return CANARY_MUTANT(1) ? 3 : 0;
+}
+"""
+
+@unittest.skipIf(shutil.which("cc") is None, "requires a C compiler")
+class TestForkServer(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        shutil.copy(CANARY_HEADER, self._directory.name)
+        self._binary = self.compile("program", PROGRAM)
+        self._fork_server = ForkServer(self._binary, timeout=1)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._fork_server.stop()
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def compile(self, name: str, program: str) -> str:
+        source = os.path.join(self._directory.name, f"{name}.c")
+        file = open(source, "w")
+        file.write(program)
+        file.close()
+        binary = os.path.join(self._directory.name, name)
+        subprocess.run([ "cc", "-o", binary, source ], check=True)
+        return binary
+
+    def read(self, path: str) -> str:
+        file = open(path, "r")
+        contents = file.read()
+        file.close()
+        return contents
+
+    def test_run_selects_mutant(self) -> None:
+        self._fork_server.start()
+        out = os.path.join(self._directory.name, "out.txt")
+
+        self.assertEqual(self._fork_server.run(0, out), 0)
+        self.assertEqual(self.read(out), "Mutant=0\n")
+        self.assertEqual(self._fork_server.run(1, out), 3)
+        self.assertEqual(self.read(out), "Mutant=1\n")
+
+    def test_run_times_out(self) -> None:
+        self._fork_server.start()
+        out = os.path.join(self._directory.name, "out.txt")
+
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self._fork_server.run(2, out)
+        # The server continues after the child is killed
+        self.assertEqual(self._fork_server.run(1, out), 3)
+
+    def test_start_requires_handshake(self) -> None:
+        fork_server = ForkServer("true", timeout=1)
+        with self.assertRaises(Exception):
+            fork_server.start()
+        self.assertFalse(fork_server.running)
+
+    def test_split_at_location(self) -> None:
+        binary = self.compile("split", SPLIT_PROGRAM)
+        fork_server = ForkServer(binary, timeout=1, split_location="7")
+        fork_server.start()
+        out = os.path.join(self._directory.name, "out.txt")
+
+        try:
+            # The prefix ran once before the split, later visits do not split again,
+            #   and its output is part of the output of every mutant
+            self.assertEqual(fork_server.run(1, out), 3)
+            self.assertEqual(self.read(out), "Prefix\nLocation=7\nMutant=1\nLocation=7\n")
+            self.assertEqual(fork_server.run(0, out), 0)
+            self.assertEqual(self.read(out), "Prefix\nLocation=7\nMutant=0\nLocation=7\n")
+        finally: fork_server.stop()
+
+    def test_split_location_not_reached(self) -> None:
+        binary = self.compile("split", SPLIT_PROGRAM)
+        fork_server = ForkServer(binary, timeout=1, split_location="8")
+        with self.assertRaises(Exception):
+            fork_server.start()
+        self.assertFalse(fork_server.running)
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+
+from instrumentation_trace import Location, Test, Trace
+from test_results_parsing import TestResults, TestSummary
+from . import Journal
+
+class TestJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "out", "journal.jsonl")
+        self._file_path = os.path.join(self._directory.name, "lib.h")
+        self.write("int add(int a, int b) { return a + b; }")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def write(self, contents: str) -> None:
+        file = open(self._file_path, "w")
+        file.write(contents)
+        file.close()
+
+    def read(self) -> str:
+        file = open(self._file_path, "r")
+        contents = file.read()
+        file.close()
+        return contents
+
+    def journal_mutant(self) -> str:
+        journal = Journal(self._path)
+        journal.open()
+        journal.begin_file(self._file_path, self.read())
+        key = journal.key("int add(int a, int b) { return a + b; }", 33, 34, "-")
+        journal.put(key, "KILLED", TestResults(
+            TestSummary(None, 1, None), Trace([ Location(Test("test_add"), None, "0") ])
+        ))
+        journal.close()
+        return key
+
+    def test_resume_reuses_outcomes(self) -> None:
+        key = self.journal_mutant()
+
+        journal = Journal(self._path)
+        journal.open(resume=True)
+        journal.begin_file(self._file_path, self.read())
+        outcome, test_results = journal.get(key)
+        journal.close()
+
+        self.assertEqual(outcome, "KILLED")
+        self.assertEqual(test_results.summary.failure_count, 1)
+        self.assertEqual([ location.id for location in test_results.trace.sequence ], [ "0" ])
+        self.assertEqual(journal.resumed, 1)
+
+    def test_without_resume_starts_anew(self) -> None:
+        key = self.journal_mutant()
+
+        journal = Journal(self._path)
+        journal.open()
+        self.assertFalse(journal.contains(key))
+        journal.close()
+
+    def test_resume_restores_original_source(self) -> None:
+        self.journal_mutant()
+        self.write("int add(int a, int b) { return a - b; }")
+
+        journal = Journal(self._path)
+        journal.open(resume=True)
+        journal.restore()
+        journal.close()
+
+        self.assertEqual(self.read(), "int add(int a, int b) { return a + b; }")
+
+    def test_resume_ignores_incomplete_entry(self) -> None:
+        key = self.journal_mutant()
+        file = open(self._path, "a")
+        file.write("{\"key\": \"")
+        file.close()
+
+        journal = Journal(self._path)
+        journal.open(resume=True)
+        self.assertTrue(journal.contains(key))
+        journal.close()
+
+    def test_resume_appends_after_incomplete_entry(self) -> None:
+        self.journal_mutant()
+        file = open(self._path, "a")
+        file.write("{\"key\": \"")
+        file.close()
+
+        journal = Journal(self._path)
+        journal.open(resume=True)
+        journal.put("next", "SURVIVED", TestResults(TestSummary(None, 0, None), Trace(list())))
+        journal.close()
+
+        journal = Journal(self._path)
+        journal.open(resume=True)
+        self.assertTrue(journal.contains("next"))
+        journal.close()
@@ -0,0 +1,105 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+
+from . import ObjectCache
+
+@unittest.skipIf(shutil.which("cc") is None, "requires a C compiler")
+class TestObjectCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._cache = ObjectCache(os.path.join(self._directory.name, "cache"))
+        self._cache.create()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def write(self, name: str, contents: str) -> str:
+        path = os.path.join(self._directory.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file = open(path, "w")
+        file.write(contents)
+        file.close()
+        return path
+
+    def compile(self, source: str) -> int:
+        return subprocess.run(
+            [ self._cache.wrapper, "-c", "-o", source[:-2] + ".o", source ],
+            env=dict(os.environ, **self._cache.env),
+        ).returncode
+
+    def test_recompiling_hits(self) -> None:
+        source = self.write("a.c", "int a(int x) { return x + 1; }")
+        self.assertEqual(self.compile(source), 0)
+        os.remove(source[:-2] + ".o")
+        self.assertEqual(self.compile(source), 0)
+
+        self.assertTrue(os.path.isfile(source[:-2] + ".o"))
+        self.assertEqual(self._cache.misses, 1)
+        self.assertEqual(self._cache.hits, 1)
+
+    def test_other_location_hits(self) -> None:
+        self.compile(self.write("a/a.c", "int a(int x) { return x + 1; }"))
+        self.compile(self.write("b/a.c", "int a(int x) { return x + 1; }"))
+        self.assertEqual(self._cache.hits, 1)
+
+    def test_other_include_path_hits(self) -> None:
+        for directory in [ "a", "b" ]:
+            self.write(f"{directory}/inc/x.h", "#define ONE 1")
+            source = self.write(f"{directory}/x.c", "#include \"x.h\"\nint x(int y) { return y + ONE; }")
+            include = os.path.join(self._directory.name, directory, "inc")
+            subprocess.run(
+                [ self._cache.wrapper, f"-I{include}", "-O2", "-c", "-o", source[:-2] + ".o", source ],
+                env=dict(os.environ, **self._cache.env),
+            )
+        self.assertEqual(self._cache.misses, 1)
+        self.assertEqual(self._cache.hits, 1)
+
+    def test_code_generation_flags_miss(self) -> None:
+        source = self.write("a.c", "int a(int x) { return x + 1; }")
+        for flag in [ "-O0", "-O2" ]:
+            subprocess.run(
+                [ self._cache.wrapper, flag, "-c", "-o", source[:-2] + ".o", source ],
+                env=dict(os.environ, **self._cache.env),
+            )
+        self.assertEqual(self._cache.misses, 2)
+
+    def test_mutated_source_misses(self) -> None:
+        source = self.write("a.c", "int a(int x) { return x + 1; }")
+        self.compile(source)
+        self.write("a.c", "int a(int x) { return x - 1; }")
+        self.compile(source)
+        self.assertEqual(self._cache.misses, 2)
+        self.assertEqual(self._cache.hits, 0)
+
+    def test_linking_is_not_cached(self) -> None:
+        source = self.write("main.c", "int main(void) { return 0; }")
+        subprocess.run(
+            [ self._cache.wrapper, "-o", source[:-2], source ],
+            env=dict(os.environ, **self._cache.env),
+            check=True,
+        )
+        self.assertTrue(os.path.isfile(source[:-2]))
+        self.assertEqual(self._cache.misses + self._cache.hits, 0)
+
+    def test_evicts_least_recently_used(self) -> None:
+        first = self.write("a.c", "int a(int x) { return x + 1; }")
+        second = self.write("b.c", "int b(int x) { return x + 2; }")
+        self.compile(first)
+        entries = [
+            os.path.join(root, name)
+            for root, _, files in os.walk(self._cache.objects_path)
+            for name in files if name.endswith(".o")
+        ]
+        os.utime(entries[0], (time.time() - 60, time.time() - 60))
+
+        ObjectCache(self._cache.directory, os.path.getsize(entries[0])).evict()
+        self.assertTrue(os.path.isfile(entries[0]))
+        self._cache = ObjectCache(self._cache.directory, os.path.getsize(entries[0]))
+        self.compile(second)
+        self.assertFalse(os.path.isfile(entries[0]))
@@ -0,0 +1,59 @@
+import unittest
+
+from instrumentation_trace import CoverageMap, TraceTreeBuilder
+from . import Prioritiser
+
+class TestPrioritiser(unittest.TestCase):
+    def setUp(self) -> None:
+        # test_long visits more locations than test_short
+        trace = TraceTreeBuilder() \
+            .start_test("test_long") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .enter_location("1") \
+            .enter_location("1") \
+            .end_unit() \
+            .end_test() \
+            .start_test("test_short") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .end_unit() \
+            .end_test() \
+            .build()
+        self._prioritiser = Prioritiser()
+        self._prioritiser.calibrate(CoverageMap(trace))
+        return super().setUp()
+
+    def test_cheapest_test_first_without_history(self) -> None:
+        self.assertEqual(
+            self._prioritiser.order(None, "0", "+", "add"),
+            [ "test_short", "test_long" ]
+        )
+
+    def test_killing_test_first(self) -> None:
+        self._prioritiser.record("0", "+", "add", [ "test_short", "test_long" ], [ "test_long" ])
+
+        self.assertEqual(
+            self._prioritiser.order([ "test_long", "test_short" ], "0", "+", "add"),
+            [ "test_long", "test_short" ]
+        )
+
+    def test_location_weighs_more_than_operator(self) -> None:
+        self._prioritiser.record("0", "-", "add", [ "test_long", "test_short" ], [ "test_long" ])
+        self._prioritiser.record("1", "+", "add", [ "test_long", "test_short" ], [ "test_short" ])
+
+        self.assertEqual(
+            self._prioritiser.order(None, "0", "+", "add"),
+            [ "test_long", "test_short" ]
+        )
+
+    def test_mean_tests_executed(self) -> None:
+        self.assertIsNone(self._prioritiser.mean_tests_executed)
+
+        self._prioritiser.record("0", "+", "add", [ "test_short", "test_long" ], [ "test_long" ])
+        self._prioritiser.record("0", "-", "add", [ "test_long", "test_short" ], [ "test_long" ])
+        self._prioritiser.record("0", "*", "add", [ "test_long", "test_short" ], [ ])
+        self._prioritiser.record("0", "/", "add", [ "test_long", "test_short" ], None)
+
+        self.assertEqual(self._prioritiser.killed, 2)
+        self.assertEqual(self._prioritiser.mean_tests_executed, 1.5)
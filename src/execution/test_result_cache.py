@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from instrumentation_trace import Location, Test, Trace, Unit
+from test_results_parsing import TestResults, TestSummary
+from . import ResultCache
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "results.db")
+        self._cache = ResultCache(self._path)
+        self._cache.open()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._cache.close()
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def write(self, name: str, contents: str) -> str:
+        path = os.path.join(self._directory.name, name)
+        file = open(path, "w")
+        file.write(contents)
+        file.close()
+        return path
+
+    def test_results_persist(self) -> None:
+        test, unit = Test("test_add"), Unit("add")
+        key = self._cache.key("int add(int a, int b) { return a + b; }", 33, 34, "-")
+        self._cache.put(key, "KILLED", TestResults(
+            TestSummary(None, 1, None),
+            Trace([ Location(test, unit, "0"), Location(test, None, "1") ]),
+        ))
+        self._cache.close()
+
+        self._cache = ResultCache(self._path)
+        self._cache.open()
+        outcome, test_results = self._cache.get(key)
+        sequence = [ *test_results.trace.sequence ]
+
+        self.assertEqual(outcome, "KILLED")
+        self.assertEqual(test_results.summary.failure_count, 1)
+        self.assertIsNone(test_results.summary.test_count)
+        self.assertEqual([ location.id for location in sequence ], [ "0", "1" ])
+        self.assertEqual(sequence[0].test.name, "test_add")
+        self.assertEqual(sequence[0].unit.name, "add")
+        self.assertIsNone(sequence[1].unit)
+        self.assertEqual(self._cache.hits, 1)
+
+    def test_missing_result(self) -> None:
+        self.assertIsNone(self._cache.get(self._cache.key("", 0, 0, "")))
+        self.assertEqual(self._cache.misses, 1)
+
+    def test_fingerprint_excludes_mutated_file(self) -> None:
+        mutated = self.write("lib.h", "int add(int a, int b);")
+        self.write("tests.c", "int main(void) { return 0; }")
+        first = self._cache.fingerprint_tests(self._directory.name, [ mutated ], [ "make" ])
+
+        self.write("lib.h", "int sub(int a, int b);")
+        self.assertEqual(
+            self._cache.fingerprint_tests(self._directory.name, [ mutated ], [ "make" ]), first
+        )
+
+    def test_fingerprint_covers_tests_and_commands(self) -> None:
+        mutated = self.write("lib.h", "int add(int a, int b);")
+        self.write("tests.c", "int main(void) { return 0; }")
+        first = self._cache.fingerprint_tests(self._directory.name, [ mutated ], [ "make" ])
+
+        self.assertNotEqual(
+            self._cache.fingerprint_tests(self._directory.name, [ mutated ], [ "make tests" ]), first
+        )
+        self.write("tests.c", "int main(void) { return 1; }")
+        self.assertNotEqual(
+            self._cache.fingerprint_tests(self._directory.name, [ mutated ], [ "make" ]), first
+        )
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from . import Sandbox, SandboxPool
+
+class TestSandbox(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._base = os.path.join(self._directory.name, "project")
+        os.makedirs(os.path.join(self._base, "src"))
+        for name in [ "a.c", "b.c" ]:
+            file = open(os.path.join(self._base, "src", name), "w")
+            file.write(f"// {name}")
+            file.close()
+        self._sandbox = Sandbox(self._base, os.path.join(self._directory.name, "sandbox"))
+        self._sandbox.create()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def read(self, path: str) -> str:
+        file = open(path, "r")
+        contents = file.read()
+        file.close()
+        return contents
+
+    def test_create_clones_base(self) -> None:
+        path = self._sandbox.path_of(os.path.join(self._base, "src", "a.c"))
+        self.assertEqual(path, os.path.join(self._sandbox.root, "src", "a.c"))
+        self.assertEqual(self.read(path), "// a.c")
+
+    def test_path_of_outside_base(self) -> None:
+        self.assertEqual(self._sandbox.path_of("/usr/include/stdio.h"), "/usr/include/stdio.h")
+
+    def test_command_rewrites_base(self) -> None:
+        command = f"make -C {self._base}/ tests/tests"
+        self.assertEqual(
+            self._sandbox.command(command),
+            f"make -C {self._sandbox.root}/ tests/tests"
+        )
+
+    def test_command_does_not_rewrite_prefixed_paths(self) -> None:
+        command = f"{self._base}-other/tests"
+        self.assertEqual(self._sandbox.command(command), command)
+
+    def test_write_does_not_touch_base(self) -> None:
+        a = os.path.join(self._base, "src", "a.c")
+        self._sandbox.write(a, "mutant")
+        self.assertEqual(self.read(a), "// a.c")
+        self.assertEqual(self.read(self._sandbox.path_of(a)), "mutant")
+
+    def test_write_restores_previously_written(self) -> None:
+        a = os.path.join(self._base, "src", "a.c")
+        b = os.path.join(self._base, "src", "b.c")
+        self._sandbox.write(a, "mutant")
+        self._sandbox.write(b, "mutant")
+        self.assertEqual(self.read(self._sandbox.path_of(a)), "// a.c")
+        self.assertEqual(self.read(self._sandbox.path_of(b)), "mutant")
+
+class TestSandboxPool(unittest.TestCase):
+    def test_acquire_release(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        base = os.path.join(directory.name, "project")
+        os.makedirs(base)
+        pool = SandboxPool(base, 2, directory.name)
+        pool.create()
+
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+
+        pool.destroy()
+        directory.cleanup()
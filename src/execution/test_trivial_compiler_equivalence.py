@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from . import TrivialCompilerEquivalence
+
+@unittest.skipIf(shutil.which("cc") is None, "requires a C compiler")
+class TestTrivialCompilerEquivalence(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._file_path = os.path.join(self._directory.name, "lib.h")
+        self._tce = TrivialCompilerEquivalence("-O2", "cc")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def test_constant_folding_is_equivalent(self) -> None:
+        self.assertEqual(
+            self._tce.hash("int f(void) { return 1 + 2; }", self._file_path),
+            self._tce.hash("int f(void) { return 3; }", self._file_path),
+        )
+
+    def test_different_semantics_differ(self) -> None:
+        self.assertNotEqual(
+            self._tce.hash("int f(int a, int b) { return a + b; }", self._file_path),
+            self._tce.hash("int f(int a, int b) { return a - b; }", self._file_path),
+        )
+
+    def test_unused_static_functions_are_compared(self) -> None:
+        self.assertNotEqual(
+            self._tce.hash("static int f(int a) { return a + 1; }", self._file_path),
+            self._tce.hash("static int f(int a) { return a - 1; }", self._file_path),
+        )
+
+    def test_includes_relative_to_file(self) -> None:
+        file = open(os.path.join(self._directory.name, "value.h"), "w")
+        file.write("#define VALUE 3\n")
+        file.close()
+        self.assertIsNotNone(
+            self._tce.hash("#include \"value.h\"\nint f(void) { return VALUE; }", self._file_path)
+        )
+
+    def test_not_compiling_has_no_hash(self) -> None:
+        self.assertIsNone(self._tce.hash("int f(void) { return }", self._file_path))
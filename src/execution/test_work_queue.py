@@ -0,0 +1,59 @@
+import unittest
+
+from . import WorkQueue
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self._now = 0.0
+        self._queue = WorkQueue(10.0, lambda: self._now)
+        return super().setUp()
+
+    def test_lease_in_order(self) -> None:
+        first = self._queue.put("a")
+        second = self._queue.put("b")
+
+        self.assertEqual(self._queue.lease("w0"), (first, "a"))
+        self.assertEqual(self._queue.lease("w1"), (second, "b"))
+        self.assertIsNone(self._queue.lease("w0"))
+
+    def test_complete_and_result(self) -> None:
+        job_id = self._queue.put("a")
+        self._queue.lease("w0")
+
+        self.assertTrue(self._queue.complete(job_id, "killed"))
+        self.assertEqual(self._queue.pending, 0)
+        self.assertEqual(self._queue.result(job_id), "killed")
+
+    def test_expired_lease_is_requeued(self) -> None:
+        job_id = self._queue.put("a")
+        self._queue.lease("lost")
+        self.assertIsNone(self._queue.lease("w1"))
+
+        self._now = 11.0
+
+        self.assertEqual(self._queue.lease("w1"), (job_id, "a"))
+        self.assertEqual(self._queue.requeued, 1)
+
+    def test_first_result_is_kept(self) -> None:
+        job_id = self._queue.put("a")
+        self._queue.lease("lost")
+        self._now = 11.0
+        self._queue.lease("w1")
+
+        self.assertTrue(self._queue.complete(job_id, "survived"))
+        self.assertFalse(self._queue.complete(job_id, "killed"))
+        self.assertEqual(self._queue.result(job_id), "survived")
+
+    def test_completed_job_is_not_leased_again(self) -> None:
+        job_id = self._queue.put("a")
+        self._queue.lease("slow")
+        self._now = 11.0
+        # The lease expired, but the worker was only slow
+        self.assertIsNone(self._queue.result(job_id, 0))
+        self._queue.complete(job_id, "killed")
+
+        self.assertIsNone(self._queue.lease("w1"))
+
+    def test_result_timeout(self) -> None:
+        job_id = self._queue.put("a")
+        self.assertIsNone(self._queue.result(job_id, 0))
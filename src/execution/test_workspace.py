@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from . import Workspace
+
+class TestWorkspace(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._base = os.path.join(self._directory.name, "project")
+        self._scratch = os.path.join(self._directory.name, "shm")
+        os.makedirs(os.path.join(self._base, "out"))
+        self.write(os.path.join(self._base, "a.c"), "// a.c")
+        self.write(os.path.join(self._base, "out", "journal.jsonl"), "journal")
+        self._workspace = Workspace(self._base, self._scratch, 0)
+        self._workspace.create()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        return super().tearDown()
+
+    def read(self, path: str) -> str:
+        file = open(path, "r")
+        contents = file.read()
+        file.close()
+        return contents
+
+    def write(self, path: str, contents: str) -> None:
+        file = open(path, "w")
+        file.write(contents)
+        file.close()
+
+    def test_create_stages_base(self) -> None:
+        a = self._workspace.path_of(os.path.join(self._base, "a.c"))
+        self.assertTrue(a.startswith(self._scratch + os.sep))
+        self.assertEqual(self.read(a), "// a.c")
+
+    def test_root_is_the_same_per_base(self) -> None:
+        self.assertEqual(Workspace(self._base, self._scratch).root, self._workspace.root)
+
+    def test_sync_copies_back_reports(self) -> None:
+        out = os.path.join(self._base, "out")
+        journal = os.path.join(out, "journal.jsonl")
+        self.write(self._workspace.path_of(os.path.join(out, "add_0.txt")), "report")
+        self.write(self._workspace.path_of(journal), "stale")
+
+        self._workspace.sync(out, [ journal ])
+
+        self.assertEqual(self.read(os.path.join(out, "add_0.txt")), "report")
+        self.assertEqual(self.read(journal), "journal")
+
+    def test_clean_removes_stale_workspaces(self) -> None:
+        stale = os.path.join(self._scratch, f"{Workspace.PREFIX}stale")
+        os.makedirs(stale)
+        self._workspace.clean()
+        self.assertFalse(os.path.exists(stale))
+
+    def test_clean_keeps_workspaces_being_created(self) -> None:
+        other_base = os.path.join(self._directory.name, "other")
+        os.makedirs(other_base)
+        self.write(os.path.join(other_base, "b.c"), "// b.c")
+        other = Workspace(other_base, self._scratch, 0)
+
+        # Another analysis cleans up while the project is copied
+        create = other.sandbox.create
+        def create_while_cleaned() -> None:
+            create()
+            self._workspace.clean()
+        other.sandbox.create = create_while_cleaned
+        other.create()
+
+        self.assertEqual(self.read(other.path_of(os.path.join(other_base, "b.c"))), "// b.c")
+        self.assertTrue(os.path.isfile(f"{other.root}.pid"))
+
+    def test_create_refuses_a_running_workspace(self) -> None:
+        # The workspace is owned by another running process
+        self.write(f"{self._workspace.root}.pid", str(os.getppid()))
+        with self.assertRaises(Exception):
+            Workspace(self._base, self._scratch, 0).create()
+
+    def test_destroy_removes_workspace(self) -> None:
+        self._workspace.destroy()
+        self.assertFalse(os.path.exists(self._workspace.root))
+        self.assertEqual(os.listdir(self._scratch), [ ])
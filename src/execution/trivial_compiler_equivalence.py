@@ -0,0 +1,105 @@
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+from typing import List
+
+class TrivialCompilerEquivalence:
+    """Detects equivalent and duplicate mutants by compiling the mutated translation
+        unit and comparing the object code. A mutant compiling to the same object as
+        the original program is equivalent, and one compiling to the same object as
+        another mutant is a duplicate of it.
+    """
+    # Keeps the functions which are unused within the translation unit, as the
+    #   mutated file may be a header only defining functions for others to call
+    KEEP_FLAGS: List[str] = [ "-fkeep-static-functions", "-fkeep-inline-functions" ]
+
+    def __init__(
+        self,
+        flags: str = "-O2",
+        compiler: str = None,
+    ) -> None:
+        self._flags = flags
+        self._compiler = compiler or os.environ.get("CC", "cc")
+        self._keep_flags: List[str] = None
+        self._lock = threading.Lock()
+        self._compiled = 0
+        self._equivalent = 0
+        self._duplicate = 0
+
+    @property
+    def flags(self) -> str:
+        """The optimisation flags the mutants are compiled with"""
+        return self._flags
+
+    @property
+    def compiler(self) -> str:
+        return self._compiler
+
+    @property
+    def compiled(self) -> int:
+        """The amount of mutants compiled"""
+        return self._compiled
+
+    @property
+    def equivalent(self) -> int:
+        return self._equivalent
+
+    @property
+    def duplicate(self) -> int:
+        return self._duplicate
+
+    def hash(self, source: str, file_path: str) -> str:
+        """The hash of the object code of a translation unit, without its debug information
+
+        Args:
+            source (str): The source of the translation unit
+            file_path (str): The path of the file the source replaces, whose
+                directory is searched for the included files
+
+        Returns:
+            str: The hash, None if the source does not compile
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # The same name for every mutant, as the name is part of the object
+            name = os.path.basename(file_path)
+            file = open(os.path.join(directory, name), "w")
+            file.write(source)
+            file.close()
+
+            completed = subprocess.run(
+                [ self._compiler, "-x", "c", "-c", "-g0" ] +
+                self._flags.split() + self._supported_keep_flags() +
+                [ "-I", os.path.dirname(os.path.abspath(file_path)), "-o", "tce.o", name ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=directory,
+            )
+            if completed.returncode != 0: return None
+
+            file = open(os.path.join(directory, "tce.o"), "rb")
+            object_hash = hashlib.sha256(file.read()).hexdigest()
+            file.close()
+            return object_hash
+
+    def record(self, compiled: int, equivalent: int, duplicate: int) -> None:
+        with self._lock:
+            self._compiled += compiled
+            self._equivalent += equivalent
+            self._duplicate += duplicate
+
+    def _supported_keep_flags(self) -> List[str]:
+        with self._lock:
+            if self._keep_flags is None:
+                # Not every compiler supports them, such that they are tried once
+                completed = subprocess.run(
+                    [ self._compiler, "-x", "c", "-c", "-o", os.devnull ] +
+                    TrivialCompilerEquivalence.KEEP_FLAGS + [ "-" ],
+                    input=b"",
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                self._keep_flags = TrivialCompilerEquivalence.KEEP_FLAGS \
+                    if completed.returncode == 0 else list()
+            return self._keep_flags
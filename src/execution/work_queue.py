@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+class WorkQueue:
+    """The jobs handed out to the workers of a distributed analysis. A worker
+        leases a job, which is queued again when the worker does not complete
+        it within the lease timeout, as the worker may be lost. The first
+        result of a job is kept, those of re-queued copies are ignored.
+    """
+    def __init__(self, lease_timeout: float = 600.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lease_timeout = lease_timeout
+        self._clock = clock
+        self._jobs: Dict[int, Any] = dict()
+        self._queued: Deque[int] = deque()
+        # The worker and the expiry of every leased job
+        self._leases: Dict[int, Tuple[str, float]] = dict()
+        self._results: Dict[int, Any] = dict()
+        self._next_id = 0
+        self._requeued = 0
+        self._condition = threading.Condition()
+
+    @property
+    def lease_timeout(self) -> float:
+        return self._lease_timeout
+
+    @property
+    def requeued(self) -> int:
+        """The amount of times a lease expired and its job was queued again"""
+        return self._requeued
+
+    @property
+    def pending(self) -> int:
+        """The amount of jobs without a result, queued or leased"""
+        with self._condition:
+            return len(self._jobs) - len(self._results)
+
+    def put(self, job: Any) -> int:
+        """Queues a job
+
+        Returns:
+            int: The identifier of the job
+        """
+        with self._condition:
+            job_id = self._next_id
+            self._next_id += 1
+            self._jobs[job_id] = job
+            self._queued.append(job_id)
+            return job_id
+
+    def lease(self, worker: str) -> Tuple[int, Any]:
+        """Takes the next queued job for a worker
+
+        Args:
+            worker (str): The name of the worker, only used for diagnostics
+
+        Returns:
+            Tuple[int, Any]: The identifier and the job, None if no job is queued
+        """
+        with self._condition:
+            self._expire()
+            while len(self._queued) > 0:
+                job_id = self._queued.popleft()
+                # A re-queued job may have been completed by its lost worker after all
+                if job_id not in self._jobs or job_id in self._results: continue
+                self._leases[job_id] = (worker, self._clock() + self._lease_timeout)
+                return job_id, self._jobs[job_id]
+            return None
+
+    def complete(self, job_id: int, result: Any) -> bool:
+        """Stores the result of a leased job
+
+        Returns:
+            bool: Whether the result is kept, False if the job already has one
+        """
+        with self._condition:
+            if job_id not in self._jobs or job_id in self._results: return False
+            self._results[job_id] = result
+            self._leases.pop(job_id, None)
+            self._condition.notify_all()
+            return True
+
+    def result(self, job_id: int, timeout: float = None) -> Any:
+        """Blocks until the job has a result, the leases expire meanwhile
+
+        Args:
+            job_id (int): The identifier of the job
+            timeout (float, optional): The maximum amount of seconds to wait.
+                Defaults to None, waiting until the result arrives.
+
+        Returns:
+            Any: The result, None if it did not arrive within the timeout
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._condition:
+            while job_id not in self._results:
+                self._expire()
+                remaining = self._lease_timeout
+                if deadline is not None:
+                    remaining = min(remaining, deadline - self._clock())
+                    if remaining <= 0: return None
+                self._condition.wait(remaining)
+            # The job is forgotten once its result is taken
+            self._jobs.pop(job_id, None)
+            return self._results.pop(job_id)
+
+    def _expire(self) -> None:
+        now = self._clock()
+        for job_id, (_, expiry) in list(self._leases.items()):
+            if expiry > now: continue
+            del self._leases[job_id]
+            self._queued.append(job_id)
+            self._requeued += 1
@@ -0,0 +1,166 @@
+import hashlib
+import os
+import shutil
+from typing import List
+from .sandbox import Sandbox
+
+class Workspace:
+    """A copy of the project in a RAM-backed directory, such that the mutated
+        sources, the builds and the test output of the mutants never touch the
+        disk. Only the reports in the output directory are synced back.
+
+        The workspace of a project is always at the same path, such that the
+        journal and the result cache of an analysis in it remain valid when
+        it is resumed.
+    """
+    PREFIX: str = "canary-workspace-"
+
+    def __init__(self, base: str, directory: str = "/dev/shm", reserve: int = 64 * 1024 * 1024) -> None:
+        """
+        Args:
+            base (str): The directory of the project
+            directory (str, optional): The RAM-backed directory holding the workspaces. Defaults to "/dev/shm".
+            reserve (int, optional): The amount of bytes which is to remain free
+                in the directory. Defaults to 64 megabytes.
+        """
+        self._directory = os.path.abspath(directory)
+        self._reserve = reserve
+        name = hashlib.sha256(os.path.abspath(base).encode()).hexdigest()[:16]
+        self._sandbox = Sandbox(base, os.path.join(self._directory, f"{Workspace.PREFIX}{name}"))
+        self._least_free: int = None
+
+    @property
+    def base(self) -> str:
+        return self._sandbox.base
+
+    @property
+    def root(self) -> str:
+        return self._sandbox.root
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def sandbox(self) -> Sandbox:
+        return self._sandbox
+
+    @property
+    def free_space(self) -> int:
+        """The amount of bytes free in the directory of the workspace"""
+        free = shutil.disk_usage(self._directory).free
+        if self._least_free is None or free < self._least_free:
+            self._least_free = free
+        return free
+
+    @property
+    def least_free_space(self) -> int:
+        """The least amount of bytes free at any check, None if it was never checked"""
+        return self._least_free
+
+    @property
+    def low_on_space(self) -> bool:
+        return self.free_space < self._reserve
+
+    def create(self) -> None:
+        """Removes the stale workspaces and copies the project into the workspace"""
+        os.makedirs(self._directory, exist_ok=True)
+        self.clean()
+
+        size = Workspace._size_of(self.base)
+        free = self.free_space
+        if size + self._reserve > free:
+            raise Exception(
+                f"The workspace directory {self._directory} has {free} bytes free, the project takes {size} bytes"
+            )
+        # Owned before the copy starts, such that another analysis cleaning
+        #   up meanwhile does not take the partial copy for a stale one
+        file = open(self._pid_file(self.root), "w")
+        file.write(str(os.getpid()))
+        file.close()
+        self._sandbox.create()
+
+    def clean(self) -> None:
+        """Removes the workspaces whose analysis is no longer running, which
+            are left behind when an analysis is killed"""
+        for entry in os.listdir(self._directory):
+            path = os.path.join(self._directory, entry)
+            if not entry.startswith(Workspace.PREFIX) or not os.path.isdir(path):
+                continue
+            owner = Workspace._owner(self._pid_file(path))
+            if owner == os.getpid(): continue
+            if owner is not None and Workspace._is_running(owner):
+                if path == self.root:
+                    raise Exception(f"The project is already analysed in the workspace {path}")
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            if os.path.isfile(self._pid_file(path)):
+                os.remove(self._pid_file(path))
+
+    def path_of(self, path: str) -> str:
+        return self._sandbox.path_of(path)
+
+    def command(self, command: str) -> str:
+        return self._sandbox.command(command)
+
+    @property
+    def cwd(self) -> str:
+        return self._sandbox.cwd
+
+    def sync(self, directory: str, excluded: List[str] = None) -> None:
+        """Copies a directory of the workspace back to the project
+
+        Args:
+            directory (str): The path of the directory within the project
+            excluded (List[str], optional): The paths within the project which
+                are written to directly, whose copies in the workspace are stale.
+                Defaults to None.
+        """
+        workspace_directory = self.path_of(directory)
+        if not os.path.isdir(workspace_directory): return
+        excluded_paths = set(self.path_of(path) for path in excluded or list())
+
+        def ignore(root: str, names: List[str]) -> List[str]:
+            return [ name for name in names if os.path.abspath(os.path.join(root, name)) in excluded_paths ]
+        shutil.copytree(workspace_directory, directory, symlinks=True, ignore=ignore, dirs_exist_ok=True)
+
+    def destroy(self) -> None:
+        self._sandbox.destroy()
+        if os.path.isfile(self._pid_file(self.root)):
+            os.remove(self._pid_file(self.root))
+
+    @staticmethod
+    def _pid_file(root: str) -> str:
+        # Kept outside of the workspace, which would otherwise differ from the project
+        return f"{root}.pid"
+
+    @staticmethod
+    def _owner(pid_file: str) -> int:
+        """The process of the analysis in a workspace, None if it is unknown"""
+        try:
+            file = open(pid_file, "r")
+            pid = int(file.read())
+            file.close()
+        except (OSError, ValueError):
+            return None
+        return pid
+
+    @staticmethod
+    def _is_running(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _size_of(directory: str) -> int:
+        size = 0
+        for root, _, files in os.walk(directory):
+            for file in files:
+                path = os.path.join(root, file)
+                if not os.path.islink(path):
+                    size += os.path.getsize(path)
+        return size
@@ -1,3 +1,4 @@
+from .coverage_map import *
 from .location import *
 from .test import *
 from .trace_parser import *
@@ -0,0 +1,60 @@
+from typing import Dict, List, Set
+from .trace import Trace
+
+class CoverageMap():
+    """The tests visiting each location of a trace, such that a mutant only has
+        to be tested by the tests reaching the location it is within. A location
+        visited outside of any test, before the first test began, may be reached
+        by any of the tests.
+    """
+    def __init__(self, trace: Trace) -> None:
+        self._tests: List[str] = list()
+        self._tests_of: Dict[str, List[str]] = dict()
+        self._unattributed: Set[str] = set()
+        self._lengths: Dict[str, int] = dict()
+        # Locations left out of a truncated trace may still be visited
+        self._complete = not trace.truncated
+        for location in trace.sequence:
+            if location.test is None:
+                self._unattributed.add(location.id)
+                continue
+            test = location.test.name
+            if test not in self._tests:
+                self._tests.append(test)
+            self._lengths[test] = self._lengths.get(test, 0) + 1
+            tests = self._tests_of.setdefault(location.id, list())
+            if test not in tests:
+                tests.append(test)
+
+    @property
+    def tests(self) -> List[str]:
+        """The tests in the order they began"""
+        return self._tests
+
+    @property
+    def complete(self) -> bool:
+        """Whether every visited location is known, otherwise no location is considered unvisited"""
+        return self._complete
+
+    def length_of(self, test: str) -> int:
+        """The amount of locations the test visited, including repeated visits"""
+        return self._lengths.get(test, 0)
+
+    def visits(self, location: str) -> bool:
+        """Whether any test, or the code outside of the tests, reaches the location"""
+        if not self._complete: return True
+        return location in self._tests_of or location in self._unattributed
+
+    def tests_of(self, location: str) -> List[str]:
+        """The tests visiting the location, in the order they began
+
+        Args:
+            location (str): The identifier of the location
+
+        Returns:
+            List[str]: The tests, None if the tests reaching it are not known
+                such that all of them have to be run
+        """
+        if location is None or location in self._unattributed: return None
+        if not self._complete and location not in self._tests_of: return None
+        return self._tests_of.get(location, list())
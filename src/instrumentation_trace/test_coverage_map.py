@@ -0,0 +1,95 @@
+import unittest
+
+from . import (
+    CoverageMap,
+    TraceTreeBuilder,
+)
+
+class TestCoverageMap(unittest.TestCase):
+    def test_trace_spans_every_test(self) -> None:
+        trace = TraceTreeBuilder() \
+            .start_test("test_add") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .end_unit() \
+            .end_test() \
+            .start_test("test_sub") \
+            .start_unit("sub") \
+            .enter_location("1") \
+            .end_unit() \
+            .end_test() \
+            .build()
+
+        sequence = [ *trace.sequence ]
+        self.assertEqual(len(sequence), 2)
+        self.assertEqual(sequence[0].test.name, "test_add")
+        self.assertEqual(sequence[1].test.name, "test_sub")
+
+    def test_tests_of_location(self) -> None:
+        trace = TraceTreeBuilder() \
+            .start_test("test_a") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .enter_location("1") \
+            .end_unit() \
+            .end_test() \
+            .start_test("test_b") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .enter_location("2") \
+            .end_unit() \
+            .end_test() \
+            .build()
+
+        coverage = CoverageMap(trace)
+
+        self.assertEqual(coverage.tests, [ "test_a", "test_b" ])
+        self.assertEqual(coverage.tests_of("0"), [ "test_a", "test_b" ])
+        self.assertEqual(coverage.tests_of("1"), [ "test_a" ])
+        self.assertEqual(coverage.tests_of("2"), [ "test_b" ])
+        self.assertTrue(coverage.visits("2"))
+
+    def test_unvisited_location(self) -> None:
+        trace = TraceTreeBuilder() \
+            .start_test("test_a") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .end_unit() \
+            .end_test() \
+            .build()
+
+        coverage = CoverageMap(trace)
+
+        self.assertFalse(coverage.visits("3"))
+        self.assertEqual(coverage.tests_of("3"), [ ])
+
+    def test_location_outside_of_tests(self) -> None:
+        # Without test markers the tests reaching a location are unknown
+        trace = TraceTreeBuilder() \
+            .start_unit("add") \
+            .enter_location("0") \
+            .end_unit() \
+            .build()
+
+        coverage = CoverageMap(trace)
+
+        self.assertTrue(coverage.visits("0"))
+        self.assertIsNone(coverage.tests_of("0"))
+        self.assertFalse(coverage.visits("1"))
+
+    def test_truncated_trace(self) -> None:
+        trace = TraceTreeBuilder(1) \
+            .start_test("test_a") \
+            .start_unit("add") \
+            .enter_location("0") \
+            .enter_location("1") \
+            .end_unit() \
+            .end_test() \
+            .build()
+
+        coverage = CoverageMap(trace)
+
+        self.assertFalse(coverage.complete)
+        self.assertTrue(coverage.visits("1"))
+        self.assertIsNone(coverage.tests_of("1"))
+        self.assertEqual(coverage.tests_of("0"), [ "test_a" ])
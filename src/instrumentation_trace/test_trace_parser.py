@@ -392,4 +392,26 @@ class TestTraceParser(unittest.TestCase):
         location_10: Location = sequence[9]
         self.assertEqual(location_10.test.name, "Andreas")
         self.assertEqual(location_10.unit.name, "Tommy1")
-        self.assertEqual(location_10.id, "10")
\ No newline at end of file
+        self.assertEqual(location_10.id, "10")
+
+    def test_trace_tree_builder_truncates_at_max_length(self) -> None:
+        builder = TraceTreeBuilder(max_length=2)
+
+        trace = builder \
+            .enter_location("0") \
+            .enter_location("1") \
+            .enter_location("2") \
+            .build()
+
+        self.assertEqual([ location.id for location in trace.sequence ], [ "0", "1" ])
+        self.assertTrue(trace.truncated)
+
+    def test_trace_parser_infected_mutants(self) -> None:
+        parser = TraceParser(TraceTreeBuilder(max_length=1))
+
+        parser.parse([ "BeginTest=Andreas", "Location=0", "Infected=3", "Location=1", "Infected=7" ])
+        trace = parser.finish()
+
+        # Infections are kept even when the locations are truncated
+        self.assertEqual(trace.infected, { "3", "7" })
+        self.assertTrue(trace.truncated)
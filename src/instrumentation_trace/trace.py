@@ -1,17 +1,31 @@
-from typing import List, Iterable
+from typing import List, Iterable, Set
 from .location import Location
 
 class Trace():
     def __init__(
         self,
-        sequence: List[Location] = list()
+        sequence: List[Location] = list(),
+        truncated: bool = False,
+        infected: Set[str] = None,
     ) -> None:
         self._sequence = sequence
+        self._truncated = truncated
+        self._infected = infected or set()
 
     @property
     def sequence(self) -> Iterable[Location]:
         return self._sequence
 
+    @property
+    def truncated(self) -> bool:
+        """Whether locations were left out for exceeding the maximum length of the trace"""
+        return self._truncated
+
+    @property
+    def infected(self) -> Set[str]:
+        """The mutants of a weak mutant schemata which changed the value of their expression"""
+        return self._infected
+
     def __len__(self) -> int:
         return len(self.sequence)
 
@@ -27,6 +27,8 @@ class TraceParser():
                 self.builder.end_unit()
             elif action == "Location":
                 self.builder.enter_location(information)
+            elif action == "Infected":
+                self.builder.infect(information)
             else: break
 
     def finish(self) -> Trace:
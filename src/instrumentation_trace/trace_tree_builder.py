@@ -1,14 +1,22 @@
-from typing import List
+from typing import List, Set
 from .unit import Unit
 from .location import Location
 from .test import Test
 from .trace import Trace
 
 class TraceTreeBuilder():
-    def __init__(self) -> None:
+    def __init__(self, max_length: int = None) -> None:
         self._unit_stack: List[Unit] = list()
         self._sequence: List[Location] = list()
         self._current_test = None
+        self._max_length = max_length
+        self._truncated = False
+        self._infected: Set[str] = set()
+
+    @property
+    def max_length(self) -> int:
+        """The maximum amount of locations in the trace, if None then it is unbounded"""
+        return self._max_length
 
     @property
     def current_unit(self) -> Unit:
@@ -25,7 +33,7 @@ class TraceTreeBuilder():
         return len(self._unit_stack)
 
     def start_test(self, test_name: str) -> "TraceTreeBuilder":
-        self._sequence: List[Location] = list()
+        # The trace spans every test, each location records the test it was visited by
         self._current_test = Test(test_name)
         return self
 
@@ -39,6 +47,10 @@ class TraceTreeBuilder():
         self,
         location_name: str
     ) -> "TraceTreeBuilder":
+        if self._max_length is not None and \
+            len(self._sequence) >= self._max_length:
+            self._truncated = True
+            return self
         location = Location(
             self.current_test,
             self.current_unit,
@@ -47,6 +59,10 @@ class TraceTreeBuilder():
         self._sequence.append(location)
         return self
 
+    def infect(self, mutant: str) -> "TraceTreeBuilder":
+        self._infected.add(mutant)
+        return self
+
     def end_unit(self) -> "TraceTreeBuilder":
         self._unit_stack.pop()
         return self
@@ -56,5 +72,7 @@ class TraceTreeBuilder():
 
     def build(self) -> Trace:
         return Trace(
-            self._sequence
+            self._sequence,
+            self._truncated,
+            self._infected,
         )
\ No newline at end of file
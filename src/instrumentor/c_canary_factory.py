@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Tuple
 from ts import Node, CNodeType
 from .tree_infection import TreeInfection
 from .canary_factory import CanaryFactory
@@ -39,6 +39,25 @@ class CCanaryFactory(CanaryFactory):
     def create_state_tweet(self, _: Node, prefix: str, postfix: str) -> str:
         return f"{prefix}CANARY_TWEET_LOCATION(l);{postfix}"
 
+    def create_mutant_condition(self, mutant_id: int) -> str:
+        return f"CANARY_MUTANT({mutant_id})"
+
+    def create_mutant_switch(self, variants: Iterable[Tuple[int, str]], original: str) -> str:
+        # Selects the variant of the active mutant, and the original otherwise
+        switch = "".join(
+            f"{self.create_mutant_condition(mutant_id)} ? ({variant}) : "
+            for mutant_id, variant in variants
+        )
+        return f"({switch}({original}))"
+
+    def create_infection_check(self, variants: Iterable[Tuple[int, str]], original: str) -> str:
+        # Evaluates every variant next to the original, the value remains that of the original
+        checks = "".join(
+            f"CANARY_INFECTION({mutant_id}, ({variant}), ({original})), "
+            for mutant_id, variant in variants
+        )
+        return f"({checks}({original}))"
+
     def create_location_tweets(
         self,
         node: Node,
@@ -121,12 +121,7 @@ class CTreeInfestator(TreeInfestator):
                 nests.extend(self.nests_of_function_definition(node))
 
         # Remove duplicates
-        corrected: List[Node] = list()
-        for nest in nests:
-            if nest not in corrected:
-                corrected.append(nest)
-
-        return corrected
+        return list(dict.fromkeys(nests))
 
     def infection_spore_expression_statement(self, _: Node) -> List[TreeInfection]:
         return [ ]
@@ -241,6 +236,13 @@ class CTreeInfestator(TreeInfestator):
         return [ self._canary_factory.insert_location_tweet(node) ]
 
     def infect(self, tree: Tree, cfa: CFA[CFANode]) -> Tree:
+        return self.infect_all(tree, [ cfa ])
+
+    def infect_all(self, tree: Tree, cfas: List[CFA[CFANode]]) -> Tree:
+        """Instruments the units of several CFAs of the same tree at once, their
+            locations are numbered by the same canary factory such that they are
+            unique within the tree
+        """
         probes: Dict[str, Callable[[Node], List[TreeInfection]]] = {
             # Sequential statements
             CNodeType.EXPRESSION_STATEMENT.value: self.infection_spore_expression_statement,
@@ -263,9 +265,10 @@ class CTreeInfestator(TreeInfestator):
 
         # Step 1: Find the infections
         infections: List[TreeInfection] = [ ]
-        for nest in self.nests(cfa):
-            if nest.type in probes:
-                infections.extend(probes[nest.type](nest))
+        for cfa in cfas:
+            for nest in self.nests(cfa):
+                if nest.type in probes:
+                    infections.extend(probes[nest.type](nest))
 
         # Step 2: Infect the tree from end to start
         infections.sort(key=lambda x: x.last_byte_index, reverse=True)
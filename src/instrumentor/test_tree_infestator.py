@@ -585,6 +585,33 @@ class TestTreeInfestator(unittest.TestCase):
         self.assertEqual(expected, actual.text)
         self.assertTrue(True)
 
+    def test_infect_all_units(self) -> None:
+        program: str = """
+        void Foo() {
+            a = b;
+        }
+        void Bar() {
+            if (a) { }
+        }
+        """
+        tree: Tree = self._parser.parse(program)
+        cfas: List[CFA[CFANode]] = [
+            CCFAFactory(tree).create(definition.child_by_field(CField.BODY))
+            for definition in tree.root.named_children
+        ]
+
+        expected: str = """
+        void Foo() {CANARY_TWEET_LOCATION(0);
+            a = b;
+        }
+        void Bar() {CANARY_TWEET_LOCATION(3);
+            if (a) {CANARY_TWEET_LOCATION(2); }CANARY_TWEET_LOCATION(1);
+        }
+        """
+        actual = self._infestator.infect_all(tree, cfas)
+
+        self.assertEqual(expected, actual.text)
+
     def test_infect_bunch(self) -> None:
         programs: List[Tuple[str, str, str]] = [
             ("if_1", 
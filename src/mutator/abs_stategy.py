@@ -1,5 +1,5 @@
 from random import choice
-from typing import List
+from typing import Dict, List
 from ts import Tree, Node, CField, CNodeType, CSyntax, Parser
 from .mutation_strategy import MutationStrategy
 from .mutation import Mutation, ReplacementMutation, WrappedMutation
@@ -10,26 +10,29 @@ class AbsStrategy(MutationStrategy):
         self._language = parser.language
         self._syntax = CSyntax()
 
-    def capture(self, node: Node) -> List[Node]:
-        query_capture = self._language.query(
+    def queries(self) -> List[str]:
+        return [
             self._syntax.binary_expression_query + \
             self._syntax.unary_expression_query + \
             self._syntax.number_literal_query + \
             self._syntax.declaration_query
-        ).captures(node)
+        ]
+
+    def capture(self, node: Node) -> List[Node]:
+        query_capture = self._language.query(self.queries()[0]).captures(node)
         
         nodes: List[Node] = query_capture.nodes()
-        result: List[Node] = list()
+        result: Dict[Node, None] = dict()
         for node in nodes:
             if node.is_type(CNodeType.BINARY_EXPRESSION) and ( \
                 node.children[1].is_either_type(self._syntax.arithmetic_operators or \
                 node.children[1].is_either_type(self._syntax.arithmetic_compound_assignment))):
-                if node not in result: result.append(node)
+                result[node] = None
             elif node.is_type(CNodeType.UNARY_EXPRESSION) and \
                 node.children[0].is_either_type(self._syntax.arithmetic_operators):
-                if node not in result: result.append(node)
+                result[node] = None
             elif node.is_type(CNodeType.NUMBER_LITERAL):
-                if node not in result: result.append(node)
+                result[node] = None
             # elif node.is_type(CNodeType.DECLARATION) and \
             #     node.child_by_field(CField.DECLARATOR).is_type(CNodeType.INIT_DECLARATOR):
             #     type_node = node.child_by_field(CField.TYPE)
@@ -41,7 +44,7 @@ class AbsStrategy(MutationStrategy):
             #         if type_type_node is not None:
             #             type_type_node.is_type(CNodeType.PRIMITIVE_TYPE)
             #         pass
-        return result
+        return list(result)
 
     def mutate(
         self,
@@ -18,6 +18,13 @@ class CompositeStrategy(ABC):
             )
         return result
 
+    def queries(self) -> List[str]:
+        result = list()
+        for component in self._composition:
+            for query in component.queries():
+                if query not in result: result.append(query)
+        return result
+
     def mutate(
         self,
         tree: Tree,
@@ -0,0 +1,220 @@
+import re
+from typing import Dict, List, Tuple
+from instrumentor import CCanaryFactory
+from ts import Tree, Node, Parser
+from .mutation import Mutation
+
+SiteKey = Tuple[int, int, str]
+
+class MutantSchemata:
+    """Combines the mutations of a single tree into one meta-mutant. Every mutated
+        site becomes a switch on the runtime mutant identifier, such that the program
+        is built once and each mutant is selected by its identifier when testing.
+        The identifier 0 selects the original program.
+
+        A weak schemata instead evaluates every variant next to the original, and
+        tweets the mutants which change the value of their site. Only sites without
+        side effects can be evaluated more than once, the others are left out.
+    """
+    # The nodes which can be replaced by a conditional expression
+    EXPRESSIONS: List[str] = [
+        "assignment_expression",
+        "binary_expression",
+        "call_expression",
+        "cast_expression",
+        "char_literal",
+        "conditional_expression",
+        "false",
+        "field_expression",
+        "identifier",
+        "number_literal",
+        "parenthesized_expression",
+        "pointer_expression",
+        "subscript_expression",
+        "true",
+        "unary_expression",
+        "update_expression",
+    ]
+
+    # Sites within these nodes must be constant expressions, or are never compiled
+    CONSTANT_CONTEXTS: List[str] = [
+        "array_declarator",
+        "bitfield_clause",
+        "enumerator",
+        "field_declaration",
+        "preproc_arg",
+        "preproc_call",
+        "preproc_def",
+        "preproc_elif",
+        "preproc_function_def",
+        "preproc_if",
+        "preproc_ifdef",
+        "static_assert_declaration",
+    ]
+
+    # Evaluating these more than once changes the state, or may crash where the original did not
+    IMPURE_EXPRESSIONS: List[str] = [
+        "assignment_expression",
+        "call_expression",
+        "pointer_expression",
+        "subscript_expression",
+        "update_expression",
+    ]
+
+    # Replacements which change the state, or trap on a zero divisor
+    IMPURE_REPLACEMENT = re.compile(r"\+\+|--|<<=|>>=|(?<![=!<>])=(?!=)|/|%")
+
+    def __init__(
+        self,
+        parser: Parser,
+        tree: Tree,
+        canary_factory: CCanaryFactory = None,
+        weak: bool = False,
+    ) -> None:
+        self._parser = parser
+        self._tree = tree
+        self._canary_factory = canary_factory or CCanaryFactory()
+        self._weak = weak
+        self._sites: Dict[SiteKey, Node] = dict()
+        self._variants: Dict[SiteKey, List[Tuple[int, str]]] = dict()
+        self._mutant_count = 0
+
+    @property
+    def tree(self) -> Tree:
+        return self._tree
+
+    @property
+    def mutant_count(self) -> int:
+        return self._mutant_count
+
+    @property
+    def weak(self) -> bool:
+        """Whether the variants are compared to the original instead of selected"""
+        return self._weak
+
+    def add(self, mutation: Mutation) -> int:
+        """Adds the mutation as a variant of its enclosing expression
+
+        Args:
+            mutation (Mutation): A mutation of the schemata's tree
+
+        Returns:
+            int: The identifier selecting the mutant at runtime, None if the
+                mutation cannot be part of the schemata
+        """
+        if mutation.tree is not self._tree: return None
+        site = self._site_of(mutation.node)
+        if site is None: return None
+        if self._weak and not self._is_pure(site, mutation.replacement): return None
+
+        variant = self._tree.contents_between(site.start_byte, mutation.node.start_byte) + \
+            mutation.replacement + \
+            self._tree.contents_between(mutation.node.end_byte, site.end_byte)
+
+        self._mutant_count += 1
+        key = self._key_of(site)
+        if key not in self._sites:
+            self._sites[key] = site
+            self._variants[key] = list()
+        self._variants[key].append((self._mutant_count, variant))
+        return self._mutant_count
+
+    def apply(self, encoding: str = "utf8") -> Tree:
+        """Creates the meta-mutant, the outermost sites are replaced back to front
+            such that the positions of the remaining sites remain valid.
+
+        Returns:
+            Tree: The tree containing every variant of every site
+        """
+        tree = self._tree
+        outermost = [
+            key for key in self._sites
+            if self._enclosing(key) is None
+        ]
+        for key in sorted(outermost, reverse=True):
+            tree = self._parser.replace(
+                tree, self._sites[key], self._render(key), encoding
+            )
+        return tree
+
+    def _render(self, key: SiteKey) -> str:
+        start, end, _ = key
+        original = ""
+        position = start
+        for child in sorted(self._children(key)):
+            original += self._tree.contents_between(position, child[0]) + self._render(child)
+            position = child[1]
+        original += self._tree.contents_between(position, end)
+        if self._weak:
+            return self._canary_factory.create_infection_check(
+                self._variants[key], original
+            )
+        return self._canary_factory.create_mutant_switch(
+            self._variants[key], original
+        )
+
+    def _children(self, key: SiteKey) -> List[SiteKey]:
+        return [
+            other for other in self._sites
+            if self._enclosing(other) == key
+        ]
+
+    def _enclosing(self, key: SiteKey) -> SiteKey:
+        """The innermost other site containing the site"""
+        enclosing: SiteKey = None
+        for other in self._sites:
+            if other == key: continue
+            if other[0] > key[0] or other[1] < key[1]: continue
+            if other[:2] == key[:2] and other > key: continue
+            if enclosing is None or \
+                (other[0] >= enclosing[0] and other[1] <= enclosing[1]):
+                enclosing = other
+        return enclosing
+
+    def _is_pure(self, site: Node, replacement: str) -> bool:
+        if MutantSchemata.IMPURE_REPLACEMENT.search(replacement) is not None: return False
+        nodes = [ site ]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if node.type in MutantSchemata.IMPURE_EXPRESSIONS: return False
+            if node.type == "field_expression" and \
+                any(child.type == "->" for child in node.children): return False
+            nodes.extend(node.children)
+        return True
+
+    def _key_of(self, node: Node) -> SiteKey:
+        return (node.start_byte, node.end_byte, node.type)
+
+    def _site_of(self, node: Node) -> Node:
+        """The smallest expression containing the node which can be replaced by
+            a switch between its variants, None if there is none.
+        """
+        site = node
+        while site is not None and site.type not in MutantSchemata.EXPRESSIONS:
+            site = site.parent
+        if site is None: return None
+
+        # A conditional expression is not an lvalue
+        parent = site.parent
+        if parent is None: return None
+        if parent.type == "assignment_expression" and \
+            parent.child_by_field_name("left") == site: return None
+        if parent.type == "update_expression": return None
+        if parent.type == "pointer_expression" and \
+            parent.children[0].type == "&": return None
+
+        # Only sites evaluated within a function body are selected at runtime
+        current = site
+        in_body = False
+        while current.parent is not None:
+            parent = current.parent
+            if parent.type in MutantSchemata.CONSTANT_CONTEXTS: return None
+            if parent.type == "case_statement" and \
+                parent.child_by_field_name("value") == current: return None
+            if parent.type == "declaration" and \
+                any(child.type == "storage_class_specifier" for child in parent.children): return None
+            if parent.type == "function_definition" and \
+                parent.child_by_field_name("body") == current: in_body = True
+            current = parent
+        if not in_body: return None
+        return site
@@ -12,10 +12,23 @@ class Mutation(ABC):
         self._tree = tree
         self._node = node
 
+    @property
+    def parser(self) -> Parser:
+        return self._parser
+
+    @property
+    def tree(self) -> Tree:
+        return self._tree
+
     @property
     def node(self) -> Node:
         return self._node
 
+    @property
+    @abstractmethod
+    def replacement(self) -> str:
+        """The source which replaces the node in the mutated tree"""
+
     @abstractmethod
     def apply(self, encoding: str = "utf8") -> Tree:
         pass
@@ -35,6 +48,10 @@ class ReplacementMutation(Mutation):
         self._replacement = replacement
         super().__init__(parser, tree, node)
 
+    @property
+    def replacement(self) -> str:
+        return self._replacement
+
     def apply(self, encoding: str = "utf8") -> Tree:
         return self._parser.replace(
             self._tree,
@@ -60,6 +77,10 @@ class WrappedMutation(Mutation):
         super().__init__(parser, tree, node)
         self._replacement = f'{prefix}{self._tree.contents_of(self._node)}{postfix}'
 
+    @property
+    def replacement(self) -> str:
+        return self._replacement
+
     def apply(self, encoding: str = "utf8") -> Tree:
         return self._parser.replace(
             self._tree,
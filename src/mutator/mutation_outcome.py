@@ -0,0 +1,19 @@
+from enum import Enum
+
+class MutationOutcome(Enum):
+    KILLED = "KILLED"
+    SURVIVED = "SURVIVED"
+    # The tests did not finish within their timeout, counted as detected
+    TIMEOUT = "TIMEOUT"
+    # The mutant compiled to the same object as the original program
+    EQUIVALENT = "EQUIVALENT"
+    # None of the tests reach the location of the mutant, such that it is not tested
+    NO_COVERAGE = "NO_COVERAGE"
+    # The mutant never changed the value of its expression on any test, such that it is not tested
+    SURVIVED_NOT_INFECTED = "SURVIVED_NOT_INFECTED"
+    # The mutant did not build, such that it was not tested, counted as detected
+    BUILD_FAILED = "BUILD_FAILED"
+
+    @property
+    def is_detected(self) -> bool:
+        return self in [ MutationOutcome.KILLED, MutationOutcome.TIMEOUT, MutationOutcome.BUILD_FAILED ]
@@ -12,6 +12,10 @@ class MutationStrategy(ABC):
     def capture(self, node: Node) -> List[Node]:
         pass
 
+    def queries(self) -> List[str]:
+        """The sources of the queries run by the capture, such that they can be precompiled"""
+        return list()
+
     @abstractmethod
     def mutate(
         self,
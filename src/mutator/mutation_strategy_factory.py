@@ -25,5 +25,7 @@ class MutationStrategyFactory():
             elif n == "lcr": composition.append(LcrStrategy(parser))
             elif n == "ror": composition.append(RorStrategy(parser))
             elif n == "uoi": composition.append(UoiStrategy(parser))
-        if len(composition) == 1: return composition[0]
-        return CompositeStrategy(composition)
\ No newline at end of file
+        strategy = composition[0] if len(composition) == 1 else CompositeStrategy(composition)
+        if parser.language is not None:
+            parser.language.precompile(strategy.queries())
+        return strategy
\ No newline at end of file
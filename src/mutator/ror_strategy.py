@@ -10,6 +10,9 @@ class RorStrategy(MutationStrategy):
         self._language = parser.language
         self._syntax = CSyntax()
 
+    def queries(self) -> List[str]:
+        return [ self._syntax.binary_expression_query ]
+
     def capture(self, node: Node) -> List[Node]:
         binary_expression_capture = self._language.query(
             self._syntax.binary_expression_query
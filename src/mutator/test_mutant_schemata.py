@@ -0,0 +1,146 @@
+from unittest import TestCase
+from .mutant_schemata import MutantSchemata
+from .mutation import ReplacementMutation
+from ts import (
+    LanguageLibrary,
+    Parser,
+    Node,
+)
+
+class TestMutantSchemata(TestCase):
+    def setUp(self) -> None:
+        LanguageLibrary.build()
+        self._language = LanguageLibrary.c()
+        self._parser = Parser.create_with_language(self._language)
+        return super().setUp()
+
+    def operators(self, tree, operator: str):
+        operators = list()
+        cursor = [ tree.root ]
+        while len(cursor) > 0:
+            node: Node = cursor.pop()
+            if node.type == operator: operators.append(node)
+            cursor.extend(node.children)
+        return sorted(operators, key=lambda node: node.start_byte)
+
+    def test_single_site(self) -> None:
+        tree = self._parser.parse("int f(int a, int b) { return a + b; }")
+        schemata = MutantSchemata(self._parser, tree)
+        plus = self.operators(tree, "+")[0]
+
+        self.assertEqual(schemata.add(ReplacementMutation(self._parser, tree, plus, "-")), 1)
+        self.assertEqual(schemata.add(ReplacementMutation(self._parser, tree, plus, "*")), 2)
+
+        result = schemata.apply()
+        self.assertEqual(
+            result.text,
+            "int f(int a, int b) { return (CANARY_MUTANT(1) ? (a - b) : CANARY_MUTANT(2) ? (a * b) : (a + b)); }"
+        )
+        self.assertFalse(result.root.has_error)
+
+    def test_non_ascii_source(self) -> None:
+        tree = self._parser.parse("/* ø */ int f(int a, int b) { return a + b; }")
+        schemata = MutantSchemata(self._parser, tree)
+        plus = self.operators(tree, "+")[0]
+
+        self.assertEqual(schemata.add(ReplacementMutation(self._parser, tree, plus, "-")), 1)
+
+        result = schemata.apply()
+        self.assertEqual(
+            result.text,
+            "/* ø */ int f(int a, int b) { return (CANARY_MUTANT(1) ? (a - b) : (a + b)); }"
+        )
+        self.assertFalse(result.root.has_error)
+
+    def test_nested_sites(self) -> None:
+        tree = self._parser.parse("int f(int a, int b, int c) { return a + b * c; }")
+        schemata = MutantSchemata(self._parser, tree)
+        plus = self.operators(tree, "+")[0]
+        times = self.operators(tree, "*")[0]
+
+        schemata.add(ReplacementMutation(self._parser, tree, plus, "-"))
+        schemata.add(ReplacementMutation(self._parser, tree, times, "/"))
+
+        result = schemata.apply()
+        self.assertEqual(
+            result.text,
+            "int f(int a, int b, int c) { return (CANARY_MUTANT(1) ? (a - b * c) : " +
+            "(a + (CANARY_MUTANT(2) ? (b / c) : (b * c)))); }"
+        )
+        self.assertFalse(result.root.has_error)
+
+    def test_multiple_sites(self) -> None:
+        tree = self._parser.parse("void f(int a) { a = a + 1; a = a - 1; }")
+        schemata = MutantSchemata(self._parser, tree)
+        plus = self.operators(tree, "+")[0]
+        minus = self.operators(tree, "-")[0]
+
+        schemata.add(ReplacementMutation(self._parser, tree, plus, "-"))
+        schemata.add(ReplacementMutation(self._parser, tree, minus, "+"))
+
+        self.assertEqual(
+            schemata.apply().text,
+            "void f(int a) { a = (CANARY_MUTANT(1) ? (a - 1) : (a + 1)); a = (CANARY_MUTANT(2) ? (a + 1) : (a - 1)); }"
+        )
+
+    def test_constant_contexts_are_skipped(self) -> None:
+        tree = self._parser.parse("int g = 1 + 2; void f(int a) { switch (a) { case 1 + 2: break; } }")
+        schemata = MutantSchemata(self._parser, tree)
+
+        for plus in self.operators(tree, "+"):
+            self.assertIsNone(
+                schemata.add(ReplacementMutation(self._parser, tree, plus, "-"))
+            )
+        self.assertEqual(schemata.mutant_count, 0)
+        self.assertEqual(schemata.apply().text, tree.text)
+
+    def test_lvalues_are_skipped(self) -> None:
+        tree = self._parser.parse("void f(int a) { a++; }")
+        schemata = MutantSchemata(self._parser, tree)
+        increment = self.operators(tree, "++")[0]
+
+        # The update expression itself is the site, not its operand
+        self.assertEqual(
+            schemata.add(ReplacementMutation(self._parser, tree, increment, "--")), 1
+        )
+        self.assertEqual(
+            schemata.apply().text,
+            "void f(int a) { (CANARY_MUTANT(1) ? (a--) : (a++)); }"
+        )
+
+    def test_weak_site(self) -> None:
+        tree = self._parser.parse("int f(int a, int b) { return a + b; }")
+        schemata = MutantSchemata(self._parser, tree, weak=True)
+        plus = self.operators(tree, "+")[0]
+
+        schemata.add(ReplacementMutation(self._parser, tree, plus, "-"))
+        schemata.add(ReplacementMutation(self._parser, tree, plus, "*"))
+
+        result = schemata.apply()
+        self.assertEqual(
+            result.text,
+            "int f(int a, int b) { return (CANARY_INFECTION(1, (a - b), (a + b)), " +
+            "CANARY_INFECTION(2, (a * b), (a + b)), (a + b)); }"
+        )
+        self.assertFalse(result.root.has_error)
+
+    def test_weak_impure_sites_are_skipped(self) -> None:
+        tree = self._parser.parse("int f(int a, int *p) { a++; return g(a) + 1 + p[0] + a; }")
+        schemata = MutantSchemata(self._parser, tree, weak=True)
+        increment = self.operators(tree, "++")[0]
+        pluses = self.operators(tree, "+")
+
+        self.assertIsNone(schemata.add(ReplacementMutation(self._parser, tree, increment, "--")))
+        # The innermost sum calls g, the outer sums read through p
+        for plus in pluses:
+            self.assertIsNone(schemata.add(ReplacementMutation(self._parser, tree, plus, "-")))
+        self.assertEqual(schemata.mutant_count, 0)
+
+    def test_weak_impure_replacements_are_skipped(self) -> None:
+        tree = self._parser.parse("int f(int a, int b) { return a + b; }")
+        schemata = MutantSchemata(self._parser, tree, weak=True)
+        plus = self.operators(tree, "+")[0]
+
+        self.assertIsNone(schemata.add(ReplacementMutation(self._parser, tree, plus, "/")))
+        self.assertIsNone(schemata.add(ReplacementMutation(self._parser, tree, plus, "%")))
+        self.assertEqual(schemata.add(ReplacementMutation(self._parser, tree, plus, "<=")), 1)
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from .uoi_strategy import UoiStrategy
+from .mutation_strategy_factory import MutationStrategyFactory
 from ts import (
     LanguageLibrary,
     Parser,
@@ -105,4 +106,14 @@ class TestAbsStrategu(TestCase):
             tree, tree.root
         )
 
-        self.assertEqual(mutation.text, "a;")
\ No newline at end of file
+        self.assertEqual(mutation.text, "a;")
+
+    def test_capture_is_precompiled(self) -> None:
+        tree = self._parser.parse("--a; b = !c + 1;")
+        stategy = MutationStrategyFactory().create("uoi abs obom", self._parser)
+        misses = self._language.query_cache.misses
+
+        stategy.capture(tree.root)
+
+        self.assertEqual(len(stategy.queries()), 3)
+        self.assertEqual(self._language.query_cache.misses, misses)
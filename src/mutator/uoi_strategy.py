@@ -1,5 +1,5 @@
 from random import choice
-from typing import List
+from typing import Dict, List
 from ts import Tree, Node, CNodeType, NodeType, CSyntax, Parser
 from .mutation_strategy import MutationStrategy
 from .mutation import Mutation, ReplacementMutation, WrappedMutation
@@ -10,22 +10,25 @@ class UoiStrategy(MutationStrategy):
         self._language = parser.language
         self._syntax = CSyntax()
 
-    def capture(self, node: Node) -> List[Node]:
-        query_capture = self._language.query(
+    def queries(self) -> List[str]:
+        return [
             self._syntax.update_expression_query + \
             self._syntax.unary_expression_query
-        ).captures(node)
+        ]
+
+    def capture(self, node: Node) -> List[Node]:
+        query_capture = self._language.query(self.queries()[0]).captures(node)
         
         nodes: List[Node] = query_capture.nodes()
-        result: List[Node] = list()
+        result: Dict[Node, None] = dict()
         for node in nodes:
             if node.is_type(CNodeType.UNARY_EXPRESSION) and \
                 node.children[0].is_either_type(self._syntax.arithmetic_unary_operators) or \
                 node.children[0].is_either_type(self._syntax.logical_unary_operators):
-                if node not in result: result.append(node.children[0])
+                result[node.children[0]] = None
             if node.is_type(CNodeType.UPDATE_EXPRESSION):
-                if node not in result: result.append(node.children[0])
-        return result
+                result[node.children[0]] = None
+        return list(result)
 
     def mutate(
         self,
@@ -1,6 +1,7 @@
 from .cutest_results_parser import *
 from .ffs_gnu_assert_results_parser import *
 from .parser_cutest import *
+from .results_stream import *
 from .resutls_parser import *
 from .test_results import *
 from .test_summary import *
@@ -1,79 +1,138 @@
 import re
-from typing import List
+from typing import Dict, List
 from instrumentation_trace import (
     TraceParser,
     TraceTreeBuilder
 )
 from .test_summary import TestSummary
 from .test_results import TestResults
+from .results_stream import ResultsStream
 from .resutls_parser import ResultsParser
 
-class CuTestResultsParser(ResultsParser):
-    def __init__(self) -> None:
+class CuTestResultsStream(ResultsStream):
+    # The summary is recognised by its first line and the two lines after it
+    WINDOW_SIZE: int = 3
+    # A failure detailed after the summary, such as "1) addTest: AllTests.c:15: ..."
+    FAILURE_PATTERN: str = "[0-9]+\\) ([^:]+): "
+
+    def __init__(self, max_trace_length: int = None) -> None:
         self._trace_parser = TraceParser(
-            TraceTreeBuilder()
+            TraceTreeBuilder(max_trace_length)
+        )
+        self._window: List[str] = list()
+        self._test_results: TestResults = None
+        self._failed_tests: List[str] = list()
+        self._killed: str = None
+        super().__init__()
+
+    def feed(self, line: str) -> None:
+        # The tests were ended after the first failed test, without a summary
+        if self._test_results is None and line.startswith(ResultsParser.KILL_MARKER):
+            self._killed = line[len(ResultsParser.KILL_MARKER):]
+            return
+        # The output after the summary only details the failures
+        if self._test_results is not None:
+            failure = re.match(CuTestResultsStream.FAILURE_PATTERN, line)
+            if failure is not None:
+                self._failed_tests.append(failure.group(1))
+            return
+        self._window.append(line)
+        if len(self._window) == CuTestResultsStream.WINDOW_SIZE:
+            self._test_results = self._parse_line(self._window)
+            self._window.pop(0)
+
+    def finish(self) -> TestResults:
+        # The last lines are not followed by enough lines to begin a summary
+        while self._test_results is None and len(self._window) > 0:
+            self._test_results = self._parse_line(self._window)
+            self._window.pop(0)
+        if self._test_results is None and self._killed is not None:
+            # The amount of tests which ran before the failed test is not reported
+            return TestResults(
+                TestSummary(None, 1, None),
+                self._trace_parser.finish(),
+                [ self._killed ],
+            )
+        if self._test_results is None: return None
+        return TestResults(
+            self._test_results.summary,
+            self._test_results.trace,
+            self._failed_tests,
         )
 
-    def parse(self, lines: List[str]) -> TestResults:
-        for idx, line in enumerate(lines):
-            if self._trace_parser.parse([ line ]):
-                continue
+    def _parse_line(self, lines: List[str]) -> TestResults:
+        line = lines[0]
+        if self._trace_parser.parse([ line ]):
+            return None
+
+        # Check if it is the beginning of the summary
+        # Case 1: Only passes (First line is only "...")
+        # Example:
+        #   "..",
+        #   "",
+        #   "OK (2 tests)"
+        if len(lines) == CuTestResultsStream.WINDOW_SIZE and \
+            all("." == c for c in line) and \
+            lines[1] == "" and \
+            re.search("OK \([0-9]+ tests\)", lines[2]):
+            # Since the line only consists of "." the
+            #   length of it is the amount of successes.
+            success_count = len(line)
+            summary = TestSummary(
+                success_count, 0, success_count
+            )
+            return TestResults(
+                summary,
+                self._trace_parser.finish()
+            )
+        # Case 2: Has failures (First line is only "F")
+        # Example:
+        #   "FF"
+        #   ""
+        #   "There were 2 failures:"
+        #   "1) addTest: /input/tests/AllTests.c:15: expected <1> but was <-1>"
+        #   "2) addTest_1_1: /input/tests/AllTests.c:25: expected <12> but was <-6>"
+        #   ""
+        #   "!!!FAILURES!!!"
+        #   "Runs: 2 Passes: 0 Fails: 2"
+        # Example:
+        #   ".F"
+        #   ""
+        #   "There was 1 failure:"
+        #   "1) addTest_1_1: /input/tests/AllTests.c:25: expected <12> but was <-6>"
+        #   ""
+        #   "!!!FAILURES!!!"
+        #   "Runs: 2 Passes: 1 Fails: 1"
+        elif len(lines) == CuTestResultsStream.WINDOW_SIZE and \
+            all("." == c or "F" == c for c in line) and \
+            lines[1] == "" and \
+            (re.search("There was 1 failure:", lines[2]) or \
+            re.search("There were [0-9]+ failures:", lines[2])):
+            sucess_count = line.count(".")
+            failure_count = line.count("F")
+            summary = TestSummary(
+                sucess_count + failure_count, failure_count, sucess_count
+            )
+            return TestResults(
+                summary,
+                self._trace_parser.finish()
+            )
+        # Case 3: No tests
+        elif line == "OK (0 tests)":
+            return TestResults(
+                TestSummary(0, 0, 0),
+                self._trace_parser.finish()
+            )
+        return None
+
+class CuTestResultsParser(ResultsParser):
+    def __init__(self) -> None:
+        pass
+
+    def stream(self, max_trace_length: int = None) -> ResultsStream:
+        return CuTestResultsStream(max_trace_length)
 
-            # Check if it is the beginning of the summary
-            # Case 1: Only passes (First line is only "...")
-            # Example:
-            #   "..",
-            #   "",
-            #   "OK (2 tests)"
-            if idx + 2 < len(lines) and \
-                all("." == c for c in line) and \
-                lines[idx + 1] == "" and \
-                re.search("OK \([0-9]+ tests\)", lines[idx + 2]):
-                # Since the line only consists of "." the
-                #   length of it is the amount of successes.
-                success_count = len(line)
-                summary = TestSummary(
-                    success_count, 0, success_count
-                )
-                return TestResults(
-                    summary,
-                    self._trace_parser.finish()
-                )
-            # Case 2: Has failures (First line is only "F")
-            # Example:
-            #   "FF"
-            #   ""
-            #   "There were 2 failures:"
-            #   "1) addTest: /input/tests/AllTests.c:15: expected <1> but was <-1>"
-            #   "2) addTest_1_1: /input/tests/AllTests.c:25: expected <12> but was <-6>"
-            #   ""
-            #   "!!!FAILURES!!!"
-            #   "Runs: 2 Passes: 0 Fails: 2"
-            # Example:
-            #   ".F"
-            #   ""
-            #   "There was 1 failure:"
-            #   "1) addTest_1_1: /input/tests/AllTests.c:25: expected <12> but was <-6>"
-            #   ""
-            #   "!!!FAILURES!!!"
-            #   "Runs: 2 Passes: 1 Fails: 1"
-            elif idx + 2 < len(lines) and \
-                all("." == c or "F" == c for c in line) and \
-                lines[idx + 1] == "" and \
-                (re.search("There was 1 failure:", lines[idx + 2]) or \
-                re.search("There were [0-9]+ failures:", lines[idx + 2])):
-                sucess_count = line.count(".")
-                failure_count = line.count("F")
-                summary = TestSummary(
-                    sucess_count + failure_count, failure_count, sucess_count
-                )
-                return TestResults(
-                    summary,
-                    self._trace_parser.finish()
-                )
-            # Case 3: No tests
-            elif line == "OK (0 tests)":
-                return TestResults(
-                    TestSummary(0, 0, 0),
-                    self._trace_parser.finish()
-                )
+    def early_abort(self) -> Dict[str, str]:
+        # The summary is printed after all of the tests ran, CanarySuiteRun
+        #   reports the first failed test instead
+        return { "CANARY_EARLY_ABORT": "1" }
@@ -1,35 +1,69 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 from instrumentation_trace import (
     TraceParser,
     TraceTreeBuilder
 )
 from .test_summary import TestSummary
 from .test_results import TestResults
+from .results_stream import ResultsStream
 from .resutls_parser import ResultsParser
 
-class FfsGnuAssertResultsParser(ResultsParser):
-    def __init__(self) -> None:
-        pass
-
-    def parse(self, lines: List[str]) -> TestResults:
-        trace_parser = TraceParser(
-            TraceTreeBuilder()
+class FfsGnuAssertResultsStream(ResultsStream):
+    def __init__(self, parser: "FfsGnuAssertResultsParser", max_trace_length: int = None) -> None:
+        self._parser = parser
+        self._trace_parser = TraceParser(
+            TraceTreeBuilder(max_trace_length)
         )
-        found_assertion = False
-        for line in lines:
-            if "Found: [" in line:
-                found_assertion = True
-            elif "Assertion" in line and \
-                line.endswith("failed."):
-                found_assertion = True
-            elif trace_parser.parse([ line ]):
-                continue
+        self._found_assertion = False
+        self._failed_tests: List[str] = list()
+        super().__init__()
+
+    def feed(self, line: str) -> None:
+        if self._parser.is_kill(line):
+            self._found_assertion = True
+            failed_test = self._parser.failed_test(line)
+            # Failures of other formats are attributed to the test which began last
+            if failed_test is None and self._trace_parser.builder.current_test is not None:
+                failed_test = self._trace_parser.builder.current_test.name
+            if failed_test is not None and failed_test not in self._failed_tests:
+                self._failed_tests.append(failed_test)
+        else: self._trace_parser.parse([ line ])
+
+    def finish(self) -> TestResults:
         return TestResults(
             TestSummary(
                 None,
-                1 if found_assertion else 0,
+                1 if self._found_assertion else 0,
                 None
             ),
-            trace_parser.finish()
-        )
\ No newline at end of file
+            self._trace_parser.finish(),
+            self._failed_tests,
+        )
+
+class FfsGnuAssertResultsParser(ResultsParser):
+    def __init__(self) -> None:
+        pass
+
+    def stream(self, max_trace_length: int = None) -> ResultsStream:
+        return FfsGnuAssertResultsStream(self, max_trace_length)
+
+    def early_abort(self) -> Dict[str, str]:
+        # A failed assertion is reported as soon as it fails
+        return dict()
+
+    def is_kill(self, line: str) -> bool:
+        return "Found: [" in line or \
+            ("Assertion" in line and line.endswith("failed."))
+
+    def failed_test(self, line: str) -> str:
+        """The function of a failed assertion, as reported by
+            "<program>: <file>:<line>: <function>: Assertion `<expression>' failed."
+        """
+        match = re.search(r": [^:]*:[0-9]+: ([A-Za-z_][A-Za-z0-9_]*): Assertion", line)
+        return match.group(1) if match is not None else None
+
+    def test_order(self, tests: List[str]) -> Dict[str, str]:
+        # The tests are called by the main of the test program, in its own order
+        return None
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from .test_results import TestResults
+
+class ResultsStream(ABC):
+    """The parsing of the output of a single test run, which is fed a line at a
+        time as the tests produce it, such that the output is never held as a whole
+    """
+    def __init__(self) -> None:
+        super().__init__()
+
+    @abstractmethod
+    def feed(self, line: str) -> None:
+        """Parses the next line of the output
+
+        Args:
+            line (str): A line of the output of the tests, without its newline
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> TestResults:
+        """The results of the output fed so far, after which the stream is done"""
+        pass
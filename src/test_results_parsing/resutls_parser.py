@@ -1,11 +1,78 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, List
 from .test_results import TestResults
+from .results_stream import ResultsStream
 
 class ResultsParser(ABC):
+    # Reported by the test runners of canary, such as CanarySuiteRun, when they
+    #   end the tests after the first failed test
+    KILL_MARKER: str = "Killed="
+
     def __init__(self) -> None:
         super().__init__()
 
     @abstractmethod
-    def parse(self, lines: List[str]) -> TestResults:
-        pass
\ No newline at end of file
+    def stream(self, max_trace_length: int = None) -> ResultsStream:
+        """Starts parsing the output of a test run, a stream per run such that a
+            single results parser can be shared between concurrently tested mutants
+
+        Args:
+            max_trace_length (int, optional): The maximum amount of locations
+                kept in the trace. Defaults to None, meaning unbounded.
+
+        Returns:
+            ResultsStream: The stream which is fed the lines of the output
+        """
+        pass
+
+    def parse(self, lines: Iterable[str], max_trace_length: int = None) -> TestResults:
+        stream = self.stream(max_trace_length)
+        for line in lines:
+            stream.feed(line)
+        return stream.finish()
+
+    def test_filter(self, tests: List[str]) -> Dict[str, str]:
+        """The environment which selects the tests run by the test command, the
+            test names are those reported by CANARY_ACT
+
+        Args:
+            tests (List[str]): The names of the tests to run
+
+        Returns:
+            Dict[str, str]: The environment variables, merged into the environment of the tests
+        """
+        return { "CANARY_TEST_FILTER": " ".join(tests) }
+
+    def test_order(self, tests: List[str]) -> Dict[str, str]:
+        """The environment which orders the tests run by the test command, the
+            test names are those reported by CANARY_ACT
+
+        Args:
+            tests (List[str]): The names of the tests to run first, in the order to run them
+
+        Returns:
+            Dict[str, str]: The environment variables, None if the runner of
+                the backend can not order the tests
+        """
+        return { "CANARY_TEST_ORDER": " ".join(tests) }
+
+    def early_abort(self) -> Dict[str, str]:
+        """The environment which ends the tests after the first failed test
+
+        Returns:
+            Dict[str, str]: The environment variables, None if the runner of
+                the backend can not end the tests early
+        """
+        return None
+
+    def is_kill(self, line: str) -> bool:
+        """Whether a single line of output already proves that a test failed,
+            such that the remaining tests do not have to be run
+
+        Args:
+            line (str): A line of the output of the tests, without its newline
+
+        Returns:
+            bool: True if the line reports a failed test
+        """
+        return line.startswith(ResultsParser.KILL_MARKER)
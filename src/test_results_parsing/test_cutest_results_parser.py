@@ -108,6 +108,7 @@ class TestCuTestResultsParser(TestCase):
         self.assertEqual(summary.test_count, 2)
         self.assertEqual(summary.failure_count, 2)
         self.assertEqual(summary.success_count, 0)
+        self.assertEqual(test_results.failed_tests, [ "addTest", "addTest_1_1" ])
 
     def test_parse_summary_partial_success(self):
         lines = [
@@ -226,3 +227,49 @@ class TestCuTestResultsParser(TestCase):
         self.assertEqual(summary.test_count, 2)
         self.assertEqual(summary.failure_count, 1)
         self.assertEqual(summary.success_count, 1)
+
+    def test_is_kill(self):
+        parser = CuTestResultsParser()
+
+        self.assertTrue(parser.is_kill("Killed=addTest"))
+        self.assertFalse(parser.is_kill("There was 1 failure:"))
+        self.assertFalse(parser.is_kill(".F"))
+        self.assertFalse(parser.is_kill("OK (2 tests)"))
+        self.assertEqual(parser.early_abort(), { "CANARY_EARLY_ABORT": "1" })
+
+    def test_stream_killed(self):
+        parser = CuTestResultsParser()
+        stream = parser.stream()
+        for line in [ "BeginTest=addTest", "Location=0", "EndTest=addTest", "Killed=addTest" ]:
+            stream.feed(line)
+        test_results = stream.finish()
+
+        self.assertEqual(test_results.summary.failure_count, 1)
+        self.assertEqual(test_results.failed_tests, [ "addTest" ])
+        self.assertEqual([ location.id for location in test_results.trace.sequence ], [ "0" ])
+
+    def test_stream_ignores_output_after_summary(self):
+        parser = CuTestResultsParser()
+        stream = parser.stream()
+        for line in [ "Location=0", ".F", "", "There was 1 failure:", "Location=1" ]:
+            stream.feed(line)
+        test_results = stream.finish()
+
+        self.assertEqual(test_results.summary.failure_count, 1)
+        self.assertEqual([ location.id for location in test_results.trace.sequence ], [ "0" ])
+
+    def test_order_of_tests(self):
+        parser = CuTestResultsParser()
+
+        self.assertEqual(
+            parser.test_order([ "addTest_1_1", "addTest" ]),
+            { "CANARY_TEST_ORDER": "addTest_1_1 addTest" }
+        )
+
+    def test_stream_finds_summary_at_end_of_output(self):
+        parser = CuTestResultsParser()
+        stream = parser.stream()
+        stream.feed("OK (0 tests)")
+        test_results = stream.finish()
+
+        self.assertEqual(test_results.summary.test_count, 0)
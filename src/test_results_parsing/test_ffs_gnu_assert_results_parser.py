@@ -58,4 +58,53 @@ class TestFfsGunAssertResultsParser(TestCase):
         location_0 = sequence[1]
         self.assertIsNone(location_0.test)
         self.assertIsNone(location_0.unit)
-        self.assertEqual(location_0.id, "0")
\ No newline at end of file
+        self.assertEqual(location_0.id, "0")
+
+    def test_is_kill(self):
+        parser = FfsGnuAssertResultsParser()
+
+        self.assertTrue(parser.is_kill(
+            "tests: tests/tests.c:154: test_core: Assertion `hydro_equal(a, b, sizeof a)' failed."
+        ))
+        self.assertFalse(parser.is_kill("Location=1"))
+        self.assertFalse(parser.is_kill(""))
+        self.assertEqual(parser.early_abort(), dict())
+
+    def test_parse_failed_test(self):
+        parser = FfsGnuAssertResultsParser()
+        test_results = parser.parse([
+            "BeginTest=test_add",
+            "Location=0",
+            "tests: tests/tests.c:154: test_core: Assertion `hydro_equal(a, b, sizeof a)' failed.",
+        ])
+
+        self.assertEqual(test_results.summary.failure_count, 1)
+        self.assertEqual(test_results.failed_tests, [ "test_core" ])
+
+    def test_parse_failed_test_of_other_format(self):
+        parser = FfsGnuAssertResultsParser()
+        test_results = parser.parse([
+            "BeginTest=test_add",
+            "Found: [1] expected [2]",
+        ])
+
+        self.assertEqual(test_results.failed_tests, [ "test_add" ])
+
+    def test_order_of_tests_is_not_supported(self):
+        parser = FfsGnuAssertResultsParser()
+
+        self.assertIsNone(parser.test_order([ "test_add" ]))
+        self.assertEqual(
+            parser.test_filter([ "test_add", "test_sub" ]),
+            { "CANARY_TEST_FILTER": "test_add test_sub" }
+        )
+
+    def test_parse_bounds_trace_length(self):
+        parser = FfsGnuAssertResultsParser()
+        test_results = parser.parse(
+            [ "Location=0", "Location=1", "Location=2" ],
+            max_trace_length=2
+        )
+
+        self.assertEqual(len(test_results.trace), 2)
+        self.assertTrue(test_results.trace.truncated)
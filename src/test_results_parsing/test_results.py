@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from .test_summary import TestSummary
 from instrumentation_trace import Trace
 
@@ -6,10 +6,12 @@ class TestResults():
     def __init__(
         self,
         summary: TestSummary,
-        trace: Trace = None
+        trace: Trace = None,
+        failed_tests: List[str] = None,
     ) -> None:
         self._summary = summary
         self._trace = trace
+        self._failed_tests = failed_tests
 
     @property
     def summary(self) -> TestSummary:
@@ -18,6 +20,12 @@ class TestResults():
     @property
     def trace(self) -> Trace:
         return self._trace
+
+    @property
+    def failed_tests(self) -> List[str]:
+        """The names of the failed tests in the order they were reported,
+            None if the testing backend does not report them"""
+        return self._failed_tests
     
     @property
     def visitations(self) -> Dict[str, int]:
@@ -4,6 +4,7 @@ from .language_library import *
 from .node import *
 from .parser import *
 from .query import *
+from .query_cache import *
 from .range import *
 from .syntax import *
 from .tree import *
@@ -1,10 +1,15 @@
-from typing import TypeVar, Generic
+from typing import Dict, Iterable, TypeVar, Generic
 from tree_sitter import Language as _Language
 from .query import Query
+from .query_cache import QueryCache
 from .syntax import Syntax
 
 TSyntax = TypeVar("TSyntax", bound=Syntax)
 class Language(Generic[TSyntax]):
+    # Keyed by the id of the native language, as the compiled queries belong to it and
+    #   a Language may still be created outside of the library, which loads one per process
+    _query_caches: Dict[int, QueryCache] = dict()
+
     def __init__(self, syntax: TSyntax, language: _Language) -> None:
         self._language = language
         self._syntax = syntax
@@ -41,4 +46,23 @@ class Language(Generic[TSyntax]):
         Returns:
             Query: A query for the given language
         """
-        return Query(self._language.query(source))
\ No newline at end of file
+        return self.query_cache.get(
+            source, lambda source: Query(self._language.query(source))
+        )
+
+    def precompile(self, sources: Iterable[str]) -> None:
+        """Compiles the queries ahead of their use, such that they are never compiled in a hot loop
+
+        Args:
+            sources (Iterable[str]): The query sources
+        """
+        for source in sources:
+            self.query(source)
+
+    @property
+    def query_cache(self) -> QueryCache:
+        """The compiled queries of the language, keyed by their source"""
+        query_cache = Language._query_caches.get(self.id)
+        if query_cache is None:
+            query_cache = Language._query_caches.setdefault(self.id, QueryCache())
+        return query_cache
\ No newline at end of file
@@ -1,8 +1,15 @@
+import threading
+from typing import Dict
 from tree_sitter import Language as _Language
 from .c_syntax import CSyntax
 from .language import Language
+from .syntax import Syntax
 
 class LanguageLibrary:
+    # Every language is built and loaded at most once per process
+    _languages: Dict[str, Language] = dict()
+    _lock = threading.Lock()
+
     @staticmethod
     def vendor_path() -> str:
         return './vendor'
@@ -19,6 +26,14 @@ class LanguageLibrary:
     def full_build_path() -> str:
         return f'{LanguageLibrary.build_path()}/{LanguageLibrary.build_file()}'
 
+    @staticmethod
+    def language_vendor_path(name: str) -> str:
+        return f'{LanguageLibrary.vendor_path()}/tree-sitter-{name}'
+
+    @staticmethod
+    def language_build_path(name: str) -> str:
+        return f'{LanguageLibrary.build_path()}/tree-sitter-{name}.so'
+
     @staticmethod
     def build() -> None:
         _Language.build_library(
@@ -34,43 +49,65 @@ class LanguageLibrary:
         )
 
     @staticmethod
-    def c() -> Language[CSyntax]:
-        return Language[CSyntax](
-            CSyntax(),
-            _Language(LanguageLibrary.full_build_path(), 'c')
+    def build_language(name: str) -> bool:
+        """Builds the grammar of a single language into its own library, if its vendor
+            sources are newer than the library
+
+        Args:
+            name (str): The name of the language, such as 'c'
+
+        Returns:
+            bool: Whether the library was compiled
+        """
+        return _Language.build_library(
+            LanguageLibrary.language_build_path(name),
+            [ LanguageLibrary.language_vendor_path(name) ]
         )
 
+    @staticmethod
+    def load(name: str, syntax: Syntax = None) -> Language:
+        """Builds the language if it is stale and loads it, both only on the first call
+
+        Args:
+            name (str): The name of the language, such as 'c'
+            syntax (Syntax, optional): The syntax of the language. Defaults to None.
+
+        Returns:
+            Language: The language shared by the whole process
+        """
+        language = LanguageLibrary._languages.get(name)
+        if language is not None: return language
+        with LanguageLibrary._lock:
+            language = LanguageLibrary._languages.get(name)
+            if language is None:
+                LanguageLibrary.build_language(name)
+                language = Language(
+                    syntax,
+                    _Language(LanguageLibrary.language_build_path(name), name)
+                )
+                LanguageLibrary._languages[name] = language
+        return language
+
+    @staticmethod
+    def c() -> Language[CSyntax]:
+        return LanguageLibrary.load('c', CSyntax())
+
     @staticmethod
     def cpp() -> Language:
-        return Language(
-            None,
-            _Language(LanguageLibrary.full_build_path(), 'cpp')
-        )
+        return LanguageLibrary.load('cpp')
 
     @staticmethod
     def go() -> Language:
-        return Language(
-            None,
-            _Language(LanguageLibrary.full_build_path(), 'go')
-        )
+        return LanguageLibrary.load('go')
 
     @staticmethod
     def js() -> Language:
-        return Language(
-            None,
-            _Language(LanguageLibrary.full_build_path(), 'javascript')
-        )
+        return LanguageLibrary.load('javascript')
 
     @staticmethod
     def python() -> Language:
-        return Language(
-            None,
-            _Language(LanguageLibrary.full_build_path(), 'python')
-        )
+        return LanguageLibrary.load('python')
 
     @staticmethod
     def rust() -> Language:
-        return Language(
-            None,
-            _Language(LanguageLibrary.full_build_path(), 'rust')
-        )
\ No newline at end of file
+        return LanguageLibrary.load('rust')
\ No newline at end of file
@@ -6,12 +6,20 @@ from .file_point import FilePoint
 from .syntax import Field, NodeType
 
 class Node:
+    __slots__ = ("_node", "_type", "_start_byte", "_end_byte")
+
     def __init__(self, node: _Node) -> None:
         self._node = node
+        # The native node does not change, such that the fields compared and
+        #   hashed are read from it only once
+        self._type: str = None
+        self._start_byte: int = None
+        self._end_byte: int = None
 
     @property
     def type(self) -> str:
-        return self._node.type
+        if self._type is None: self._type = self._node.type
+        return self._type
 
     @property
     def is_named(self) -> bool:
@@ -36,7 +44,8 @@ class Node:
 
     @property
     def start_byte(self) -> int:
-        return self._node.start_byte
+        if self._start_byte is None: self._start_byte = self._node.start_byte
+        return self._start_byte
 
     @property
     def end_point(self) -> FilePoint:
@@ -45,7 +54,8 @@ class Node:
 
     @property
     def end_byte(self) -> int:
-        return self._node.end_byte
+        if self._end_byte is None: self._end_byte = self._node.end_byte
+        return self._end_byte
 
     @property
     def sexp(self) -> str:
@@ -200,7 +210,7 @@ class Node:
         return None
 
     def __eq__(self, other: "Node") -> bool:
-        if other is None: return False
+        if not isinstance(other, Node): return False
         return self.start_byte == other.start_byte and \
             self.end_byte == other.end_byte and \
             self.type == other.type
@@ -208,6 +218,11 @@ class Node:
     def __ne__(self, other: "Node") -> bool:
         return not (self == other)
 
+    def __hash__(self) -> int:
+        # Nodes are equal across the trees of the same source, as the mutants
+        #   and instrumentation reparse it, such that the tree is not hashed
+        return hash((self.start_byte, self.end_byte, self.type))
+
     def pre_order_traverse(self, named_only: bool = False) -> Iterable["Node"]:
         reached_root: bool = False
         root: Node = self
@@ -3,7 +3,9 @@ from typing import List
 
 from tree_sitter import Parser as _Parser
 
+from .file_point import FilePoint
 from .node import Node
+from .range import Range
 from .tree import Tree
 from .language_library import LanguageLibrary
 from .language_library import Language
@@ -27,24 +29,59 @@ class Parser:
         return parser
 
     def replace(self, tree: Tree, node: Node, new: str, encoding: str = "utf8") -> Tree:
-        source: str = tree.text
-        new_source: str = str(source[0: node.start_byte: 1] +
-                              new +
-                              source[node.end_byte:: 1])
-        return self.parse(new_source, tree, encoding)
+        return self._edit(
+            tree, node.start_byte, node.end_byte, node.start_point, node.end_point, new, encoding
+        )
 
     def wrap(self, tree: Tree, node: Node, prefix: str = "", postfix: str = "", encoding: str = "utf8") -> Tree:
         replacement: str = prefix + tree.contents_of(node) + postfix
         return self.replace(tree, node, replacement, encoding)
 
     def insert(self, tree: Tree, node: Node, text: str, encoding: str = "utf8") -> Tree:
-        replacement: str = text + tree.contents_of(node)
-        return self.replace(tree, node, replacement, encoding)
-
+        return self._edit(
+            tree, node.start_byte, node.start_byte, node.start_point, node.start_point, text, encoding
+        )
 
     def append(self, tree: Tree, node: Node, text: str, encoding: str = "utf8") -> Tree:
-        replacement: str = tree.contents_of(node) + text
-        return self.replace(tree, node, replacement, encoding)
+        return self._edit(
+            tree, node.end_byte, node.end_byte, node.end_point, node.end_point, text, encoding
+        )
+
+    def _edit(
+        self,
+        tree: Tree,
+        start_byte: int,
+        old_end_byte: int,
+        start_point: FilePoint,
+        old_end_point: FilePoint,
+        new: str,
+        encoding: str,
+    ) -> Tree:
+        source: bytes = tree.source
+        new_bytes: bytes = bytes(new, encoding)
+        new_end_byte: int = start_byte + len(new_bytes)
+        new_lines: int = new_bytes.count(b"\n")
+        if new_lines == 0:
+            new_end_point = FilePoint(start_point.line, start_point.char + len(new_bytes))
+        else:
+            new_end_point = FilePoint(
+                start_point.line + new_lines, len(new_bytes) - new_bytes.rindex(b"\n") - 1
+            )
+
+        # Editing a tree moves its nodes, such that the edit is made on a copy which
+        #   shares every subtree of the original and is reparsed at no cost
+        edited: Tree = Tree(self._parser.parse(source, tree._tree))
+        edited.edit(
+            start_byte, old_end_byte, new_end_byte,
+            start_point, old_end_point, new_end_point,
+        )
+
+        # Only the subtrees overlapping the edit are parsed again
+        new_source: bytes = source[:start_byte] + new_bytes + source[old_end_byte:]
+        return Tree(
+            self._parser.parse(new_source, edited._tree),
+            [ Range(start_byte, new_end_byte, start_point, new_end_point) ],
+        )
 
     def insert_line(self, tree: Tree, line_num: int, line: str, encoding: str = "utf8") -> Tree:
         lines: List[str] = tree.lines.copy()
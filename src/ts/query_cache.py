@@ -0,0 +1,40 @@
+from typing import Callable, Dict
+from .query import Query
+
+class QueryCache:
+    """The compiled queries of a single language, keyed by their source"""
+    def __init__(self) -> None:
+        self._queries: Dict[str, Query] = dict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The amount of queries found compiled"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of queries compiled"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __contains__(self, source: str) -> bool:
+        return source in self._queries
+
+    def get(self, source: str, compile: Callable[[str], Query]) -> Query:
+        query = self._queries.get(source)
+        if query is not None:
+            self._hits += 1
+            return query
+        self._misses += 1
+        query = compile(source)
+        self._queries[source] = query
+        return query
+
+    def clear(self) -> None:
+        self._queries.clear()
+        self._hits = 0
+        self._misses = 0
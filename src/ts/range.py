@@ -1,3 +1,38 @@
+from .file_point import FilePoint
+
 class Range:
-    def __init__(self) -> None:
-        pass
\ No newline at end of file
+    def __init__(
+        self,
+        start_byte: int,
+        end_byte: int,
+        start_point: FilePoint,
+        end_point: FilePoint,
+    ) -> None:
+        self._start_byte = start_byte
+        self._end_byte = end_byte
+        self._start_point = start_point
+        self._end_point = end_point
+
+    @property
+    def start_byte(self) -> int:
+        return self._start_byte
+
+    @property
+    def end_byte(self) -> int:
+        return self._end_byte
+
+    @property
+    def start_point(self) -> FilePoint:
+        return self._start_point
+
+    @property
+    def end_point(self) -> FilePoint:
+        return self._end_point
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Range): return False
+        return (self._start_byte, self._end_byte, self._start_point, self._end_point) == \
+            (other._start_byte, other._end_byte, other._start_point, other._end_point)
+
+    def __repr__(self) -> str:
+        return f"Range({self._start_byte}, {self._end_byte}, {tuple(self._start_point)}, {tuple(self._end_point)})"
\ No newline at end of file
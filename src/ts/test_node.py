@@ -38,4 +38,23 @@ class TestNode(unittest.TestCase):
         expected: str = for_stmt
         actual = expression_stmt.get_immediate_descendent_of_types(types)
 
-        self.assertEqual(actual, expected)
\ No newline at end of file
+        self.assertEqual(actual, expected)
+
+    def test_hash_matches_equality(self) -> None:
+        tree: Tree = self._parser.parse("a=1; b=2;")
+        first: Node = tree.root.first_named_child
+        same: Node = tree.root.children[0]
+        reparsed: Node = self._parser.parse("a=1; b=2;").root.first_named_child
+        second: Node = first.next_named_sibling
+
+        self.assertEqual(first, same)
+        self.assertEqual(hash(first), hash(same))
+        self.assertEqual(hash(first), hash(reparsed))
+        self.assertEqual(len({ first, same, reparsed, second }), 2)
+        self.assertIn(reparsed, { first: "a" })
+        self.assertNotEqual(first, None)
+
+    def test_slotted(self) -> None:
+        node: Node = self._parser.parse("a=1;").root
+        with self.assertRaises(AttributeError):
+            node.location = "0"
@@ -65,3 +65,32 @@ class TestParser(unittest.TestCase):
         self.assertEqual(len(lines), 2)
         self.assertEqual(lines[0], "a=2;")
         self.assertEqual(lines[1], "b=1;")
+
+    def test_replace_changed_ranges(self) -> None:
+        tree: Tree = self._parser.parse("a=2;\nb=3;")
+        node_3: Node = tree.root.children[1].children[0].children[2]
+        new_tree: Tree = self._parser.replace(tree, node_3, "4\n+5")
+        self.assertIsNone(tree.changed_ranges)
+        self.assertEqual(
+            new_tree.changed_ranges,
+            [ Range(7, 11, FilePoint(1, 2), FilePoint(2, 2)) ]
+        )
+
+    def test_replace_keeps_original(self) -> None:
+        tree: Tree = self._parser.parse("a=2;\nb=3;")
+        node_a: Node = tree.root.children[0].children[0].children[0]
+        self._parser.replace(tree, node_a, "abc")
+        node_3: Node = tree.root.children[1].children[0].children[2]
+        self.assertEqual(tree.text, "a=2;\nb=3;")
+        self.assertEqual((node_3.start_byte, node_3.start_point), (7, FilePoint(1, 2)))
+
+    def test_edits_equal_full_parse(self) -> None:
+        tree: Tree = self._parser.parse("int f(int x) {\n  return x + 1;\n}\n")
+        body: Node = tree.root.children[0].children[2]
+        new_tree: Tree = self._parser.insert(tree, body.children[1], "x = x * 2;\n  ")
+        new_tree = self._parser.append(new_tree, new_tree.root.children[0], "\nint g;")
+        self.assertEqual(
+            new_tree.root.sexp,
+            self._parser.parse(new_tree.text).root.sexp
+        )
+        self.assertEqual(new_tree.text, "int f(int x) {\n  x = x * 2;\n  return x + 1;\n}\nint g;\n")
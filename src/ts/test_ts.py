@@ -40,6 +40,19 @@ class TestLanguageLibrary(unittest.TestCase):
         self.assertIsInstance(js, Language)
         self.assertIsInstance(js._language, _Language)
 
+    def test_language_build_path(self) -> None:
+        self.assertEqual(LanguageLibrary.language_build_path('c'), './build/tree-sitter-c.so')
+        self.assertEqual(LanguageLibrary.language_vendor_path('c'), './vendor/tree-sitter-c')
+
+    def test_load_once(self) -> None:
+        c = LanguageLibrary.c()
+        self.assertIs(LanguageLibrary.c(), c)
+        self.assertIsInstance(c.syntax, CSyntax)
+        self.assertEqual(c.name, 'c')
+        self.assertTrue(path.exists(LanguageLibrary.language_build_path('c')))
+        # The library is newer than the vendor sources, such that it is not rebuilt
+        self.assertFalse(LanguageLibrary.build_language('c'))
+
 
 class TestLanguage(unittest.TestCase):
     _js_language: Language = None
@@ -77,6 +90,24 @@ class TestLanguage(unittest.TestCase):
         self.assertIsInstance(query, Query)
         self.assertIsInstance(query._query, _Query)
 
+    def test_query_is_cached(self) -> None:
+        source = '(binary_expression (number) @left (number))'
+        query_cache = self._js_language.query_cache
+        misses, hits = query_cache.misses, query_cache.hits
+        query = self._js_language.query(source)
+        self.assertIs(LanguageLibrary.js().query(source), query)
+        self.assertEqual(query_cache.misses, misses + 1)
+        self.assertEqual(query_cache.hits, hits + 1)
+        self.assertIsNot(LanguageLibrary.c().query_cache, query_cache)
+
+    def test_precompile(self) -> None:
+        source = '(binary_expression (number) (number) @right)'
+        self._js_language.precompile([ source ])
+        self.assertIn(source, self._js_language.query_cache)
+        misses = self._js_language.query_cache.misses
+        self._js_language.query(source)
+        self.assertEqual(self._js_language.query_cache.misses, misses)
+
 
 class TestNode(unittest.TestCase):
     def setUp(self) -> None:
@@ -133,6 +164,25 @@ class TestTree(unittest.TestCase):
         root: Node = tree.root
         self.assertIsInstance(root, Node)
 
+    def test_contents_of_non_ascii(self) -> None:
+        tree: Tree = self._parser.parse("let s = \"ø\"; a = b + 1;")
+        expression: Node = tree.root.children[1].children[0]
+        self.assertEqual(tree.contents_of(expression), "a = b + 1")
+        self.assertEqual(tree.contents_between(8, 12), "\"ø\"")
+
+    def test_line_offsets(self) -> None:
+        tree: Tree = self._parser.parse("a = 1;\n\n/* ø */ b = 2;\n")
+        self.assertEqual(tree.line_offsets, [ 0, 7, 8, 24 ])
+        self.assertEqual(tree.point_of(0), FilePoint(0, 0))
+        self.assertEqual(tree.point_of(7), FilePoint(1, 0))
+        self.assertEqual(tree.point_of(17), FilePoint(2, 9))
+        self.assertEqual(tree.point_of(17), tree.root.children[2].start_point)
+
+    def test_lines_are_copied(self) -> None:
+        tree: Tree = self._parser.parse("a = 1;\nb = 2;")
+        tree.lines.append("c = 3;")
+        self.assertEqual(tree.lines, [ "a = 1;", "b = 2;" ])
+
 
 class TestParser(unittest.TestCase):
     def setUp(self) -> None:
@@ -1,26 +1,65 @@
+from bisect import bisect_right
 from typing import Iterable, List
 from tree_sitter import Tree as _Tree
 
 from .node import Node
 from .tree_cursor import TreeCursor
 from .file_point import FilePoint
+from .range import Range
 
 
 class Tree:
-    def __init__(self, tree: _Tree) -> None:
+    def __init__(self, tree: _Tree, changed_ranges: List[Range] = None) -> None:
         self._tree = tree
+        self._changed_ranges = changed_ranges
+        # The source is held once, its text, lines and line offsets are derived on demand
+        self._source: bytes = tree.text
+        self._view = memoryview(self._source)
+        self._text: str = None
+        self._lines: List[str] = None
+        self._line_offsets: List[int] = None
 
     @property
     def root(self) -> Node:
         return Node(self._tree.root_node)
 
+    @property
+    def source(self) -> bytes:
+        """The encoded source, which the byte offsets of the nodes index"""
+        return self._source
+
     @property
     def text(self) -> str:
-        return self._tree.text.decode("utf-8")
+        if self._text is None: self._text = self._source.decode("utf-8")
+        return self._text
+
+    @property
+    def changed_ranges(self) -> List[Range]:
+        """The ranges of the text which differ from the tree this tree was edited from,
+            None if it was not edited from one"""
+        return self._changed_ranges
 
     @property
     def lines(self) -> List[str]:
-        return self.text.splitlines()
+        if self._lines is None: self._lines = self.text.splitlines()
+        return list(self._lines)
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """The byte offset at which each line of the source starts"""
+        if self._line_offsets is None:
+            offsets: List[int] = [ 0 ]
+            offset = self._source.find(b"\n")
+            while offset != -1:
+                offsets.append(offset + 1)
+                offset = self._source.find(b"\n", offset + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def point_of(self, byte: int) -> FilePoint:
+        """The line and byte column of a byte offset into the source"""
+        line = bisect_right(self.line_offsets, byte) - 1
+        return FilePoint(line, byte - self.line_offsets[line])
 
     def edit(
             self,
@@ -41,12 +80,15 @@ class Tree:
         )
 
     def contents_of(self, node: Node) -> str:
-        return str(self.text[node.start_byte: node.end_byte: 1])
+        return self.contents_between(node.start_byte, node.end_byte)
+
+    def contents_between(self, start_byte: int, end_byte: int) -> str:
+        return str(self._view[start_byte: end_byte], "utf-8")
 
     def walk(self) -> TreeCursor:
         return TreeCursor(self._tree.walk())
 
     def line_traverse(self) -> Iterable[str]:
-        lines: List[str] = self.lines
-        for line in lines:
+        if self._lines is None: self._lines = self.text.splitlines()
+        for line in self._lines:
             yield line
@@ -1 +1,2 @@
-from .setupCommandLine import *
\ No newline at end of file
+from .setupCommandLine import *
+from .score_interval import *
\ No newline at end of file
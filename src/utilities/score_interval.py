@@ -0,0 +1,36 @@
+import math
+from statistics import NormalDist
+from typing import Tuple
+
+def wilson_interval(
+    successes: int,
+    trials: int,
+    confidence: float = 0.95,
+    population: int = None,
+) -> Tuple[float, float]:
+    """The Wilson score interval of a proportion, such as the mutation score of a
+        sample of the mutants
+
+    Args:
+        successes (int): The amount of trials which succeeded, such as the mutants killed
+        trials (int): The amount of trials
+        confidence (float, optional): The confidence level of the interval. Defaults to 0.95.
+        population (int, optional): The size of the population the trials are drawn from
+            without replacement, the interval narrows to the proportion itself as the
+            sample approaches it. Defaults to None, an unbounded population.
+
+    Returns:
+        Tuple[float, float]: The lower and upper bound, (0.0, 1.0) without trials
+    """
+    if trials == 0: return (0.0, 1.0)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    if population is not None and population > 1:
+        z *= math.sqrt(max(0, population - trials) / (population - 1))
+
+    proportion = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (proportion + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(
+        proportion * (1 - proportion) / trials + z * z / (4 * trials * trials)
+    ) / denominator
+    return (max(0.0, centre - margin), min(1.0, centre + margin))
@@ -11,7 +11,7 @@ def setupCommandLine() -> ArgumentParser:
         type=str,
         help="The action to do",
         default="generate",
-        choices=["tests", "cfg", "mutate", "instrument"]
+        choices=["tests", "cfg", "mutate", "instrument", "worker"]
     )
     parser.add_argument(
         "-f", "--file",
@@ -58,9 +58,9 @@ def setupCommandLine() -> ArgumentParser:
     parser.add_argument(
         "-ps", "--placement_strategy",
         type=str,
-        help="The mutation placement strategy",
+        help="The mutation placement strategy, splitstream places the mutants as pathbased and runs the tests unmutated until they reach the location of the mutants, where they fork for every mutant, sampling tests a sample of the mutants until their mutation score is estimated to within --sample_margin",
         default="randomly",
-        choices=["randomly", "pathbased"]
+        choices=["randomly", "pathbased", "splitstream", "sampling"]
     )
     parser.add_argument(
         "-ms", "--mutation_strategy",
@@ -80,6 +80,169 @@ def setupCommandLine() -> ArgumentParser:
         help="A space sperated list of units to blacklist",
         default=""
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="The amount of mutants to build and test in parallel, each in a sandbox copy of the base directory",
+        default=1
+    )
+    parser.add_argument(
+        "-s", "--schemata",
+        action="store_true",
+        help="Build all mutants of a unit once as a mutant schemata, selecting the mutant at runtime"
+    )
+    parser.add_argument(
+        "-fs", "--fork_server",
+        action="store_true",
+        help="Fork the mutants of a mutant schemata from a single test process, requires --schemata"
+    )
+    parser.add_argument(
+        "-oc", "--object_cache",
+        type=str,
+        help="The directory caching the compiled objects of the builds, the build must compile through $(CC)",
+        default=None
+    )
+    parser.add_argument(
+        "-ocs", "--object_cache_size",
+        type=int,
+        help="The maximum size of the object cache in megabytes",
+        default=1024
+    )
+    parser.add_argument(
+        "-ea", "--early_abort",
+        action="store_true",
+        help="Kill the tests of a mutant as soon as the testing backend reports a failure, truncating its trace"
+    )
+    parser.add_argument(
+        "-tm", "--timeout_multiplier",
+        type=float,
+        help="The timeouts of building and testing a mutant as a multiple of the durations of the original program",
+        default=3.0
+    )
+    parser.add_argument(
+        "-tf", "--timeout_floor",
+        type=float,
+        help="The least amount of seconds a mutant is given to build or test",
+        default=1.0
+    )
+    parser.add_argument(
+        "-bt", "--baseline_timeout",
+        type=float,
+        help="The amount of seconds the original program is given to build or test",
+        default=300.0
+    )
+    parser.add_argument(
+        "-mtl", "--max_trace_length",
+        type=int,
+        help="The maximum amount of locations kept of the trace of a mutant",
+        default=1000000
+    )
+    parser.add_argument(
+        "-kto", "--keep_test_output",
+        action="store_true",
+        help="Write the test output of every mutant to the output directory for debugging, instead of only parsing it"
+    )
+    parser.add_argument(
+        "-tce", "--tce",
+        action="store_true",
+        help="Skip the mutants compiling to the same object as the original program, and reuse the results of mutants compiling to the same object as another mutant"
+    )
+    parser.add_argument(
+        "-tcef", "--tce_flags",
+        type=str,
+        help="The compiler flags of the project, with which the mutated file is compiled for --tce",
+        default="-O2"
+    )
+    parser.add_argument(
+        "-rc", "--result_cache",
+        type=str,
+        help="The database storing the results of the mutants, such that the mutants of unchanged units are not tested again",
+        default=None
+    )
+    parser.add_argument(
+        "-r", "--resume",
+        action="store_true",
+        help="Resume an interrupted analysis from its journal, restoring the original source and skipping the mutants which were already tested"
+    )
+    parser.add_argument(
+        "-ts", "--test_selection",
+        action="store_true",
+        help="Only test a mutant by the tests whose trace of the original program visits its location, and skip the mutants no test reaches"
+    )
+    parser.add_argument(
+        "-p", "--prioritise",
+        action="store_true",
+        help="Run the tests of a mutant which killed the earlier mutants of the same location, operator and unit first"
+    )
+    parser.add_argument(
+        "-w", "--workspace",
+        type=str,
+        help="A RAM-backed directory, such as /dev/shm, in which a copy of the project is mutated, built and tested, only the reports are synced back to the output directory",
+        default=None
+    )
+    parser.add_argument(
+        "-c", "--coordinator",
+        type=str,
+        help="The address, \"host:port\" or \"unix:path\", on which mutate serves the mutants to the workers, and from which a worker pulls them",
+        default=None
+    )
+    parser.add_argument(
+        "-lt", "--lease_timeout",
+        type=float,
+        help="The amount of seconds a worker has to build and test a mutant, after which it is considered lost and the mutant is served again",
+        default=600.0
+    )
+    parser.add_argument(
+        "-ct", "--connect_timeout",
+        type=float,
+        help="The amount of seconds a worker keeps trying to reach the coordinator",
+        default=60.0
+    )
+    parser.add_argument(
+        "-asp", "--async_subprocesses",
+        type=int,
+        help="Run the builds and tests on an asyncio event loop, with at most this amount of them at once",
+        default=None
+    )
+    parser.add_argument(
+        "-wm", "--weak_mutation",
+        action="store_true",
+        help="Evaluate the mutants next to the original expressions in a single build and test run first, the mutants which never change the value of their expression are classified as not infected without being built"
+    )
+    parser.add_argument(
+        "-sm", "--sample_margin",
+        type=float,
+        help="The half width of the confidence interval of the mutation score at which --placement_strategy=sampling stops",
+        default=0.02
+    )
+    parser.add_argument(
+        "-sc", "--sample_confidence",
+        type=float,
+        help="The confidence level of the interval of the sampled mutation score",
+        default=0.95
+    )
+    parser.add_argument(
+        "-sb", "--sample_budget",
+        type=int,
+        help="The maximum amount of mutants of a unit tested by --placement_strategy=sampling",
+        default=None
+    )
+    parser.add_argument(
+        "-su", "--sample_uniform",
+        action="store_true",
+        help="Draw the sampled mutants uniformly, instead of from every location in proportion to its amount of mutants"
+    )
+    parser.add_argument(
+        "-ss", "--sample_seed",
+        type=int,
+        help="The seed of the sampling, such that the same mutants are drawn again",
+        default=None
+    )
+    parser.add_argument(
+        "-pl", "--pipeline",
+        action="store_true",
+        help="Build the next mutant in a second sandbox while the current mutant is tested, when the mutants are not tested in parallel by --jobs"
+    )
     return parser
 
 def setupIOHandler(commandLineParser: ArgumentParser):
@@ -0,0 +1,29 @@
+import unittest
+
+from .score_interval import wilson_interval
+
+class TestScoreInterval(unittest.TestCase):
+    def test_without_trials(self) -> None:
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+
+    def test_contains_proportion(self) -> None:
+        lower, upper = wilson_interval(80, 100)
+        self.assertAlmostEqual(lower, 0.7112, places=3)
+        self.assertAlmostEqual(upper, 0.8666, places=3)
+
+    def test_bounded_at_extremes(self) -> None:
+        lower, upper = wilson_interval(10, 10)
+        self.assertGreater(lower, 0.0)
+        self.assertEqual(upper, 1.0)
+        self.assertAlmostEqual(wilson_interval(0, 10)[0], 0.0)
+
+    def test_narrows_with_confidence(self) -> None:
+        lower_95, upper_95 = wilson_interval(40, 50, 0.95)
+        lower_99, upper_99 = wilson_interval(40, 50, 0.99)
+        self.assertLess(upper_95 - lower_95, upper_99 - lower_99)
+
+    def test_whole_population_is_exact(self) -> None:
+        self.assertEqual(wilson_interval(30, 40, population=40), (0.75, 0.75))
+        lower, upper = wilson_interval(30, 40, population=80)
+        unbounded_lower, unbounded_upper = wilson_interval(30, 40)
+        self.assertLess(upper - lower, unbounded_upper - unbounded_lower)